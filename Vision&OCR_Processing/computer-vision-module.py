@@ -3,10 +3,1971 @@ import cv2
 import numpy as np
 import os
 import time
+import json
+import pickle
 import logging
+import threading
+import queue
+import itertools
+import contextlib
+import multiprocessing
+from multiprocessing import shared_memory
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import deque, OrderedDict
 from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 
+class FrameRingBuffer:
+    """Ringpuffer fester Größe mit vorallokierten Frames und "Latest Frame"-Semantik.
+    
+    Der Schreiber (Capture-Thread) überschreibt reihum die vorallokierten Slots,
+    der Leser erhält immer nur den neuesten Frame. Frames, die überschrieben
+    werden, bevor sie gelesen wurden, zählen als verworfen. Ein gerade gelesener
+    Slot wird gesperrt, damit ihn der Schreiber nicht währenddessen überschreibt.
+    """
+    
+    def __init__(self, capacity: int = 3):
+        """Initialisiert den Ringpuffer.
+        
+        Args:
+            capacity: Anzahl der Frame-Slots (mindestens 3: neuester Frame,
+                gesperrter Lese-Slot und ein freier Schreib-Slot)
+        """
+        if capacity < 3:
+            raise ValueError(f"Ringpuffer benötigt mindestens 3 Slots, erhalten: {capacity}")
+        
+        self.capacity = capacity
+        self._slots: List[Optional[np.ndarray]] = [None] * capacity
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._condition = threading.Condition()
+        self._write_index = 0
+        self._latest_index = -1
+        self._pinned_index = -1
+        self._sequence = 0
+        self._read_sequence = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+    
+    def writable_slot(self) -> Optional[np.ndarray]:
+        """Liefert den nächsten beschreibbaren Slot (None, solange noch nicht allokiert)."""
+        with self._condition:
+            index = self._next_write_index()
+            self._write_index = index
+            return self._slots[index]
+    
+    def _next_write_index(self) -> int:
+        """Bestimmt den nächsten Slot, der weder der neueste noch gesperrt ist.
+        
+        Bei mindestens 3 Slots gibt es immer einen solchen Slot.
+        """
+        index = self._write_index
+        while index == self._latest_index or index == self._pinned_index:
+            index = (index + 1) % self.capacity
+        return index
+    
+    def commit(self, frame: np.ndarray, timestamp_ns: int = None):
+        """Veröffentlicht einen Frame als neuesten Frame.
+        
+        Wurde der Frame direkt in den Slot aus writable_slot() geschrieben,
+        entfällt jede Kopie; andernfalls wird er in den Slot kopiert.
+        
+        Args:
+            frame: Erfasster Frame
+            timestamp_ns: Monotoner Erfassungszeitpunkt in Nanosekunden
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        
+        with self._condition:
+            # Der Slot aus writable_slot() bleibt frei; ohne ihn nicht den gesperrten Slot treffen
+            index = self._next_write_index()
+            self._write_index = index
+        slot = self._slots[index]
+        
+        if slot is None or slot.shape != frame.shape or slot.dtype != frame.dtype:
+            # Erste Allokation oder geänderte Auflösung
+            slot = np.empty_like(frame)
+            self._slots[index] = slot
+        
+        if not np.may_share_memory(frame, slot):
+            np.copyto(slot, frame)
+        
+        with self._condition:
+            # Ein noch nicht gelesener Vorgänger wird durch diesen Frame verdrängt
+            if self._latest_index >= 0 and self._read_sequence < self._sequence:
+                self.frames_dropped += 1
+            
+            self._timestamps[index] = timestamp_ns
+            self._latest_index = index
+            self._sequence += 1
+            self.frames_written += 1
+            self._write_index = (index + 1) % self.capacity
+            self._condition.notify_all()
+    
+    def read_latest(self, timeout: Optional[float] = None, wait_for_new: bool = True) -> Tuple[Optional[np.ndarray], int]:
+        """Liest eine Kopie des neuesten Frames.
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden auf einen neuen Frame
+            wait_for_new: Ob auf einen noch nicht gelesenen Frame gewartet werden soll
+            
+        Returns:
+            Tuple aus (Frame oder None bei Timeout, Zeitstempel in ns)
+        """
+        with self._condition:
+            if wait_for_new:
+                has_frame = self._condition.wait_for(lambda: self._read_sequence < self._sequence, timeout)
+            else:
+                has_frame = self._latest_index >= 0
+            
+            if not has_frame:
+                return None, 0
+            
+            index = self._latest_index
+            self._pinned_index = index
+            self._read_sequence = self._sequence
+            timestamp_ns = int(self._timestamps[index])
+        
+        try:
+            frame = self._slots[index].copy()
+        finally:
+            with self._condition:
+                self._pinned_index = -1
+        
+        return frame, timestamp_ns
+    
+    def notify_all(self):
+        """Weckt wartende Leser auf (z.B. beim Beenden der Erfassung)."""
+        with self._condition:
+            self._condition.notify_all()
+
+
+class AsyncFrameCapture:
+    """Hintergrund-Erfassung von Frames in einen FrameRingBuffer.
+    
+    Als Quelle dient jedes Objekt mit einer read()-Methode, die (Erfolg, Frame)
+    liefert, z.B. cv2.VideoCapture für Kameras und Videodateien oder eine
+    synthetische Frame-Quelle. Die Erfassung läuft unabhängig von der
+    Verarbeitung, veraltete Frames werden verworfen.
+    """
+    
+    def __init__(self, source, buffer_size: int = 3, max_failures: int = 30,
+                 logger: Optional[logging.Logger] = None):
+        """Initialisiert die asynchrone Erfassung.
+        
+        Args:
+            source: Frame-Quelle mit read() -> (bool, np.ndarray)
+            buffer_size: Anzahl der vorallokierten Frames im Ringpuffer
+            max_failures: Aufeinanderfolgende Lesefehler, nach denen die Erfassung endet
+            logger: Optionaler Logger
+        """
+        self.source = source
+        self.buffer = FrameRingBuffer(buffer_size)
+        self.max_failures = max_failures
+        self.logger = logger or logging.getLogger("ocrtool.vision.capture")
+        
+        # cv2.VideoCapture kann direkt in einen vorhandenen Slot dekodieren
+        self._supports_inplace_read = isinstance(source, cv2.VideoCapture)
+        
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self._started_at = 0.0
+        self._frame_times = deque(maxlen=60)
+        self.read_failures = 0
+        self.last_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self._total_latency_ms = 0.0
+    
+    @property
+    def is_running(self) -> bool:
+        """Gibt an, ob der Erfassungs-Thread aktiv ist."""
+        return self._running.is_set()
+    
+    def start(self):
+        """Startet den Erfassungs-Thread."""
+        if self.is_running:
+            return
+        
+        self._running.set()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._capture_loop, name="vision-capture", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0):
+        """Beendet den Erfassungs-Thread.
+        
+        Args:
+            timeout: Maximale Wartezeit auf das Thread-Ende in Sekunden
+        """
+        self._running.clear()
+        self.buffer.notify_all()
+        
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+    
+    def _capture_loop(self):
+        """Liest fortlaufend Frames von der Quelle in den Ringpuffer."""
+        consecutive_failures = 0
+        
+        while self._running.is_set():
+            slot = self.buffer.writable_slot()
+            
+            start = time.perf_counter()
+            if slot is not None and self._supports_inplace_read:
+                success, frame = self.source.read(slot)
+            else:
+                success, frame = self.source.read()
+            latency_ms = (time.perf_counter() - start) * 1000
+            
+            if not success or frame is None:
+                consecutive_failures += 1
+                self.read_failures += 1
+                if consecutive_failures >= self.max_failures:
+                    self.logger.warning("Frame-Quelle liefert keine Frames mehr, beende Erfassung")
+                    break
+                continue
+            
+            consecutive_failures = 0
+            self.buffer.commit(frame)
+            
+            self.last_latency_ms = latency_ms
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            self._total_latency_ms += latency_ms
+            self._frame_times.append(time.perf_counter())
+        
+        self._running.clear()
+        self.buffer.notify_all()
+    
+    def read(self, timeout: Optional[float] = 1.0) -> Optional[np.ndarray]:
+        """Liefert den neuesten, noch nicht gelesenen Frame.
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+            
+        Returns:
+            Frame als NumPy-Array oder None, wenn kein neuer Frame vorliegt
+        """
+        if not self.is_running:
+            # Nach dem Ende der Quelle noch vorhandene Frames ausliefern
+            frame, _ = self.buffer.read_latest(timeout=0)
+            return frame
+        
+        frame, _ = self.buffer.read_latest(timeout=timeout)
+        return frame
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Zähler zur Erfassung.
+        
+        Returns:
+            Dict mit FPS, verworfenen Frames und Erfassungslatenz
+        """
+        frames = self.buffer.frames_written
+        fps = 0.0
+        if len(self._frame_times) >= 2:
+            span = self._frame_times[-1] - self._frame_times[0]
+            if span > 0:
+                fps = (len(self._frame_times) - 1) / span
+        
+        return {
+            "running": self.is_running,
+            "fps": fps,
+            "frames_captured": frames,
+            "frames_dropped": self.buffer.frames_dropped,
+            "read_failures": self.read_failures,
+            "capture_latency_ms": {
+                "last": self.last_latency_ms,
+                "mean": self._total_latency_ms / frames if frames else 0.0,
+                "max": self.max_latency_ms
+            },
+            "uptime_s": time.perf_counter() - self._started_at if self._started_at else 0.0
+        }
+
+
+class LatencyHistogram:
+    """Latenzhistogramm mit festen, logarithmisch gestuften Buckets in Millisekunden."""
+    
+    BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+    
+    def __init__(self, sample_size: int = 2048):
+        """Initialisiert das Histogramm.
+        
+        Args:
+            sample_size: Anzahl der letzten Messwerte, aus denen Perzentile berechnet werden
+        """
+        self._bounds = np.array(self.BUCKET_BOUNDS_MS, dtype=np.float64)
+        self._counts = np.zeros(len(self._bounds) + 1, dtype=np.int64)
+        self._samples = deque(maxlen=sample_size)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, latency_ms: float):
+        """Erfasst einen Messwert in Millisekunden."""
+        bucket = int(np.searchsorted(self._bounds, latency_ms, side="left"))
+        with self._lock:
+            self._counts[bucket] += 1
+            self._samples.append(latency_ms)
+            self.count += 1
+            self.total_ms += latency_ms
+            self.max_ms = max(self.max_ms, latency_ms)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Liefert Kennzahlen und Bucket-Zählerstände.
+        
+        Returns:
+            Dict mit Anzahl, Mittelwert, Perzentilen, Maximum und Buckets
+        """
+        with self._lock:
+            samples = np.array(self._samples, dtype=np.float64)
+            counts = self._counts.copy()
+            count = self.count
+            total_ms = self.total_ms
+            max_ms = self.max_ms
+        
+        labels = [f"<={bound}ms" for bound in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]}ms"]
+        percentiles = np.percentile(samples, [50, 95, 99]) if len(samples) else np.zeros(3)
+        
+        return {
+            "count": count,
+            "mean_ms": total_ms / count if count else 0.0,
+            "p50_ms": float(percentiles[0]),
+            "p95_ms": float(percentiles[1]),
+            "p99_ms": float(percentiles[2]),
+            "max_ms": max_ms,
+            "buckets": dict(zip(labels, counts.tolist()))
+        }
+
+
+class FrameChangeGate:
+    """Erkennt, ob sich eine Live-Szene seit dem zuletzt verarbeiteten Frame geändert hat.
+
+    Jeder Frame wird auf ein kleines Graustufen-Thumbnail verkleinert: erst
+    bilinear auf die vierfache Thumbnail-Größe (schnell, unabhängig von der
+    Auflösung), dann per INTER_AREA; das Mitteln unterdrückt Sensorrauschen.
+    Der Änderungswert ist die größte Abweichung einer Thumbnail-Zelle vom
+    Referenz-Thumbnail, nachdem die mittlere (Median-)Abweichung abgezogen
+    wurde, sodass globale Helligkeitsschwankungen (Belichtungsautomatik)
+    nicht als Änderung zählen. Referenz ist stets der zuletzt verarbeitete
+    Frame, damit sich langsame Veränderungen nicht unbemerkt aufsummieren.
+    """
+
+    def __init__(self, threshold: float = 8.0, thumbnail_size: Tuple[int, int] = (32, 24),
+                 max_skip_frames: int = 30):
+        """Initialisiert das Gate.
+
+        Args:
+            threshold: Änderungswert in Grauwerten, ab dem ein Frame verarbeitet wird
+            thumbnail_size: Größe des Thumbnails (Breite, Höhe)
+            max_skip_frames: Nach so vielen übersprungenen Frames wird erzwungen
+                verarbeitet (0 = nie erzwingen)
+        """
+        self.threshold = threshold
+        self.thumbnail_size = tuple(thumbnail_size)
+        self.max_skip_frames = max_skip_frames
+        self._reference: Optional[np.ndarray] = None
+        self._results: Dict[str, Any] = {}
+        self._consecutive_skips = 0
+        self._lock = threading.Lock()
+        self.frames = 0
+        self.processed = 0
+        self.skipped = 0
+        self.last_score = 0.0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        # INTER_AREA direkt auf 1080p kostet einige Millisekunden, bilinear auf 4x nur Bruchteile davon
+        width, height = self.thumbnail_size
+        if frame.shape[1] > 4 * width and frame.shape[0] > 4 * height:
+            frame = cv2.resize(frame, (4 * width, 4 * height), interpolation=cv2.INTER_LINEAR)
+        # Farbframes erst verkleinern, dann konvertieren: die Konvertierung läuft nur auf dem Thumbnail
+        thumbnail = cv2.resize(frame, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        if thumbnail.ndim == 3:
+            thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+        return thumbnail.astype(np.float32)
+
+    @staticmethod
+    def _difference_score(thumbnail: np.ndarray, reference: Optional[np.ndarray]) -> float:
+        if reference is None:
+            return float("inf")
+        difference = thumbnail - reference
+        difference -= np.median(difference)
+        return float(np.abs(difference).max())
+
+    def score(self, frame: np.ndarray) -> float:
+        """Berechnet den Änderungswert gegenüber dem Referenz-Frame (inf ohne Referenz)."""
+        with self._lock:
+            reference = self._reference
+        return self._difference_score(self._thumbnail(frame), reference)
+
+    def changed(self, frame: np.ndarray) -> bool:
+        """Entscheidet, ob der Frame verarbeitet werden muss, und zählt die Entscheidung.
+
+        Bei True wird der Frame zur neuen Referenz.
+
+        Args:
+            frame: Aktueller Frame
+
+        Returns:
+            True, wenn sich die Szene geändert hat (oder die Verarbeitung erzwungen wird)
+        """
+        thumbnail = self._thumbnail(frame)
+        with self._lock:
+            self.frames += 1
+            score = self._difference_score(thumbnail, self._reference)
+            self.last_score = score
+
+            forced = 0 < self.max_skip_frames <= self._consecutive_skips
+            if score > self.threshold or forced:
+                self._reference = thumbnail
+                self._consecutive_skips = 0
+                self.processed += 1
+                return True
+
+            self._consecutive_skips += 1
+            self.skipped += 1
+            return False
+
+    def process(self, frame: np.ndarray, operations: Dict[str, Any]) -> Dict[str, Any]:
+        """Führt Operationen nur bei geänderter Szene aus, sonst werden ihre letzten Ergebnisse wiederverwendet.
+
+        Beispiel: gate.process(frame, {"detections": lambda: vision.detect_objects(frame),
+        "codes": lambda: vision.detect_qr_barcodes(frame)})
+
+        Args:
+            frame: Aktueller Frame
+            operations: Name -> Funktion ohne Argumente, die das Ergebnis berechnet
+
+        Returns:
+            Dict Name -> Ergebnis sowie "reused" (True, wenn nichts neu berechnet wurde)
+        """
+        changed = self.changed(frame)
+        results = {}
+        reused = True
+        for name, compute in operations.items():
+            if changed or name not in self._results:
+                self._results[name] = compute()
+                reused = False
+            results[name] = self._results[name]
+        results["reused"] = reused
+        return results
+
+    def reset(self):
+        """Verwirft Referenz-Frame und gespeicherte Ergebnisse (z.B. nach Kamerawechsel)."""
+        with self._lock:
+            self._reference = None
+            self._results = {}
+            self._consecutive_skips = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Frame-Zähler und Übersprungquote.
+
+        Returns:
+            Dict mit verarbeiteten und übersprungenen Frames, Quote und letztem Änderungswert
+        """
+        with self._lock:
+            return {
+                "frames": self.frames,
+                "processed": self.processed,
+                "skipped": self.skipped,
+                "skip_rate": self.skipped / self.frames if self.frames else 0.0,
+                "last_score": self.last_score,
+                "threshold": self.threshold
+            }
+
+
+class LivePipeline:
+    """Mehrstufige Live-Verarbeitung: Erfassung → Detektion → Tracking → Annotation.
+    
+    Jede Stufe läuft in einem eigenen Thread; die Stufen sind über begrenzte
+    Queues verbunden, sodass eine langsame Stufe die vorherigen bremst
+    (Backpressure), statt Frames unbegrenzt anzustauen. Die Objekterkennung
+    läuft nur auf jedem N-ten Frame, dazwischen schreiben die Tracker die
+    Positionen fort. Mit einem FrameChangeGate entfällt die Erkennung auch
+    auf diesen Frames, solange sich die Szene nicht geändert hat.
+    """
+    
+    STAGES = ("capture", "detect", "track", "annotate")
+    _END = object()
+    
+    def __init__(self, vision_module: "ComputerVisionModule", source=None,
+                 detection_interval: int = 5, queue_size: int = 4,
+                 track_classes: List[str] = None, show_trajectories: bool = False,
+                 on_result=None, frame_gate: Optional[FrameChangeGate] = None):
+        """Initialisiert die Pipeline.
+        
+        Args:
+            vision_module: ComputerVisionModule für Detektion, Tracking und Annotation
+            source: Frame-Quelle mit read() -> (bool, Frame), Pfad zu einer
+                Videodatei oder None für die Kamera des Moduls
+            detection_interval: Objekterkennung auf jedem N-ten Frame
+            queue_size: Kapazität der Queues zwischen den Stufen
+            track_classes: Optionale Liste von Klassen, die getrackt werden sollen
+            show_trajectories: Ob Trajektorien eingezeichnet werden sollen
+            on_result: Optionaler Callback, der für jeden fertigen Frame mit
+                einem Ergebnis-Dict aufgerufen wird
+            frame_gate: Optionales FrameChangeGate; bei unveränderter Szene
+                werden statt der Erkennung nur die Tracker fortgeschrieben
+        """
+        if detection_interval < 1:
+            raise ValueError(f"detection_interval muss mindestens 1 sein, erhalten: {detection_interval}")
+        
+        self.vision = vision_module
+        self.logger = vision_module.logger
+        self.source = source
+        self.detection_interval = detection_interval
+        self.track_classes = track_classes
+        self.show_trajectories = show_trajectories
+        self.on_result = on_result
+        self.frame_gate = frame_gate
+        
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(len(self.STAGES) - 1)]
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._owns_source = False
+        self._max_frames = None
+        
+        self.histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+        self.histograms["end_to_end"] = LatencyHistogram()
+        self.frames_in = 0
+        self.frames_out = 0
+        self.detection_frames = 0
+        self.detection_skipped = 0
+        self.latest_result: Optional[Dict[str, Any]] = None
+        self._started_at = 0.0
+        self._finished_at = 0.0
+    
+    def start(self):
+        """Startet alle Stufen der Pipeline."""
+        if self._threads:
+            return
+        
+        if self.source is None:
+            # Kamera des Moduls; capture_frame() nutzt ggf. die asynchrone Erfassung
+            if self.vision.camera is None and self.vision.async_capture is None and not self.vision.init_camera():
+                raise RuntimeError("Kamera für Live-Pipeline konnte nicht initialisiert werden")
+        elif isinstance(self.source, str):
+            self.source = cv2.VideoCapture(self.source)
+            self._owns_source = True
+            if not self.source.isOpened():
+                raise RuntimeError("Videodatei für Live-Pipeline konnte nicht geöffnet werden")
+        
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        
+        workers = [self._capture_stage, self._detect_stage, self._track_stage, self._annotate_stage]
+        for stage, worker in zip(self.STAGES, workers):
+            thread = threading.Thread(target=worker, name=f"vision-pipeline-{stage}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+        
+        self.logger.info(f"Live-Pipeline gestartet (Detektion alle {self.detection_interval} Frames)")
+    
+    def stop(self, timeout: float = 5.0):
+        """Stoppt die Pipeline und wartet auf das Ende aller Stufen.
+        
+        Args:
+            timeout: Maximale Wartezeit pro Stufe in Sekunden
+        """
+        self._stop_event.set()
+        self.join(timeout)
+    
+    def join(self, timeout: float = None):
+        """Wartet, bis alle Stufen beendet sind (z.B. am Ende einer Videodatei)."""
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        
+        if self._owns_source:
+            self.source.release()
+            self._owns_source = False
+        
+        if not self._finished_at:
+            self._finished_at = time.perf_counter()
+    
+    def run(self, max_frames: int = None) -> Dict[str, Any]:
+        """Verarbeitet die Quelle blockierend bis zu ihrem Ende.
+        
+        Args:
+            max_frames: Optionale Obergrenze der zu erfassenden Frames
+            
+        Returns:
+            Statistiken der Pipeline (siehe get_stats)
+        """
+        self._max_frames = max_frames
+        self.start()
+        self.join()
+        return self.get_stats()
+    
+    def _put(self, index: int, item) -> bool:
+        """Legt ein Element in die Queue nach Stufe `index` (blockierend mit Abbruchprüfung)."""
+        while not self._stop_event.is_set():
+            try:
+                self._queues[index].put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _get(self, index: int):
+        """Holt ein Element aus der Queue vor Stufe `index + 1`."""
+        while not self._stop_event.is_set():
+            try:
+                return self._queues[index].get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return self._END
+    
+    def _read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Liest einen Frame von der Quelle oder der Kamera des Moduls."""
+        if self.source is None:
+            frame = self.vision.capture_frame()
+            return frame is not None, frame
+        return self.source.read()
+    
+    def _capture_stage(self):
+        """Stufe 1: Liest Frames von der Quelle."""
+        sequence = 0
+        try:
+            while not self._stop_event.is_set():
+                if self._max_frames is not None and sequence >= self._max_frames:
+                    break
+                
+                start = time.perf_counter()
+                success, frame = self._read_frame()
+                if not success or frame is None:
+                    break
+                
+                self.histograms["capture"].record((time.perf_counter() - start) * 1000)
+                self.frames_in += 1
+                
+                if not self._put(0, {"sequence": sequence, "frame": frame, "captured_at": start}):
+                    break
+                sequence += 1
+        except Exception as e:
+            self.logger.error(f"Fehler in der Erfassungsstufe: {e}")
+        finally:
+            self._put(0, self._END)
+    
+    def _detect_stage(self):
+        """Stufe 2: Objekterkennung auf jedem N-ten Frame."""
+        while True:
+            item = self._get(0)
+            if item is self._END:
+                break
+            
+            start = time.perf_counter()
+            due = item["sequence"] % self.detection_interval == 0
+            if due and self.frame_gate is not None and not self.frame_gate.changed(item["frame"]):
+                due = False
+                self.detection_skipped += 1
+            
+            if due:
+                try:
+                    item["detections"] = self.vision.detect_objects(item["frame"])
+                except Exception as e:
+                    self.logger.error(f"Fehler in der Detektionsstufe: {e}")
+                    item["detections"] = []
+                self.detection_frames += 1
+                self.histograms["detect"].record((time.perf_counter() - start) * 1000)
+            else:
+                item["detections"] = None
+            
+            if not self._put(1, item):
+                return
+        self._put(1, self._END)
+    
+    def _track_stage(self):
+        """Stufe 3: Tracking; startet Tracker auf Detektions-Frames, sonst Fortschreibung."""
+        while True:
+            item = self._get(1)
+            if item is self._END:
+                break
+            
+            start = time.perf_counter()
+            frame = item["frame"]
+            try:
+                if item["detections"] is not None:
+                    tracking_results = self.vision.track_detections(frame, item["detections"], self.track_classes)
+                else:
+                    tracking_results = {
+                        "detections": [],
+                        "tracking_started": [],
+                        "tracking_updated": self.vision.update_trackers(frame)
+                    }
+            except Exception as e:
+                self.logger.error(f"Fehler in der Tracking-Stufe: {e}")
+                tracking_results = {"detections": [], "tracking_started": [], "tracking_updated": []}
+            
+            item["tracking_results"] = tracking_results
+            # Trajektorien werden hier kopiert, da dieser Thread die Historien weiterschreibt
+            if self.show_trajectories:
+                item["trajectories"] = self.vision.trajectory_snapshot(
+                    [obj["object_id"] for obj in tracking_results["tracking_updated"]]
+                )
+            self.histograms["track"].record((time.perf_counter() - start) * 1000)
+            
+            if not self._put(2, item):
+                return
+        self._put(2, self._END)
+    
+    def _annotate_stage(self):
+        """Stufe 4: Annotation und Ausgabe der Ergebnisse."""
+        while True:
+            item = self._get(2)
+            if item is self._END:
+                break
+            
+            start = time.perf_counter()
+            try:
+                annotated = self.vision.annotate_tracked_objects(
+                    item["frame"], item["tracking_results"], show_trajectories=self.show_trajectories,
+                    trajectories=item.get("trajectories")
+                )
+            except Exception as e:
+                self.logger.error(f"Fehler in der Annotationsstufe: {e}")
+                annotated = item["frame"]
+            
+            finished = time.perf_counter()
+            self.histograms["annotate"].record((finished - start) * 1000)
+            self.histograms["end_to_end"].record((finished - item["captured_at"]) * 1000)
+            self.frames_out += 1
+            
+            result = {
+                "sequence": item["sequence"],
+                "frame": annotated,
+                "detection_frame": item["detections"] is not None,
+                "tracking_results": item["tracking_results"]
+            }
+            self.latest_result = result
+            
+            if self.on_result is not None:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    self.logger.error(f"Fehler im Ergebnis-Callback der Pipeline: {e}")
+        
+        self._finished_at = time.perf_counter()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Durchsatz und Latenzhistogramme aller Stufen.
+        
+        Returns:
+            Dict mit End-to-End-FPS, Framezählern, Queue-Füllständen und Histogrammen
+        """
+        end = self._finished_at or time.perf_counter()
+        elapsed = end - self._started_at if self._started_at else 0.0
+        
+        return {
+            "fps": self.frames_out / elapsed if elapsed > 0 else 0.0,
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "detection_frames": self.detection_frames,
+            "detection_skipped": self.detection_skipped,
+            "detection_interval": self.detection_interval,
+            "elapsed_s": elapsed,
+            "queue_depths": [q.qsize() for q in self._queues],
+            "latency": {name: histogram.summary() for name, histogram in self.histograms.items()},
+            "frame_gate": self.frame_gate.get_stats() if self.frame_gate is not None else None
+        }
+
+
+class KalmanBoxTrackerBank:
+    """Bewegungsbasiertes Tracking (SORT-Stil) für viele Objekte in einem NumPy-Array.
+    
+    Jeder Track belegt einen Slot in gemeinsamen Zustands- und Kovarianz-Arrays.
+    Zustand pro Track: (cx, cy, s, r, vx, vy, vs) mit Mittelpunkt, Fläche s und
+    Seitenverhältnis r. Vorhersage und Korrektur laufen für alle Tracks in einem
+    einzigen vektorisierten Schritt, ohne Bildkorrelation.
+    """
+    
+    def __init__(self, initial_capacity: int = 64):
+        """Initialisiert die Track-Bank.
+        
+        Args:
+            initial_capacity: Anfängliche Anzahl an Slots (wächst bei Bedarf)
+        """
+        self._x = np.zeros((initial_capacity, 7), dtype=np.float64)
+        self._P = np.zeros((initial_capacity, 7, 7), dtype=np.float64)
+        self._active = np.zeros(initial_capacity, dtype=bool)
+        self._boxes = np.zeros((initial_capacity, 4), dtype=np.float64)
+        self._free = list(range(initial_capacity - 1, -1, -1))
+        self.last_frame_id = 0
+        self._lock = threading.Lock()
+        
+        # Konstantes Geschwindigkeitsmodell (Parameter wie im SORT-Tracker)
+        self._F = np.eye(7)
+        self._F[0, 4] = self._F[1, 5] = self._F[2, 6] = 1.0
+        self._H = np.eye(4, 7)
+        self._R = np.diag([1.0, 1.0, 10.0, 10.0])
+        self._Q = np.diag([1.0, 1.0, 1.0, 1.0, 0.01, 0.01, 0.0001])
+        self._P0 = np.diag([10.0, 10.0, 10.0, 10.0, 10000.0, 10000.0, 10000.0])
+        self._I = np.eye(7)
+    
+    @property
+    def size(self) -> int:
+        """Anzahl der aktiven Tracks."""
+        return int(self._active.sum())
+    
+    @staticmethod
+    def _to_measurement(boxes: np.ndarray) -> np.ndarray:
+        """Wandelt (x, y, w, h)-Boxen in Messungen (cx, cy, s, r) um."""
+        w = boxes[:, 2]
+        h = boxes[:, 3]
+        return np.stack([boxes[:, 0] + w / 2, boxes[:, 1] + h / 2, w * h, w / np.maximum(h, 1e-6)], axis=1)
+    
+    @staticmethod
+    def _to_boxes(states: np.ndarray) -> np.ndarray:
+        """Wandelt Zustände (cx, cy, s, r, ...) in (x, y, w, h)-Boxen um."""
+        w = np.sqrt(np.clip(states[:, 2] * states[:, 3], 0, None))
+        h = np.divide(states[:, 2], w, out=np.zeros_like(w), where=w > 0)
+        return np.stack([states[:, 0] - w / 2, states[:, 1] - h / 2, w, h], axis=1)
+    
+    def add(self, bbox: Tuple[float, float, float, float]) -> int:
+        """Legt einen neuen Track an.
+        
+        Args:
+            bbox: Startposition (x, y, Breite, Höhe)
+            
+        Returns:
+            Slot-Index des Tracks
+        """
+        if not self._free:
+            self._grow()
+        
+        slot = self._free.pop()
+        self._x[slot] = 0.0
+        self._x[slot, :4] = self._to_measurement(np.asarray([bbox], dtype=np.float64))[0]
+        self._P[slot] = self._P0
+        self._active[slot] = True
+        self._boxes[slot] = bbox
+        return slot
+    
+    def _grow(self):
+        """Verdoppelt die Kapazität der Zustandsarrays."""
+        capacity = len(self._x)
+        self._x = np.concatenate([self._x, np.zeros_like(self._x)])
+        self._P = np.concatenate([self._P, np.zeros_like(self._P)])
+        self._active = np.concatenate([self._active, np.zeros(capacity, dtype=bool)])
+        self._boxes = np.concatenate([self._boxes, np.zeros_like(self._boxes)])
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
+    
+    def remove(self, slot: int):
+        """Gibt den Slot eines beendeten Tracks frei."""
+        if self._active[slot]:
+            self._active[slot] = False
+            self._free.append(slot)
+    
+    def predict(self):
+        """Schreibt alle aktiven Tracks um einen Frame fort (ein vektorisierter Schritt)."""
+        slots = np.flatnonzero(self._active)
+        if len(slots) == 0:
+            return
+        
+        x = self._x[slots]
+        # Verhindere negative Flächen
+        x[x[:, 2] + x[:, 6] <= 0, 6] = 0.0
+        
+        self._x[slots] = x @ self._F.T
+        self._P[slots] = self._F @ self._P[slots] @ self._F.T + self._Q
+        self._boxes[slots] = self._to_boxes(self._x[slots])
+    
+    def predict_frame(self, frame_id: float):
+        """Führt predict() höchstens einmal pro Frame aus (threadsicher).
+        
+        Args:
+            frame_id: Aufsteigende Frame-Nummer oder Zeitstempel des Frames
+        """
+        with self._lock:
+            if frame_id > self.last_frame_id:
+                self.predict()
+                self.last_frame_id = frame_id
+    
+    def update(self, slots: List[int], boxes: np.ndarray) -> np.ndarray:
+        """Korrigiert mehrere Tracks gleichzeitig mit gemessenen Boxen.
+        
+        Args:
+            slots: Slot-Indizes der zu korrigierenden Tracks
+            boxes: (k, 4)-Array gemessener Boxen (x, y, Breite, Höhe)
+            
+        Returns:
+            Korrigierte Boxen als (k, 4)-Array
+        """
+        slots = np.asarray(slots, dtype=np.int64)
+        z = self._to_measurement(np.asarray(boxes, dtype=np.float64).reshape(-1, 4))
+        
+        x = self._x[slots]
+        P = self._P[slots]
+        
+        residual = z - x @ self._H.T
+        PHt = P @ self._H.T
+        S = self._H @ PHt + self._R
+        # K = P H^T S^-1, über ein Gleichungssystem statt expliziter Inversion
+        K = np.linalg.solve(S, PHt.transpose(0, 2, 1)).transpose(0, 2, 1)
+        
+        x = x + np.einsum("kij,kj->ki", K, residual)
+        self._x[slots] = x
+        self._P[slots] = (self._I - K @ self._H) @ P
+        self._boxes[slots] = self._to_boxes(x)
+        
+        return self._boxes[slots]
+    
+    def get_box(self, slot: int) -> np.ndarray:
+        """Liefert die aktuelle Box (x, y, Breite, Höhe) eines Tracks."""
+        return self._boxes[slot]
+
+
+class KalmanTrackHandle:
+    """Tracker-Schnittstelle (init/update wie OpenCV-Tracker) für einen Slot der KalmanBoxTrackerBank.
+    
+    Ein neuer Frame wird an der Frame-Nummer erkannt, nicht am Bildobjekt, da
+    Erfassungsschleifen oft denselben Puffer wiederverwenden. Ohne explizite
+    Nummer zählt jedes Handle seine Updates selbst, was voraussetzt, dass
+    jeder Track genau einmal pro Frame aktualisiert wird.
+    """
+    
+    def __init__(self, bank: KalmanBoxTrackerBank):
+        """Erstellt ein Handle ohne Track.
+        
+        Args:
+            bank: Gemeinsame Track-Bank
+        """
+        self.bank = bank
+        self.slot = None
+        self.frame_id = 0
+    
+    def init(self, image: np.ndarray, bbox: Tuple[int, int, int, int]) -> bool:
+        """Legt den Track an der Startposition an (das Bild wird nicht benötigt)."""
+        if self.slot is not None:
+            self.bank.remove(self.slot)
+        self.slot = self.bank.add(bbox)
+        self.frame_id = self.bank.last_frame_id
+        return True
+    
+    def update(self, image: np.ndarray, frame_id: float = None) -> Tuple[bool, Tuple[float, float, float, float]]:
+        """Liefert die vorhergesagte Box für den nächsten Frame.
+        
+        Args:
+            image: Aktueller Frame (nur für die OpenCV-kompatible Signatur)
+            frame_id: Aufsteigende Frame-Nummer oder Zeitstempel (None = eigener Zähler)
+            
+        Returns:
+            Tuple mit (Erfolg, Begrenzungsrahmen)
+        """
+        self.frame_id = self.frame_id + 1 if frame_id is None else frame_id
+        # Die erste Abfrage pro Frame schreibt alle Tracks der Bank gemeinsam fort
+        self.bank.predict_frame(self.frame_id)
+        box = self.bank.get_box(self.slot)
+        success = bool(np.all(np.isfinite(box)) and box[2] > 0 and box[3] > 0)
+        return success, tuple(box.tolist())
+    
+    def release(self):
+        """Gibt den Slot in der Bank frei."""
+        if self.slot is not None:
+            self.bank.remove(self.slot)
+            self.slot = None
+
+
+class TrajectoryStore:
+    """Kompakter Speicher für Tracking-Historien mit fester Länge pro Track.
+    
+    Jeder Track besitzt einen vorallokierten Ringpuffer (float32-Boxen und
+    int64-Zeitstempel aus time.monotonic_ns). Der Puffer ist gespiegelt: jeder
+    Eintrag wird an Position i und i + max_length geschrieben, sodass die
+    letzten n Einträge immer als zusammenhängende Sicht (ohne Kopie) gelesen
+    werden können. Historien beendeter Tracks werden nach Ablauf der TTL entfernt.
+    """
+    
+    def __init__(self, max_length: int = 128, ttl_seconds: float = 300.0):
+        """Initialisiert den Speicher.
+        
+        Args:
+            max_length: Maximale Anzahl gespeicherter Positionen pro Track
+            ttl_seconds: Aufbewahrungsdauer der Historie nach Ende des Tracks
+        """
+        if max_length < 1:
+            raise ValueError(f"max_length muss mindestens 1 sein, erhalten: {max_length}")
+        
+        self.max_length = max_length
+        self.ttl_ns = int(ttl_seconds * 1e9)
+        self._tracks: Dict[str, Dict[str, Any]] = {}
+        self._stopped: "OrderedDict[str, int]" = OrderedDict()
+        self.evicted = 0
+    
+    def __contains__(self, object_id: str) -> bool:
+        return object_id in self._tracks
+    
+    def __len__(self) -> int:
+        return len(self._tracks)
+    
+    def __getitem__(self, object_id: str) -> Dict[str, np.ndarray]:
+        """Liefert Positionen und Zeitstempel eines Tracks als Sichten (ohne Kopie)."""
+        return {
+            "positions": self.positions(object_id),
+            "timestamps": self.timestamps(object_id)
+        }
+    
+    def keys(self):
+        return self._tracks.keys()
+    
+    def start(self, object_id: str, bbox, timestamp_ns: int = None):
+        """Legt die Historie eines Tracks neu an und speichert die Startposition."""
+        length = self.max_length
+        self._tracks[object_id] = {
+            "boxes": np.zeros((2 * length, 4), dtype=np.float32),
+            "timestamps": np.zeros(2 * length, dtype=np.int64),
+            "count": 0
+        }
+        self._stopped.pop(object_id, None)
+        self.append(object_id, bbox, timestamp_ns)
+    
+    def append(self, object_id: str, bbox, timestamp_ns: int = None):
+        """Fügt eine Position an; die älteste wird bei vollem Puffer überschrieben."""
+        track = self._tracks[object_id]
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        
+        index = track["count"] % self.max_length
+        mirror = index + self.max_length
+        
+        track["boxes"][index] = bbox
+        track["boxes"][mirror] = bbox
+        track["timestamps"][index] = timestamp_ns
+        track["timestamps"][mirror] = timestamp_ns
+        track["count"] += 1
+    
+    def _window(self, track: Dict[str, Any], last: Optional[int]) -> slice:
+        """Bestimmt den zusammenhängenden Bereich der letzten `last` Einträge."""
+        available = min(track["count"], self.max_length)
+        n = available if last is None else min(last, available)
+        end = (track["count"] - 1) % self.max_length + self.max_length + 1
+        return slice(end - n, end)
+    
+    def positions(self, object_id: str, last: int = None) -> np.ndarray:
+        """Liefert die letzten Positionen (älteste zuerst) als (n, 4)-Sicht.
+        
+        Args:
+            object_id: ID des Tracks
+            last: Optionale Anzahl der jüngsten Positionen (None = alle gespeicherten)
+            
+        Returns:
+            float32-Array (x, y, Breite, Höhe) ohne Kopie der Daten
+        """
+        track = self._tracks[object_id]
+        return track["boxes"][self._window(track, last)]
+    
+    def timestamps(self, object_id: str, last: int = None) -> np.ndarray:
+        """Liefert die Zeitstempel (monotone Nanosekunden) passend zu positions()."""
+        track = self._tracks[object_id]
+        return track["timestamps"][self._window(track, last)]
+    
+    def mark_stopped(self, object_id: str, timestamp_ns: int = None):
+        """Markiert einen Track als beendet; seine Historie läuft nach der TTL ab."""
+        if object_id not in self._tracks:
+            return
+        
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+        
+        self._stopped.pop(object_id, None)
+        self._stopped[object_id] = timestamp_ns
+    
+    def evict_expired(self, now_ns: int = None) -> int:
+        """Entfernt Historien beendeter Tracks, deren TTL abgelaufen ist.
+        
+        Args:
+            now_ns: Aktueller Zeitpunkt (time.monotonic_ns), Standard: jetzt
+            
+        Returns:
+            Anzahl entfernter Historien
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        
+        evicted = 0
+        # Beendete Tracks liegen in Reihenfolge ihres Endes vor
+        while self._stopped:
+            object_id, stopped_at = next(iter(self._stopped.items()))
+            if now_ns - stopped_at < self.ttl_ns:
+                break
+            self._stopped.popitem(last=False)
+            self._tracks.pop(object_id, None)
+            evicted += 1
+        
+        self.evicted += evicted
+        return evicted
+    
+    def memory_bytes(self) -> int:
+        """Liefert den belegten Speicher aller Historien in Bytes."""
+        return sum(track["boxes"].nbytes + track["timestamps"].nbytes for track in self._tracks.values())
+
+
+class DetectorPool:
+    """Pool unabhängiger cv2.dnn-Netze für nebenläufige Objekterkennung.
+    
+    setInput() und forward() teilen sich den Zustand eines Netzes, daher darf
+    jedes Netz zur selben Zeit nur von einem Thread verwendet werden. Der Pool
+    verteilt die Netze exklusiv pro Anfrage und erfasst Wartezeiten sowie
+    die Auslastung.
+    """
+    
+    def __init__(self, nets: List[Any]):
+        """Initialisiert den Pool.
+        
+        Args:
+            nets: Bereits geladene, voneinander unabhängige Netze
+        """
+        if not nets:
+            raise ValueError("DetectorPool benötigt mindestens ein Netz")
+        
+        self.size = len(nets)
+        self._available = queue.Queue()
+        for net in nets:
+            self._available.put(net)
+        
+        self._lock = threading.Lock()
+        self._wait_latency = LatencyHistogram()
+        self._created_at = time.perf_counter()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.busy_seconds = 0.0
+    
+    @contextlib.contextmanager
+    def acquire(self, timeout: Optional[float] = None):
+        """Leiht ein Netz exklusiv für die Dauer des with-Blocks aus.
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden (None = unbegrenzt)
+            
+        Yields:
+            Ausgeliehenes cv2.dnn-Netz
+            
+        Raises:
+            TimeoutError: Wenn innerhalb von `timeout` kein Netz frei wurde
+        """
+        wait_start = time.perf_counter()
+        try:
+            net = self._available.get(timeout=timeout)
+        except queue.Empty:
+            with self._lock:
+                self.timeouts += 1
+            raise TimeoutError(f"Kein Detektornetz innerhalb von {timeout}s verfügbar")
+        
+        acquired_at = time.perf_counter()
+        self._wait_latency.record((acquired_at - wait_start) * 1000.0)
+        with self._lock:
+            self.acquisitions += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+        
+        try:
+            yield net
+        finally:
+            with self._lock:
+                self.in_use -= 1
+                self.busy_seconds += time.perf_counter() - acquired_at
+            self._available.put(net)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Auslastung und Wartezeiten des Pools.
+        
+        Returns:
+            Dict mit Poolgröße, Belegung, Auslastung und Wartezeit-Histogramm
+        """
+        elapsed = time.perf_counter() - self._created_at
+        with self._lock:
+            busy_seconds = self.busy_seconds
+            stats = {
+                "size": self.size,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts
+            }
+        
+        stats["utilization"] = busy_seconds / (self.size * elapsed) if elapsed > 0 else 0.0
+        stats["wait"] = self._wait_latency.summary()
+        return stats
+
+
+def _detection_worker_main(config: Dict[str, Any], slot_names: List[str], task_queue, result_queue):
+    """Hauptschleife eines Detektions-Workerprozesses.
+    
+    Jeder Worker besitzt ein eigenes ComputerVisionModule samt Netz. Frames
+    werden als Sicht auf den gemeinsamen Speicher gelesen, zurück gehen nur
+    die Detektionslisten. Lässt sich das Modell nicht laden, wird jeder
+    Auftrag mit diesem Fehler beantwortet.
+    
+    Args:
+        config: Konfiguration für ComputerVisionModule
+        slot_names: Namen der Shared-Memory-Slots
+        task_queue: Queue mit Aufträgen (task_id, slot_index, shape, dtype) bzw. None zum Beenden
+        result_queue: Queue für Ergebnisse (task_id, slot_index, detections, error)
+    """
+    load_error = None
+    try:
+        module = ComputerVisionModule(dict(config, detector_pool_size=0))
+        if module.object_detector is None:
+            load_error = f"Detektionsmodell in {module.models_dir} konnte nicht geladen werden"
+    except Exception as e:
+        load_error = f"{type(e).__name__}: {e}"
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+    
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            
+            task_id, slot_index, shape, dtype = task
+            if load_error is not None:
+                result_queue.put((task_id, slot_index, None, load_error))
+                continue
+            try:
+                image = np.ndarray(shape, dtype=dtype, buffer=slots[slot_index].buf)
+                detections = module.detect_objects(image)
+                del image
+                result_queue.put((task_id, slot_index, detections, None))
+            except Exception as e:
+                result_queue.put((task_id, slot_index, None, f"{type(e).__name__}: {e}"))
+    finally:
+        for slot in slots:
+            slot.close()
+
+
+class ProcessDetectionService:
+    """Objekterkennung in mehreren Workerprozessen mit Frame-Übergabe über Shared Memory.
+    
+    Statt vollständige Frames zu picklen, kopiert submit() jeden Frame einmal
+    in einen freien Shared-Memory-Slot; der Worker liest ihn ohne weitere
+    Kopie. Über die Prozessgrenze gehen nur Slot-Index, Form und die kleinen
+    Detektionslisten. Sind alle Slots belegt, blockiert submit() (Backpressure).
+    
+    Jeder Worker hat eine eigene Auftragswarteschlange; submit() wählt den
+    Worker mit den wenigsten offenen Aufträgen. Stirbt ein Worker, schlagen
+    seine offenen Aufträge fehl und ihre Slots werden wieder frei.
+    
+    Mit den Startmethoden "spawn" und "forkserver" (Standard unter macOS und
+    Windows) importieren die Worker dieses Modul über seinen Namen. Das geht
+    nur im Paketlayout (`vision.computer_vision_module`); wird
+    `computer-vision-module.py` direkt als Datei geladen, ist "fork" nötig.
+    """
+    
+    def __init__(self, config: Dict[str, Any], workers: int = None, slot_count: int = None,
+                 max_frame_shape: Tuple[int, ...] = (1080, 1920, 3), start_method: str = None):
+        """Initialisiert den Dienst, ohne Prozesse zu starten.
+        
+        Args:
+            config: Konfiguration für die ComputerVisionModule-Instanzen der Worker
+            workers: Anzahl der Workerprozesse (None = Anzahl der CPU-Kerne)
+            slot_count: Anzahl der Shared-Memory-Slots (None = 2 pro Worker)
+            max_frame_shape: Größte erwartete Frame-Form (bestimmt die Slotgröße bei uint8)
+            start_method: Startmethode für multiprocessing (None = Plattformstandard;
+                "spawn"/"forkserver" nur im Paketlayout, siehe Klassenbeschreibung)
+        """
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        self.slot_count = slot_count or 2 * self.workers
+        self.slot_bytes = int(np.prod(max_frame_shape))
+        self.logger = logging.getLogger("ocrtool.vision")
+        
+        self._context = multiprocessing.get_context(start_method)
+        self._slots = []
+        self._free_slots = queue.Queue()
+        self._processes = []
+        self._task_queues = []
+        self._result_queue = None
+        self._collector = None
+        # Offene Aufträge: task_id -> (Future, Zeitpunkt, Worker); je Worker task_id -> Slot
+        self._pending = {}
+        self._assigned = []
+        self._dead_workers = set()
+        self._pending_lock = threading.Lock()
+        self._task_ids = itertools.count()
+        self._running = False
+        
+        self._latency = LatencyHistogram()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+    
+    def __enter__(self) -> "ProcessDetectionService":
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+    
+    def start(self):
+        """Legt die Shared-Memory-Slots an und startet Worker und Ergebnis-Thread.
+        
+        Raises:
+            RuntimeError: Wenn die Startmethode ein importierbares Modul verlangt,
+                dieses aber direkt aus computer-vision-module.py geladen wurde
+        """
+        if self._running:
+            return
+        
+        # Ohne fork muss der Worker das Modul über seinen Namen importieren können
+        module_file = os.path.splitext(os.path.basename(__file__))[0]
+        if self._context.get_start_method() != "fork" and module_file != __name__.rsplit(".", 1)[-1]:
+            raise RuntimeError(f"Startmethode {self._context.get_start_method()} benötigt ein importierbares Modul; "
+                               f"{os.path.basename(__file__)} ist direkt geladen, verwende start_method='fork' "
+                               f"oder das Paketlayout vision.computer_vision_module")
+        
+        self._slots = [shared_memory.SharedMemory(create=True, size=self.slot_bytes) for _ in range(self.slot_count)]
+        for index in range(self.slot_count):
+            self._free_slots.put(index)
+        
+        self._result_queue = self._context.Queue()
+        slot_names = [slot.name for slot in self._slots]
+        
+        for index in range(self.workers):
+            task_queue = self._context.Queue()
+            process = self._context.Process(
+                target=_detection_worker_main,
+                args=(self.config, slot_names, task_queue, self._result_queue),
+                name=f"vision-detect-{index}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+            self._task_queues.append(task_queue)
+            self._assigned.append({})
+        
+        self._running = True
+        self._collector = threading.Thread(target=self._collect_results, name="vision-detect-results", daemon=True)
+        self._collector.start()
+        self.logger.info(f"Detektionsdienst mit {self.workers} Prozessen und {self.slot_count} Slots gestartet")
+    
+    def submit(self, image: np.ndarray, timeout: Optional[float] = None) -> Future:
+        """Übergibt einen Frame zur Erkennung.
+        
+        Args:
+            image: Eingabebild als NumPy-Array
+            timeout: Maximale Wartezeit auf einen freien Slot in Sekunden (None = unbegrenzt)
+            
+        Returns:
+            Future mit der Detektionsliste
+            
+        Raises:
+            RuntimeError: Wenn der Dienst nicht läuft oder kein Worker mehr lebt
+            ValueError: Wenn der Frame größer als ein Slot ist
+            TimeoutError: Wenn innerhalb von `timeout` kein Slot frei wurde
+        """
+        if not self._running:
+            raise RuntimeError("Detektionsdienst ist nicht gestartet")
+        if image.nbytes > self.slot_bytes:
+            raise ValueError(f"Frame mit {image.nbytes} Bytes überschreitet die Slotgröße von {self.slot_bytes} Bytes")
+        
+        try:
+            slot_index = self._free_slots.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Kein freier Shared-Memory-Slot innerhalb von {timeout}s")
+        
+        slot_view = np.ndarray(image.shape, dtype=image.dtype, buffer=self._slots[slot_index].buf)
+        np.copyto(slot_view, image)
+        del slot_view
+        
+        future = Future()
+        task_id = next(self._task_ids)
+        with self._pending_lock:
+            workers = [index for index in range(len(self._processes)) if index not in self._dead_workers]
+            if not workers:
+                self._free_slots.put(slot_index)
+                raise RuntimeError("Alle Detektionsprozesse wurden beendet")
+            
+            worker = min(workers, key=lambda index: len(self._assigned[index]))
+            self._pending[task_id] = (future, time.perf_counter(), worker)
+            self._assigned[worker][task_id] = slot_index
+            self.submitted += 1
+        
+        self._task_queues[worker].put((task_id, slot_index, image.shape, image.dtype.str))
+        return future
+    
+    def detect(self, images: List[np.ndarray], timeout: Optional[float] = None) -> List[List[Dict[str, Any]]]:
+        """Erkennt Objekte in mehreren Bildern und wartet auf alle Ergebnisse.
+        
+        Args:
+            images: Liste von Eingabebildern
+            timeout: Maximale Wartezeit pro Ergebnis in Sekunden
+            
+        Returns:
+            Liste mit einer Detektionsliste pro Eingabebild (gleiche Reihenfolge)
+        """
+        futures = [self.submit(image, timeout=timeout) for image in images]
+        return [future.result(timeout=timeout) for future in futures]
+    
+    def _collect_results(self):
+        """Löst Futures mit den Ergebnissen der Worker auf und gibt Slots frei."""
+        last_check = time.perf_counter()
+        while self._running or self._pending:
+            try:
+                task_id, slot_index, detections, error = self._result_queue.get(timeout=0.5)
+            except queue.Empty:
+                task_id = None
+            
+            # Auch unter Last regelmäßig nach beendeten Workern sehen
+            if task_id is None or time.perf_counter() - last_check >= 0.5:
+                last_check = time.perf_counter()
+                if self._reap_dead_workers():
+                    self._fail_pending("Alle Detektionsprozesse wurden beendet")
+                    return
+                if task_id is None:
+                    continue
+            
+            with self._pending_lock:
+                pending = self._pending.pop(task_id, None)
+                if pending is not None:
+                    del self._assigned[pending[2]][task_id]
+                    if error is None:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+            
+            # Verspätetes Ergebnis eines bereits fehlgeschlagenen Auftrags;
+            # dessen Slot wurde schon beim Fehlschlagen freigegeben
+            if pending is None:
+                continue
+            
+            self._free_slots.put(slot_index)
+            future, submitted_at, _ = pending
+            self._latency.record((time.perf_counter() - submitted_at) * 1000.0)
+            if error is None:
+                future.set_result(detections)
+            else:
+                future.set_exception(RuntimeError(error))
+    
+    def _reap_dead_workers(self) -> bool:
+        """Lässt die offenen Aufträge beendeter Worker fehlschlagen und gibt ihre Slots frei.
+        
+        Returns:
+            True, wenn kein Worker mehr läuft
+        """
+        failed = []
+        with self._pending_lock:
+            for index, process in enumerate(self._processes):
+                if index in self._dead_workers or process.is_alive():
+                    continue
+                
+                self._dead_workers.add(index)
+                assigned = self._assigned[index]
+                if assigned:
+                    self.logger.warning(f"Detektionsprozess {process.name} mit Exitcode {process.exitcode} "
+                                        f"beendet, {len(assigned)} offene Aufträge schlagen fehl")
+                for task_id, slot_index in assigned.items():
+                    pending = self._pending.pop(task_id, None)
+                    if pending is not None:
+                        self.failed += 1
+                        failed.append((pending[0], process.exitcode))
+                    self._free_slots.put(slot_index)
+                assigned.clear()
+            
+            all_dead = len(self._dead_workers) == len(self._processes)
+        
+        for future, exitcode in failed:
+            future.set_exception(RuntimeError(f"Detektionsprozess mit Exitcode {exitcode} beendet"))
+        return all_dead
+    
+    def _fail_pending(self, message: str):
+        """Beendet alle offenen Futures mit einem Fehler."""
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self.failed += len(pending)
+            self._pending.clear()
+            for assigned in self._assigned:
+                assigned.clear()
+        
+        for future, _, _ in pending:
+            future.set_exception(RuntimeError(message))
+    
+    def shutdown(self, timeout: float = 5.0):
+        """Beendet Worker und Ergebnis-Thread und gibt den Shared Memory frei.
+        
+        Args:
+            timeout: Maximale Wartezeit pro Prozess in Sekunden
+        """
+        if not self._running:
+            return
+        
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        
+        self._running = False
+        self._collector.join(timeout)
+        self._fail_pending("Detektionsdienst wurde beendet")
+        
+        for slot in self._slots:
+            slot.close()
+            slot.unlink()
+        
+        self._slots = []
+        self._processes = []
+        self._task_queues = []
+        self._assigned = []
+        self._dead_workers = set()
+        self._free_slots = queue.Queue()
+        self.logger.info("Detektionsdienst beendet")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Durchsatz- und Latenzkennzahlen des Dienstes.
+        
+        Returns:
+            Dict mit Auftragszählern, freien Slots und Latenz-Histogramm
+        """
+        with self._pending_lock:
+            stats = {
+                "workers": self.workers,
+                "workers_alive": len(self._processes) - len(self._dead_workers),
+                "slots": self.slot_count,
+                "free_slots": self._free_slots.qsize(),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "pending": len(self._pending)
+            }
+        
+        stats["latency"] = self._latency.summary()
+        return stats
+
+
+class ResultCache:
+    """Ergebnis-Cache mit Inhalts-Hash des Bildes als Schlüssel.
+
+    Der Schlüssel besteht aus einem schnellen Hash des Pixelpuffers (xxh3,
+    ohne xxhash ersatzweise BLAKE2b) samt Form und Datentyp sowie dem Namen
+    der Operation und den ergebnisrelevanten Parametern. Die Speicherstufe
+    ist ein LRU mit Byte-Grenze; optional werden Ergebnisse zusätzlich in
+    einem Verzeichnis abgelegt (Arrays als .npy, Listen als JSON), das
+    ebenfalls nach LRU auf eine Byte-Grenze gekürzt wird. get() liefert
+    Kopien, damit Aufrufer gecachte Ergebnisse nicht verändern können;
+    Listen liegen dafür im Speicher gepickelt vor, was schneller als
+    copy.deepcopy ist und zugleich die Größe in Bytes liefert.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[str] = None,
+                 disk_max_bytes: int = 1024 * 1024 * 1024):
+        """Initialisiert den Cache.
+
+        Args:
+            max_bytes: Obergrenze der Speicherstufe in Bytes
+            disk_dir: Verzeichnis der Festplattenstufe (None = keine)
+            disk_max_bytes: Obergrenze der Festplattenstufe in Bytes
+        """
+        try:
+            import xxhash
+            self._new_hasher = xxhash.xxh3_128
+        except ImportError:
+            import hashlib
+            self._new_hasher = lambda: hashlib.blake2b(digest_size=16)
+
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._disk_bytes = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            # Bestehende Einträge in Reihenfolge des letzten Zugriffs übernehmen
+            entries = [entry for entry in os.scandir(disk_dir)
+                       if entry.is_file() and entry.name.endswith((".npy", ".json"))]
+            for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+                size = entry.stat().st_size
+                self._disk[os.path.splitext(entry.name)[0]] = (entry.path, size)
+                self._disk_bytes += size
+
+    def key(self, operation: str, image: np.ndarray, params: Tuple = ()) -> str:
+        """Bildet den Cache-Schlüssel aus Bildinhalt, Operation und Parametern.
+
+        Args:
+            operation: Name der gecachten Operation
+            image: Eingabebild
+            params: Ergebnisrelevante Parameter (z.B. Modelltyp, Schwellwerte)
+
+        Returns:
+            Hex-Schlüssel
+        """
+        hasher = self._new_hasher()
+        hasher.update(repr((operation, image.shape, image.dtype.str, params)).encode())
+        hasher.update(np.ascontiguousarray(image).data)
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Liefert eine Kopie des Ergebnisses oder None bei einem Fehltreffer."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+        if entry is not None:
+            return self._unpack(entry[0])
+        
+        with self._lock:
+            disk_entry = self._disk.get(key)
+            if disk_entry is not None:
+                self._disk.move_to_end(key)
+
+        value = self._read_disk(key, disk_entry[0]) if disk_entry is not None else None
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+        self._store_memory(key, self._pack(value))
+        return value
+
+    def put(self, key: str, value: Any):
+        """Legt eine Kopie des Ergebnisses in beiden Stufen ab."""
+        self._store_memory(key, self._pack(value))
+        if self.disk_dir:
+            self._write_disk(key, value)
+
+    def get_or_compute(self, key: str, compute) -> Any:
+        """Liefert das gecachte Ergebnis oder berechnet und speichert es."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    @staticmethod
+    def _pack(value: Any) -> Any:
+        """Kopiert ein Ergebnis in die Form der Speicherstufe (Array-Kopie bzw. Pickle-Bytes)."""
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _unpack(packed: Any) -> Any:
+        if isinstance(packed, np.ndarray):
+            return packed.copy()
+        return pickle.loads(packed)
+
+    def _store_memory(self, key: str, value: Any):
+        size = value.nbytes if isinstance(value, np.ndarray) else len(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            self._memory[key] = (value, size)
+            self._memory_bytes += size
+
+            while self._memory_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.memory_evictions += 1
+
+    def _read_disk(self, key: str, path: str) -> Optional[Any]:
+        try:
+            if path.endswith(".npy"):
+                value = np.load(path, allow_pickle=False)
+            else:
+                with open(path, "r", encoding="utf-8") as handle:
+                    value = json.load(handle)
+            # Zugriffszeit für die LRU-Reihenfolge nach einem Neustart
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            with self._lock:
+                entry = self._disk.pop(key, None)
+                if entry is not None:
+                    self._disk_bytes -= entry[1]
+            return None
+
+    def _write_disk(self, key: str, value: Any):
+        extension = ".npy" if isinstance(value, np.ndarray) else ".json"
+        path = os.path.join(self.disk_dir, key + extension)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            if isinstance(value, np.ndarray):
+                with open(temp_path, "wb") as handle:
+                    np.save(handle, value, allow_pickle=False)
+            else:
+                # json.dumps nutzt den C-Encoder, json.dump in eine Datei nicht
+                with open(temp_path, "w", encoding="utf-8") as handle:
+                    handle.write(json.dumps(value, default=_json_default))
+            os.replace(temp_path, path)
+            size = os.path.getsize(path)
+        except (OSError, TypeError, ValueError):
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            return
+
+        with self._lock:
+            previous = self._disk.pop(key, None)
+            if previous is not None:
+                self._disk_bytes -= previous[1]
+            self._disk[key] = (path, size)
+            self._disk_bytes += size
+
+            evicted = []
+            while self._disk_bytes > self.disk_max_bytes and len(self._disk) > 1:
+                _, (evicted_path, evicted_size) = self._disk.popitem(last=False)
+                self._disk_bytes -= evicted_size
+                self.disk_evictions += 1
+                evicted.append(evicted_path)
+
+        for evicted_path in evicted:
+            with contextlib.suppress(OSError):
+                os.remove(evicted_path)
+
+    def clear(self):
+        """Leert die Speicherstufe; die Festplattenstufe bleibt erhalten."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Treffer-, Fehltreffer- und Verdrängungszähler sowie Füllstände.
+
+        Returns:
+            Dict mit Kennzahlen beider Stufen
+        """
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_evictions": self.memory_evictions,
+                "disk_evictions": self.disk_evictions,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes
+            }
+
+
+def _json_default(value: Any) -> Any:
+    """Wandelt NumPy-Werte für json.dump in Python-Typen um."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Nicht serialisierbar: {type(value).__name__}")
+
+
+# CLAHE- und MSER-Objekte sind nicht threadsicher, daher hält jeder Thread eigene Instanzen
+_enhancement_state = threading.local()
+
+# Faltungskern für die Rauschschätzung nach Immerkær (Differenz zweier Laplace-Masken)
+_NOISE_KERNEL = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+_NOISE_SAMPLE_SIZE = 1024
+
+
+def _get_clahe(clip_limit: float, tile_grid: Tuple[int, int]):
+    """Liefert ein wiederverwendbares CLAHE-Objekt des aktuellen Threads.
+
+    Args:
+        clip_limit: Kontrastbegrenzung
+        tile_grid: Kachelraster (Spalten, Zeilen)
+
+    Returns:
+        cv2.CLAHE-Instanz
+    """
+    cache = getattr(_enhancement_state, "clahe", None)
+    if cache is None:
+        cache = _enhancement_state.clahe = {}
+
+    key = (clip_limit, tile_grid)
+    clahe = cache.get(key)
+    if clahe is None:
+        clahe = cache[key] = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=tile_grid)
+    return clahe
+
+
+def _get_mser():
+    """Liefert die wiederverwendbare MSER-Instanz des aktuellen Threads."""
+    mser = getattr(_enhancement_state, "mser", None)
+    if mser is None:
+        mser = _enhancement_state.mser = cv2.MSER_create()
+    return mser
+
+
+def _grid_candidate_pairs(x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray,
+                          cell_size: int) -> np.ndarray:
+    """Bestimmt Kandidatenpaare von Rechtecken über ein uniformes Gitter als räumlichen Index.
+
+    Jedes Rechteck wird in alle Gitterzellen eingetragen, die es überdeckt;
+    nur Rechtecke mit gemeinsamer Zelle bilden ein Kandidatenpaar. Paare
+    können mehrfach vorkommen, wenn zwei Rechtecke mehrere Zellen teilen.
+
+    Args:
+        x0, y0, x1, y1: Koordinaten der Rechtecke (int64-Arrays, x1/y1 exklusiv)
+        cell_size: Kantenlänge der Gitterzellen
+
+    Returns:
+        (n, 2)-Array mit Indexpaaren
+    """
+    cell_x0, cell_x1 = x0 // cell_size, (x1 - 1) // cell_size
+    cell_y0, cell_y1 = y0 // cell_size, (y1 - 1) // cell_size
+    columns = cell_x1 - cell_x0 + 1
+    counts = columns * (cell_y1 - cell_y0 + 1)
+    
+    # Ein Eintrag je (Rechteck, Zelle), danach nach Zelle sortiert
+    owner = np.repeat(np.arange(len(x0)), counts)
+    position = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cell_x = cell_x0[owner] + position % columns[owner]
+    cell_y = cell_y0[owner] + position // columns[owner]
+    cells = (cell_y << 32) + cell_x
+    order = np.argsort(cells, kind="stable")
+    cells, owner = cells[order], owner[order]
+    
+    pairs = []
+    distance = 1
+    while distance < len(cells):
+        same_cell = cells[distance:] == cells[:-distance]
+        if not same_cell.any():
+            break
+        pairs.append(np.stack([owner[:-distance][same_cell], owner[distance:][same_cell]], axis=1))
+        distance += 1
+    
+    return np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=np.int64)
+
+
+def _connected_labels(count: int, pairs: np.ndarray) -> np.ndarray:
+    """Vergibt Komponentenlabels für einen Graphen aus Kantenpaaren (Label = kleinster Index)."""
+    labels = np.arange(count)
+    if len(pairs) == 0:
+        return labels
+    
+    first, second = pairs[:, 0], pairs[:, 1]
+    while True:
+        previous = labels.copy()
+        lowest = np.minimum(labels[first], labels[second])
+        np.minimum.at(labels, first, lowest)
+        np.minimum.at(labels, second, lowest)
+        # Pointer Jumping: jedes Label auf die Wurzel seiner Komponente verkürzen
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, previous):
+            return labels
+
+
+def _merge_text_boxes(boxes: np.ndarray, gap_factor: float,
+                      attach_marks: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """Verschmilzt benachbarte Textrechtecke zu Wörtern bzw. Zeilen.
+
+    Zwei Rechtecke gehören zusammen, wenn sie sich zu mindestens der Hälfte
+    der kleineren Fläche überdecken, wenn sie sich vertikal um mindestens die
+    halbe kleinere Höhe überlappen und horizontal höchstens
+    `gap_factor` x kleinere Höhe auseinanderliegen, oder, mit
+    `attach_marks`, wenn ein deutlich kleineres Rechteck direkt über/unter
+    dem größeren liegt (i-Punkte, Umlaute).
+
+    Args:
+        boxes: (n, 4)-Array mit x, y, Breite, Höhe
+        gap_factor: Erlaubter horizontaler Abstand relativ zur Höhe
+        attach_marks: Ob kleine Regionen über/unter einem Zeichen angehängt werden
+
+    Returns:
+        (verschmolzene Rechtecke als (m, 4)-Array, Zuordnung Eingabe -> Ergebnisindex)
+    """
+    x0, y0 = boxes[:, 0], boxes[:, 1]
+    x1, y1 = x0 + boxes[:, 2], y0 + boxes[:, 3]
+    heights = boxes[:, 3]
+    
+    gap = (gap_factor * heights).astype(np.int64)
+    cell_size = max(16, int(2 * np.median(heights) * (1 + gap_factor)))
+    pairs = _grid_candidate_pairs(x0 - gap, y0, x1 + gap, y1, cell_size)
+    a, b = pairs[:, 0], pairs[:, 1]
+    
+    min_height = np.minimum(heights[a], heights[b])
+    max_height = np.maximum(heights[a], heights[b])
+    vertical_overlap = np.minimum(y1[a], y1[b]) - np.maximum(y0[a], y0[b])
+    horizontal_gap = np.maximum(x0[a], x0[b]) - np.minimum(x1[a], x1[b])
+    intersection = np.clip(-horizontal_gap, 0, None) * np.clip(vertical_overlap, 0, None)
+    smaller_area = np.minimum(boxes[a, 2] * boxes[a, 3], boxes[b, 2] * boxes[b, 3])
+    
+    linked = ((intersection * 2 >= smaller_area)
+              | ((vertical_overlap * 2 >= min_height) & (horizontal_gap <= gap_factor * min_height)))
+    if attach_marks:
+        linked |= (horizontal_gap < 0) & (-vertical_overlap * 2 <= max_height) & (min_height * 2 <= max_height)
+    
+    labels = _connected_labels(len(boxes), pairs[linked])
+    _, assignment = np.unique(labels, return_inverse=True)
+    merged_count = assignment.max() + 1 if len(assignment) else 0
+    
+    merged_x0 = np.full(merged_count, np.iinfo(np.int64).max)
+    merged_y0 = merged_x0.copy()
+    merged_x1 = np.zeros(merged_count, dtype=np.int64)
+    merged_y1 = merged_x1.copy()
+    np.minimum.at(merged_x0, assignment, x0)
+    np.minimum.at(merged_y0, assignment, y0)
+    np.maximum.at(merged_x1, assignment, x1)
+    np.maximum.at(merged_y1, assignment, y1)
+    
+    merged = np.stack([merged_x0, merged_y0, merged_x1 - merged_x0, merged_y1 - merged_y0], axis=1)
+    return merged, assignment
+
+
+def _tile_grid(height: int, width: int, tile_size: int) -> List[Tuple[int, int, int, int]]:
+    """Zerlegt eine Bildfläche in Kacheln fester Größe.
+
+    Args:
+        height: Bildhöhe
+        width: Bildbreite
+        tile_size: Kantenlänge der Kacheln (gerade, damit Halbskalierung kachelgenau bleibt)
+
+    Returns:
+        Liste von (y0, y1, x0, x1) je Kachel
+    """
+    return [(y, min(height, y + tile_size), x, min(width, x + tile_size))
+            for y in range(0, height, tile_size)
+            for x in range(0, width, tile_size)]
+
+
+def _estimate_noise_sigma(gray: np.ndarray) -> float:
+    """Schätzt die Standardabweichung von Gaußschem Rauschen (Immerkær 1996).
+
+    Geschätzt wird auf einem zentralen Ausschnitt von höchstens
+    _NOISE_SAMPLE_SIZE Pixeln Kantenlänge, damit die Schätzung gegenüber
+    dem Entrauschen nicht ins Gewicht fällt.
+
+    Args:
+        gray: Graustufenbild
+
+    Returns:
+        Geschätztes Rausch-Sigma in Grauwerten
+    """
+    height, width = gray.shape[:2]
+    if height < 3 or width < 3:
+        return 0.0
+
+    top = max(0, (height - _NOISE_SAMPLE_SIZE) // 2)
+    left = max(0, (width - _NOISE_SAMPLE_SIZE) // 2)
+    sample = gray[top:top + _NOISE_SAMPLE_SIZE, left:left + _NOISE_SAMPLE_SIZE]
+
+    response = cv2.filter2D(sample.astype(np.float32), -1, _NOISE_KERNEL)[1:-1, 1:-1]
+    rows, cols = response.shape
+    return float(np.sqrt(np.pi / 2) * np.abs(response).sum() / (6.0 * rows * cols))
+
+
 class ComputerVisionModule:
     """Computer Vision Module für das Universal OCR Tool 2.0 mit OpenCV-Integration.
     
@@ -21,6 +1982,26 @@ class ComputerVisionModule:
     - Unterstützung für QR-Code- und Barcode-Erkennung
     """
     
+    # Profile für enhance_image_for_ocr: Entrauschungsverfahren gegen Laufzeit.
+    # skip_below_sigma: unterhalb dieses geschätzten Rauschens wird nicht entrauscht
+    # adaptive_offset: Threshold-Abstand wächst mit dem Rauschen statt fest 2
+    ENHANCEMENT_PROFILES = {
+        "quality": {"denoise": "nlm", "nlm_scale": 1.0, "nlm_search_window": 21,
+                    "skip_below_sigma": 0.0, "adaptive_offset": False},
+        "balanced": {"denoise": "nlm", "nlm_scale": 0.5, "nlm_search_window": 11,
+                     "skip_below_sigma": 3.0, "adaptive_offset": True},
+        "fast": {"denoise": "median", "nlm_scale": 1.0, "nlm_search_window": 0,
+                 "skip_below_sigma": 3.0, "adaptive_offset": True}
+    }
+
+    # Ebenen für segment_text_regions mit erlaubtem horizontalem Abstand relativ
+    # zur Zeichenhöhe: Regionen -> Wörter, Wörter -> Zeilen (None = unverschmolzen)
+    TEXT_SEGMENTATION_LEVELS = {
+        "region": None,
+        "word": 0.3,
+        "line": 1.5
+    }
+
     def __init__(self, config: Dict[str, Any]):
         """Initialisiert das Computer Vision Modul mit Konfiguration.
         
@@ -39,18 +2020,66 @@ class ComputerVisionModule:
         # Initialisiere Tracking
         self.tracker_type = config.get("tracker_type", "CSRT")
         self.active_trackers = {}
-        self.tracked_objects = {}
+        self.tracked_objects = TrajectoryStore(
+            max_length=config.get("trajectory_max_length", 128),
+            ttl_seconds=config.get("trajectory_ttl", 300.0)
+        )
+        self._track_counter = itertools.count()
+        self._motion_tracker_bank = None
+        # Einzige Frame-Uhr für die gemeinsame Kalman-Bank
+        self._tracking_frame = 0
+        
+        # Zuordnung von Detektionen zu bestehenden Tracks ("spawn" = je Detektion ein neuer Tracker)
+        self.tracking_mode = config.get("tracking_mode", "spawn")
+        if self.tracker_type.upper() in ("SORT", "KALMAN") and self.tracking_mode != "associate":
+            # Ohne Zuordnung erhalten Kalman-Tracks nie eine Korrektur durch Detektionen
+            self.logger.warning(f"Tracker-Typ {self.tracker_type} benötigt tracking_mode 'associate', "
+                                f"verwende 'associate' statt '{self.tracking_mode}'")
+            self.tracking_mode = "associate"
+        self.association_method = config.get("association_method", "hungarian")
+        self.association_iou_threshold = config.get("association_iou_threshold", 0.3)
+        self.reinit_iou_threshold = config.get("reinit_iou_threshold", 0.7)
+        self.max_track_misses = config.get("max_track_misses", 5)
+        
+        # Paralleles Update der Tracker (0/1 = seriell)
+        self.tracking_workers = config.get("tracking_workers", 0)
+        self._tracking_executor = None
         
         # Initialisiere Objekterkennung
+        self.detector_pool = None
+        self.detector_pool_size = config.get("detector_pool_size", 0)
+        self._detection_executor = None
+        self._detection_executor_workers = 0
         self._initialize_object_detection()
+        if self.detector_pool_size > 1 and self.object_detector is not None:
+            self.create_detector_pool(self.detector_pool_size)
         
         # Kamera-Setup
         self.camera_index = config.get("camera_index", 0)
         self.camera = None
+        self.async_capture = None
+        self.capture_buffer_size = config.get("capture_buffer_size", 3)
+        self.capture_timeout = config.get("capture_timeout", 1.0)
+        
+        # OCR-Vorverarbeitung; große Scans optional in Kacheln auf mehreren Threads (0 = ganzes Bild)
+        self.enhancement_profile = config.get("enhancement_profile", "quality")
+        self.enhancement_tile_size = config.get("enhancement_tile_size", 0)
+        self.enhancement_workers = config.get("enhancement_workers", os.cpu_count() or 1)
+        self._enhancement_executor = None
         
         # Barcode-/QR-Code-Detektor
         self.barcode_detector = cv2.barcode_BarcodeDetector()
         
+        # Ergebnis-Cache für wiederkehrende Bilder (0 Bytes = deaktiviert)
+        self.result_cache = None
+        cache_bytes = config.get("result_cache_bytes", 0)
+        if cache_bytes > 0:
+            self.result_cache = ResultCache(
+                max_bytes=cache_bytes,
+                disk_dir=config.get("result_cache_dir"),
+                disk_max_bytes=config.get("result_cache_disk_bytes", 1024 * 1024 * 1024)
+            )
+        
         self.logger.info("Computer Vision Module initialisiert")
     
     def _initialize_object_detection(self):
@@ -94,12 +2123,8 @@ class ComputerVisionModule:
             self.classes = [line.strip() for line in f.readlines()]
         
         # Lade YOLO-Netzwerk
-        self.object_detector = cv2.dnn.readNetFromDarknet(config_path, weights_path)
-        
-        # Verwende GPU, falls konfiguriert und verfügbar
-        if self.enable_gpu:
-            self.object_detector.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
-            self.object_detector.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+        self._detector_files = (weights_path, config_path)
+        self.object_detector = self._create_detector_net()
         
         # Bestimme Output-Layer-Namen
         self.layer_names = self.object_detector.getLayerNames()
@@ -118,12 +2143,8 @@ class ComputerVisionModule:
             self.classes = [line.strip() for line in f.readlines()]
         
         # Lade SSD-Netzwerk
-        self.object_detector = cv2.dnn.readNetFromTensorflow(model_path, config_path)
-        
-        # Verwende GPU, falls konfiguriert und verfügbar
-        if self.enable_gpu:
-            self.object_detector.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
-            self.object_detector.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+        self._detector_files = (model_path, config_path)
+        self.object_detector = self._create_detector_net()
         
         self.logger.info("SSD MobileNet Modell initialisiert")
     
@@ -137,49 +2158,300 @@ class ComputerVisionModule:
         with open(classes_path, 'r') as f:
             self.classes = [line.strip() for line in f.readlines()]
         
-        # Lade Faster R-CNN Netzwerk
-        self.object_detector = cv2.dnn.readNetFromTensorflow(model_path, config_path)
+        # Lade Faster R-CNN Netzwerk
+        self._detector_files = (model_path, config_path)
+        self.object_detector = self._create_detector_net()
+        
+        self.logger.info("Faster R-CNN Modell initialisiert")
+    
+    def _create_detector_net(self, model_buffer: np.ndarray = None, config_buffer: np.ndarray = None):
+        """Lädt ein Netz des konfigurierten Modelltyps.
+        
+        Args:
+            model_buffer: Bereits eingelesene Gewichte als uint8-Array (None = aus Datei laden)
+            config_buffer: Bereits eingelesene Modellkonfiguration als uint8-Array
+            
+        Returns:
+            cv2.dnn-Netz
+        """
+        model_path, config_path = self._detector_files
+        model = model_path if model_buffer is None else model_buffer
+        config = config_path if config_buffer is None else config_buffer
+        
+        if self.detection_model_type.lower() in ("ssd", "faster_rcnn"):
+            net = cv2.dnn.readNetFromTensorflow(model, config)
+        else:
+            net = cv2.dnn.readNetFromDarknet(config, model)
+        
+        # Verwende GPU, falls konfiguriert und verfügbar
+        if self.enable_gpu:
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
+            net.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+        
+        return net
+    
+    def create_detector_pool(self, size: int = None) -> Optional[DetectorPool]:
+        """Erstellt einen Pool unabhängiger Netze für nebenläufige Erkennung.
+        
+        Die Modelldateien werden nur einmal eingelesen; alle zusätzlichen Netze
+        werden aus denselben Puffern erzeugt. Das bestehende Netz wird als
+        erstes Poolmitglied übernommen.
+        
+        Args:
+            size: Anzahl der Netze (None = Konfiguration bzw. Anzahl der CPU-Kerne)
+            
+        Returns:
+            DetectorPool oder None, wenn kein Detektor initialisiert ist
+        """
+        if self.object_detector is None:
+            self.logger.error("Objektdetektor nicht initialisiert")
+            return None
+        
+        if size is None:
+            size = self.detector_pool_size or os.cpu_count() or 1
+        if size < 1:
+            raise ValueError(f"size muss mindestens 1 sein, erhalten: {size}")
+        
+        self.shutdown_detection_workers()
+        
+        model_path, config_path = self._detector_files
+        model_buffer = np.fromfile(model_path, dtype=np.uint8)
+        config_buffer = np.fromfile(config_path, dtype=np.uint8)
+        nets = [self.object_detector] + [
+            self._create_detector_net(model_buffer, config_buffer) for _ in range(size - 1)
+        ]
+        
+        self.detector_pool = DetectorPool(nets)
+        self.logger.info(f"Detektor-Pool mit {size} Netzen erstellt")
+        return self.detector_pool
+    
+    @contextlib.contextmanager
+    def _acquire_detector(self):
+        """Liefert ein exklusiv nutzbares Netz aus dem Pool bzw. das Einzelnetz."""
+        if self.detector_pool is None:
+            yield self.object_detector
+        else:
+            with self.detector_pool.acquire() as net:
+                yield net
+    
+    def detect_objects(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Erkennt Objekte im Bild mit dem konfigurierten Objekterkennungsmodell.
+        
+        Args:
+            image: Eingabebild als NumPy-Array
+            
+        Returns:
+            Liste von erkannten Objekten mit Details (Klasse, Konfidenz, Position)
+        """
+        if self.object_detector is None:
+            self.logger.error("Objektdetektor nicht initialisiert")
+            return []
+        
+        if self.result_cache is not None:
+            key = self.result_cache.key("detect_objects", image, self._detection_cache_params())
+            return self.result_cache.get_or_compute(key, lambda: self._detect_objects_uncached(image))
+        return self._detect_objects_uncached(image)
+    
+    def _detection_cache_params(self) -> Tuple:
+        """Parameter, von denen das Ergebnis von detect_objects abhängt."""
+        return (self.detection_model_type, self.config.get("yolo_version", "yolov4"), self.models_dir,
+                self.confidence_threshold, self.config.get("nms_mode", "class_agnostic"),
+                self.config.get("nms_threshold", 0.4))
+    
+    def _detect_objects_uncached(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Führt die Objekterkennung ohne Ergebnis-Cache aus."""
+        height, width, _ = image.shape
+        
+        # Vorverarbeitung des Bildes je nach Modelltyp
+        blob_params = self._get_blob_params()
+        if blob_params is None:
+            self.logger.error(f"Nicht unterstützter Modelltyp für Objekterkennung: {self.detection_model_type}")
+            return []
+        
+        blob = cv2.dnn.blobFromImage(image, **blob_params)
+        is_yolo = self.detection_model_type.lower() == "yolo"
+        
+        with self._acquire_detector() as net:
+            net.setInput(blob)
+            detections = net.forward(self.output_layers) if is_yolo else net.forward()
+        
+        if is_yolo:
+            return self._process_yolo_detections(detections, width, height)
+        else:
+            return self._process_ssd_detections(detections, width, height)
+    
+    def detect_objects_concurrent(self, images: List[np.ndarray], max_workers: int = None) -> List[List[Dict[str, Any]]]:
+        """Erkennt Objekte in mehreren Bildern parallel über den Detektor-Pool.
+        
+        Jede Anfrage leiht sich ein eigenes Netz aus dem Pool, sodass keine
+        globale Sperre nötig ist. Existiert noch kein Pool, wird er angelegt.
+        
+        Args:
+            images: Liste von Eingabebildern als NumPy-Arrays
+            max_workers: Anzahl paralleler Threads (None = Poolgröße)
+            
+        Returns:
+            Liste mit einer Detektionsliste pro Eingabebild (gleiche Reihenfolge)
+        """
+        if self.object_detector is None:
+            self.logger.error("Objektdetektor nicht initialisiert")
+            return [[] for _ in images]
+        
+        if self.detector_pool is None:
+            self.create_detector_pool()
+        
+        workers = max_workers or self.detector_pool.size
+        if self._detection_executor is None or self._detection_executor_workers != workers:
+            self.shutdown_detection_workers()
+            self._detection_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vision-detect")
+            self._detection_executor_workers = workers
+        
+        return list(self._detection_executor.map(self.detect_objects, images))
+    
+    def create_detection_service(self, workers: int = None, slot_count: int = None,
+                                 max_frame_shape: Tuple[int, ...] = None) -> ProcessDetectionService:
+        """Erstellt einen prozessbasierten Detektionsdienst mit der Konfiguration dieses Moduls.
+        
+        Args:
+            workers: Anzahl der Workerprozesse (None = Konfiguration bzw. Anzahl der CPU-Kerne)
+            slot_count: Anzahl der Shared-Memory-Slots (None = Konfiguration bzw. 2 pro Worker)
+            max_frame_shape: Größte erwartete Frame-Form (None = Konfiguration bzw. 1080p BGR)
+            
+        Returns:
+            Nicht gestarteter ProcessDetectionService
+        """
+        return ProcessDetectionService(
+            self.config,
+            workers=workers or self.config.get("detection_processes"),
+            slot_count=slot_count or self.config.get("detection_shm_slots"),
+            max_frame_shape=max_frame_shape or tuple(self.config.get("detection_max_frame_shape", (1080, 1920, 3)))
+        )
+    
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """Liefert Treffer, Fehltreffer und Verdrängungen des Ergebnis-Caches.
+        
+        Returns:
+            Dict mit Cache-Kennzahlen (leer, wenn der Cache deaktiviert ist)
+        """
+        if self.result_cache is None:
+            return {}
+        return self.result_cache.get_stats()
+    
+    def get_detector_pool_stats(self) -> Dict[str, Any]:
+        """Liefert Auslastung und Wartezeiten des Detektor-Pools.
+        
+        Returns:
+            Dict mit Pool-Kennzahlen (leer, wenn kein Pool existiert)
+        """
+        if self.detector_pool is None:
+            return {}
+        return self.detector_pool.get_stats()
+    
+    def shutdown_detection_workers(self):
+        """Beendet den Thread-Pool für nebenläufige Erkennung, falls vorhanden."""
+        if self._detection_executor is not None:
+            self._detection_executor.shutdown(wait=True)
+            self._detection_executor = None
+    
+    def detect_objects_batch(self, images: List[np.ndarray], batch_size: int = 8) -> List[List[Dict[str, Any]]]:
+        """Erkennt Objekte in mehreren Bildern mit gebündelten Netzwerkaufrufen.
+        
+        Die Bilder werden in Batches zu je `batch_size` Bildern mit
+        cv2.dnn.blobFromImages zu einem Blob zusammengefasst, sodass pro Batch
+        nur ein forward()-Aufruf anfällt. Die Netzausgabe wird anschließend
+        wieder pro Bild aufgeteilt.
+        
+        Args:
+            images: Liste von Eingabebildern als NumPy-Arrays
+            batch_size: Maximale Anzahl Bilder pro Netzwerkaufruf
+            
+        Returns:
+            Liste mit einer Detektionsliste pro Eingabebild (gleiche Reihenfolge)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size muss mindestens 1 sein, erhalten: {batch_size}")
+        
+        if self.object_detector is None:
+            self.logger.error("Objektdetektor nicht initialisiert")
+            return [[] for _ in images]
+        
+        blob_params = self._get_blob_params()
+        if blob_params is None:
+            self.logger.error(f"Nicht unterstützter Modelltyp für Objekterkennung: {self.detection_model_type}")
+            return [[] for _ in images]
+        
+        is_yolo = self.detection_model_type.lower() == "yolo"
+        results = []
+        
+        for start in range(0, len(images), batch_size):
+            batch = images[start:start + batch_size]
+            blob = cv2.dnn.blobFromImages(batch, **blob_params)
+            
+            with self._acquire_detector() as net:
+                net.setInput(blob)
+                outputs = net.forward(self.output_layers) if is_yolo else net.forward()
+            
+            if is_yolo:
+                for index, image in enumerate(batch):
+                    height, width = image.shape[:2]
+                    image_outputs = [self._split_yolo_batch_output(output, index, len(batch)) for output in outputs]
+                    results.append(self._process_yolo_detections(image_outputs, width, height))
+            else:
+                detections = outputs
+                # SSD/Faster R-CNN liefern alle Detektionen des Batches in einem
+                # Tensor; Spalte 0 enthält den Index des zugehörigen Bildes
+                image_ids = detections[0, 0, :, 0]
+                for index, image in enumerate(batch):
+                    height, width = image.shape[:2]
+                    image_detections = detections[:, :, image_ids == index, :]
+                    results.append(self._process_ssd_detections(image_detections, width, height))
+        
+        return results
+    
+    def _get_blob_params(self) -> Optional[Dict[str, Any]]:
+        """Liefert die Parameter für blobFromImage(s) passend zum Modelltyp.
         
-        # Verwende GPU, falls konfiguriert und verfügbar
-        if self.enable_gpu:
-            self.object_detector.setPreferableBackend(cv2.dnn.DNN_BACKEND_CUDA)
-            self.object_detector.setPreferableTarget(cv2.dnn.DNN_TARGET_CUDA)
+        Returns:
+            Dict mit Blob-Parametern oder None bei nicht unterstütztem Modelltyp
+        """
+        model_type = self.detection_model_type.lower()
         
-        self.logger.info("Faster R-CNN Modell initialisiert")
+        if model_type == "yolo":
+            return {"scalefactor": 1/255.0, "size": (416, 416), "swapRB": True, "crop": False}
+        elif model_type in ["ssd", "faster_rcnn"]:
+            return {"scalefactor": 1.0, "size": (300, 300), "swapRB": True, "crop": False}
+        
+        return None
     
-    def detect_objects(self, image: np.ndarray) -> List[Dict[str, Any]]:
-        """Erkennt Objekte im Bild mit dem konfigurierten Objekterkennungsmodell.
+    @staticmethod
+    def _split_yolo_batch_output(output: np.ndarray, index: int, batch_length: int) -> np.ndarray:
+        """Extrahiert die YOLO-Ausgabe eines einzelnen Bildes aus einer Batch-Ausgabe.
         
         Args:
-            image: Eingabebild als NumPy-Array
+            output: Ausgabe eines YOLO-Output-Layers für den gesamten Batch
+            index: Index des Bildes im Batch
+            batch_length: Anzahl der Bilder im Batch
             
         Returns:
-            Liste von erkannten Objekten mit Details (Klasse, Konfidenz, Position)
+            Zweidimensionale Ausgabe (Kandidaten x Attribute) für das Bild
         """
-        if self.object_detector is None:
-            self.logger.error("Objektdetektor nicht initialisiert")
-            return []
+        if batch_length == 1 and output.ndim == 2:
+            return output
         
-        height, width, _ = image.shape
+        if output.ndim == 3:
+            return output[index]
         
-        # Vorverarbeitung des Bildes je nach Modelltyp
-        if self.detection_model_type.lower() == "yolo":
-            blob = cv2.dnn.blobFromImage(image, 1/255.0, (416, 416), swapRB=True, crop=False)
-            self.object_detector.setInput(blob)
-            detections = self.object_detector.forward(self.output_layers)
-            return self._process_yolo_detections(detections, width, height)
-        elif self.detection_model_type.lower() in ["ssd", "faster_rcnn"]:
-            blob = cv2.dnn.blobFromImage(image, size=(300, 300), swapRB=True, crop=False)
-            self.object_detector.setInput(blob)
-            detections = self.object_detector.forward()
-            return self._process_ssd_detections(detections, width, height)
-        else:
-            self.logger.error(f"Nicht unterstützter Modelltyp für Objekterkennung: {self.detection_model_type}")
-            return []
+        # Ältere OpenCV-Versionen hängen die Zeilen aller Bilder aneinander
+        return output.reshape(batch_length, -1, output.shape[-1])[index]
     
     def _process_yolo_detections(self, detections, width, height) -> List[Dict[str, Any]]:
         """Verarbeitet die YOLO-Detektionsergebnisse.
         
+        Alle Output-Layer werden zu einem Array zusammengefügt und vollständig
+        vektorisiert gefiltert; anschließend folgt ein einzelner NMS-Aufruf.
+        Der NMS-Modus wird über `nms_mode` gesteuert ("class_agnostic" oder
+        "per_class").
+        
         Args:
             detections: Rohausgabe des YOLO-Netzwerks
             width: Bildbreite
@@ -188,54 +2460,55 @@ class ComputerVisionModule:
         Returns:
             Liste der erkannten Objekte mit Details
         """
-        boxes = []
-        confidences = []
-        class_ids = []
+        if len(detections) == 0:
+            return []
         
-        # Verarbeite alle Detektionen
-        for output in detections:
-            for detection in output:
-                scores = detection[5:]
-                class_id = np.argmax(scores)
-                confidence = scores[class_id]
-                
-                if confidence > self.confidence_threshold:
-                    # Objektkoordinaten
-                    center_x = int(detection[0] * width)
-                    center_y = int(detection[1] * height)
-                    w = int(detection[2] * width)
-                    h = int(detection[3] * height)
-                    
-                    # Rechteckkoordinaten
-                    x = int(center_x - w / 2)
-                    y = int(center_y - h / 2)
-                    
-                    boxes.append([x, y, w, h])
-                    confidences.append(float(confidence))
-                    class_ids.append(class_id)
+        # Verbinde alle Output-Layer zu einem (Kandidaten x Attribute)-Array
+        outputs = np.concatenate([output.reshape(-1, output.shape[-1]) for output in detections], axis=0)
+        
+        # Filtere Kandidaten über ihre maximale Klassenkonfidenz
+        scores = outputs[:, 5:]
+        max_scores = scores.max(axis=1)
+        mask = max_scores > self.confidence_threshold
+        
+        if not mask.any():
+            return []
+        
+        candidates = outputs[mask]
+        confidences = max_scores[mask]
+        class_ids = np.argmax(scores[mask], axis=1)
+        
+        # Objektkoordinaten (Abschneiden wie int() in Richtung Null)
+        center_x = (candidates[:, 0] * width).astype(np.int64)
+        center_y = (candidates[:, 1] * height).astype(np.int64)
+        w = (candidates[:, 2] * width).astype(np.int64)
+        h = (candidates[:, 3] * height).astype(np.int64)
+        
+        # Rechteckkoordinaten
+        x = (center_x - w / 2).astype(np.int64)
+        y = (center_y - h / 2).astype(np.int64)
+        boxes = np.stack([x, y, w, h], axis=1)
         
         # Verwende Non-Maximum Suppression, um überlappende Boxen zu eliminieren
-        indices = cv2.dnn.NMSBoxes(boxes, confidences, self.confidence_threshold, 0.4)
+        indices = self._apply_nms(boxes, confidences, class_ids)
+        
+        if len(indices) == 0:
+            return []
+        
+        selected = boxes[indices]
+        # Stelle sicher, dass die Koordinaten innerhalb des Bildes liegen
+        selected[:, :2] = np.maximum(selected[:, :2], 0)
         
         results = []
-        for i in indices:
-            if isinstance(i, list):  # Kompatibilität mit älteren OpenCV-Versionen
-                i = i[0]
-            
-            box = boxes[i]
-            x, y, w, h = box
-            
-            # Stelle sicher, dass die Koordinaten innerhalb des Bildes liegen
-            x = max(0, x)
-            y = max(0, y)
-            
-            class_id = class_ids[i]
+        for (x, y, w, h), class_id, confidence in zip(selected.tolist(),
+                                                      class_ids[indices].tolist(),
+                                                      confidences[indices].tolist()):
             class_name = self.classes[class_id] if class_id < len(self.classes) else f"unknown_{class_id}"
             
             results.append({
                 "class_id": class_id,
                 "class_name": class_name,
-                "confidence": confidences[i],
+                "confidence": confidence,
                 "box": {
                     "x": x,
                     "y": y,
@@ -246,6 +2519,41 @@ class ComputerVisionModule:
         
         return results
     
+    def _apply_nms(self, boxes: np.ndarray, confidences: np.ndarray, class_ids: np.ndarray) -> np.ndarray:
+        """Führt Non-Maximum Suppression in einem einzigen Aufruf aus.
+        
+        Args:
+            boxes: Boxen als (N, 4)-Array im Format (x, y, Breite, Höhe)
+            confidences: Konfidenzen als (N,)-Array
+            class_ids: Klassen-IDs als (N,)-Array
+            
+        Returns:
+            Indizes der verbleibenden Boxen, absteigend nach Konfidenz
+        """
+        nms_mode = self.config.get("nms_mode", "class_agnostic")
+        nms_threshold = self.config.get("nms_threshold", 0.4)
+        scores = confidences.astype(np.float32)
+        
+        if nms_mode == "per_class":
+            if hasattr(cv2.dnn, "NMSBoxesBatched"):
+                indices = cv2.dnn.NMSBoxesBatched(boxes.astype(np.int32), scores, class_ids.astype(np.int32),
+                                                  self.confidence_threshold, nms_threshold)
+            else:
+                # Fallback: verschiebe Boxen je Klasse, damit sich Klassen nie überlappen
+                span = int((boxes[:, :2] + boxes[:, 2:]).max() - boxes[:, :2].min()) + 1
+                offsets = class_ids.astype(np.int64) * span
+                shifted = boxes.copy()
+                shifted[:, 0] += offsets
+                shifted[:, 1] += offsets
+                indices = cv2.dnn.NMSBoxes(shifted.astype(np.int32), scores, self.confidence_threshold, nms_threshold)
+        else:
+            if nms_mode != "class_agnostic":
+                self.logger.warning(f"Unbekannter NMS-Modus {nms_mode}, verwende class_agnostic")
+            indices = cv2.dnn.NMSBoxes(boxes.astype(np.int32), scores, self.confidence_threshold, nms_threshold)
+        
+        # Kompatibilität mit älteren OpenCV-Versionen, die (N, 1)-Arrays liefern
+        return np.asarray(indices, dtype=np.int64).reshape(-1)
+    
     def _process_ssd_detections(self, detections, width, height) -> List[Dict[str, Any]]:
         """Verarbeitet SSD- oder Faster R-CNN-Detektionsergebnisse.
         
@@ -366,15 +2674,19 @@ class ComputerVisionModule:
         
         # Generiere eine ID für das Objekt, falls nicht angegeben
         if object_id is None:
-            object_id = f"track_{int(time.time())}_{len(self.active_trackers)}"
+            object_id = f"track_{int(time.time())}_{next(self._track_counter)}"
         
         # Erstelle einen geeigneten Tracker
         tracker = self._create_tracker(tracker_type)
         
         # Initialisiere den Tracker mit dem Bild und der ROI
-        bbox = roi  # (x, y, width, height)
+        bbox = tuple(int(v) for v in roi)  # (x, y, width, height)
         success = tracker.init(image, bbox)
         
+        # Seit OpenCV 4.5.1 liefert init() kein Ergebnis mehr, sondern wirft bei Fehlern
+        if success is None:
+            success = True
+        
         if success:
             # Speichere den aktiven Tracker
             self.active_trackers[object_id] = {
@@ -383,14 +2695,13 @@ class ComputerVisionModule:
                 "last_position": bbox,
                 "created_at": datetime.now(),
                 "last_updated": datetime.now(),
-                "frames_tracked": 1
+                "frames_tracked": 1,
+                "misses": 0
             }
             
-            # Initialisiere Tracking-Historie
-            self.tracked_objects[object_id] = {
-                "positions": [bbox],
-                "timestamps": [datetime.now()]
-            }
+            # Initialisiere Tracking-Historie und entferne abgelaufene Historien
+            self.tracked_objects.start(object_id, bbox)
+            self.tracked_objects.evict_expired()
             
             self.logger.info(f"Tracking initialisiert für Objekt {object_id} mit Tracker {tracker_type}")
             return object_id
@@ -402,14 +2713,20 @@ class ComputerVisionModule:
         """Erstellt einen Tracker des angegebenen Typs.
         
         Args:
-            tracker_type: Art des Trackers (CSRT, KCF, BOOSTING, MIL, TLD, MEDIANFLOW, MOSSE)
+            tracker_type: Art des Trackers (CSRT, KCF, BOOSTING, MIL, TLD, MEDIANFLOW, MOSSE
+                oder SORT für bewegungsbasiertes Kalman-Tracking ohne Bildkorrelation)
             
         Returns:
-            OpenCV-Tracker-Objekt
+            OpenCV-Tracker-Objekt bzw. KalmanTrackHandle
         """
         tracker_type = tracker_type.upper()
         
-        if tracker_type == 'CSRT':
+        if tracker_type in ('SORT', 'KALMAN'):
+            # Alle bewegungsbasierten Tracks teilen sich eine vektorisierte Bank
+            if self._motion_tracker_bank is None:
+                self._motion_tracker_bank = KalmanBoxTrackerBank()
+            return KalmanTrackHandle(self._motion_tracker_bank)
+        elif tracker_type == 'CSRT':
             return cv2.TrackerCSRT_create()
         elif tracker_type == 'KCF':
             return cv2.TrackerKCF_create()
@@ -427,12 +2744,16 @@ class ComputerVisionModule:
             self.logger.warning(f"Unbekannter Tracker-Typ {tracker_type}, verwende CSRT")
             return cv2.TrackerCSRT_create()
     
-    def update_tracking(self, image: np.ndarray, object_id: str) -> Optional[Tuple[bool, Tuple]]:
+    def update_tracking(self, image: np.ndarray, object_id: str,
+                        frame_id: float = None) -> Optional[Tuple[bool, Tuple]]:
         """Aktualisiert das Tracking für ein bestimmtes Objekt.
         
         Args:
             image: Neues Bild für das Tracking-Update
             object_id: ID des zu trackenden Objekts
+            frame_id: Aufsteigende Frame-Nummer oder Zeitstempel des Bildes; SORT-Tracks
+                werden nur bei einem neuen Wert fortgeschrieben (None = neuer Frame, sobald
+                dieser Track im aktuellen Frame bereits aktualisiert wurde)
             
         Returns:
             Tuple mit (Erfolg, Begrenzungsrahmen) oder None bei ungültiger ID
@@ -442,11 +2763,48 @@ class ComputerVisionModule:
             return None
         
         # Hole aktiven Tracker
-        tracker_info = self.active_trackers[object_id]
-        tracker = tracker_info["tracker"]
+        tracker = self.active_trackers[object_id]["tracker"]
+        
+        if isinstance(tracker, KalmanTrackHandle):
+            # Frame-Nummern laufen immer über die Modul-Uhr, damit update_trackers()
+            # und einzelne Aufrufe die gemeinsame Bank nicht gegeneinander verschieben
+            if frame_id is None:
+                if tracker.frame_id >= self._tracking_frame:
+                    frame_id = self._next_tracking_frame()
+                else:
+                    frame_id = self._tracking_frame
+            else:
+                self._tracking_frame = max(self._tracking_frame, frame_id)
         
         # Update Tracker mit neuem Frame
-        success, bbox = tracker.update(image)
+        success, bbox = self._update_tracker(tracker, image, frame_id)
+        
+        return self._record_tracking_update(object_id, success, bbox)
+    
+    def _next_tracking_frame(self) -> float:
+        """Schaltet die Frame-Uhr des Trackings um einen Frame weiter."""
+        self._tracking_frame += 1
+        return self._tracking_frame
+    
+    @staticmethod
+    def _update_tracker(tracker, image: np.ndarray, frame_id: Optional[float]):
+        """Ruft update() auf; Kalman-Handles erhalten zusätzlich die Frame-Nummer."""
+        if isinstance(tracker, KalmanTrackHandle):
+            return tracker.update(image, frame_id)
+        return tracker.update(image)
+    
+    def _record_tracking_update(self, object_id: str, success: bool, bbox) -> Tuple[bool, Optional[Tuple]]:
+        """Übernimmt das Ergebnis eines Tracker-Updates in Status und Historie.
+        
+        Args:
+            object_id: ID des Tracking-Objekts
+            success: Ob der Tracker das Objekt gefunden hat
+            bbox: Neuer Begrenzungsrahmen
+            
+        Returns:
+            Tuple mit (Erfolg, Begrenzungsrahmen)
+        """
+        tracker_info = self.active_trackers[object_id]
         
         if success:
             # Update Tracking-Informationen
@@ -455,13 +2813,71 @@ class ComputerVisionModule:
             tracker_info["frames_tracked"] += 1
             
             # Speichere Position in Historie
-            self.tracked_objects[object_id]["positions"].append(bbox)
-            self.tracked_objects[object_id]["timestamps"].append(datetime.now())
+            self.tracked_objects.append(object_id, bbox)
             
             return (success, bbox)
         else:
             return (False, None)
     
+    def _update_all_trackers(self, image: np.ndarray) -> List[Tuple[str, Tuple[bool, Optional[Tuple]]]]:
+        """Aktualisiert alle aktiven Tracker, bei `tracking_workers` > 1 parallel.
+        
+        OpenCV gibt den GIL während tracker.update() frei, daher werden die
+        Updates in zusammenhängenden Blöcken auf einen persistenten Thread-Pool
+        verteilt. Die Ergebnisse werden anschließend in der Reihenfolge von
+        active_trackers übernommen, sodass das Ergebnis deterministisch bleibt.
+        
+        Args:
+            image: Neues Bild für das Tracking-Update
+            
+        Returns:
+            Liste von (Objekt-ID, (Erfolg, Begrenzungsrahmen)) in Tracker-Reihenfolge
+        """
+        object_ids = list(self.active_trackers.keys())
+        frame_id = self._next_tracking_frame()
+        
+        if self.tracking_workers <= 1 or len(object_ids) < 2:
+            return [(object_id, self.update_tracking(image, object_id, frame_id)) for object_id in object_ids]
+        
+        trackers = [self.active_trackers[object_id]["tracker"] for object_id in object_ids]
+        chunk_size = -(-len(trackers) // self.tracking_workers)
+        chunks = [trackers[i:i + chunk_size] for i in range(0, len(trackers), chunk_size)]
+        
+        executor = self._get_tracking_executor()
+        raw_results = []
+        def update_chunk(chunk):
+            return [self._update_tracker(tracker, image, frame_id) for tracker in chunk]
+        
+        for chunk_results in executor.map(update_chunk, chunks):
+            raw_results.extend(chunk_results)
+        
+        return [
+            (object_id, self._record_tracking_update(object_id, success, bbox))
+            for object_id, (success, bbox) in zip(object_ids, raw_results)
+        ]
+    
+    def _get_tracking_executor(self) -> ThreadPoolExecutor:
+        """Liefert den persistenten Thread-Pool für Tracker-Updates."""
+        if self._tracking_executor is None:
+            self._tracking_executor = ThreadPoolExecutor(max_workers=self.tracking_workers,
+                                                         thread_name_prefix="vision-tracking")
+        return self._tracking_executor
+    
+    def set_tracking_workers(self, workers: int):
+        """Ändert die Anzahl der Threads für parallele Tracker-Updates.
+        
+        Args:
+            workers: Anzahl der Threads (0 oder 1 = seriell)
+        """
+        self.shutdown_tracking_workers()
+        self.tracking_workers = workers
+    
+    def shutdown_tracking_workers(self):
+        """Beendet den Thread-Pool für Tracker-Updates, falls vorhanden."""
+        if self._tracking_executor is not None:
+            self._tracking_executor.shutdown(wait=True)
+            self._tracking_executor = None
+    
     def stop_tracking(self, object_id: str) -> bool:
         """Beendet das Tracking für ein Objekt.
         
@@ -473,7 +2889,13 @@ class ComputerVisionModule:
         """
         if object_id in self.active_trackers:
             # Entferne aktiven Tracker, aber behalte die Historie
-            del self.active_trackers[object_id]
+            tracker = self.active_trackers.pop(object_id)["tracker"]
+            if hasattr(tracker, "release"):
+                tracker.release()
+            
+            # Die Historie bleibt bis zum Ablauf der TTL erhalten
+            self.tracked_objects.mark_stopped(object_id)
+            self.tracked_objects.evict_expired()
             self.logger.info(f"Tracking gestoppt für Objekt {object_id}")
             return True
         else:
@@ -489,14 +2911,32 @@ class ComputerVisionModule:
             track_classes: Optionale Liste von Klassen, die getrackt werden sollen (None = alle)
             min_confidence: Minimale Konfidenz für Tracking, überschreibt die Standardeinstellung
             
+        Returns:
+            Dict mit erkannten Objekten und Tracking-IDs
+        """
+        # Erkenne Objekte im Bild
+        detections = self.detect_objects(image)
+        
+        return self.track_detections(image, detections, track_classes, min_confidence)
+    
+    def track_detections(self, image: np.ndarray, detections: List[Dict[str, Any]],
+                         track_classes: List[str] = None, min_confidence: float = None) -> Dict[str, Any]:
+        """Startet Tracking für bereits erkannte Objekte und aktualisiert bestehende Trackings.
+        
+        Args:
+            image: Bild, zu dem die Detektionen gehören
+            detections: Detektionen von detect_objects()
+            track_classes: Optionale Liste von Klassen, die getrackt werden sollen (None = alle)
+            min_confidence: Minimale Konfidenz für Tracking, überschreibt die Standardeinstellung
+            
         Returns:
             Dict mit erkannten Objekten und Tracking-IDs
         """
         if min_confidence is None:
             min_confidence = self.confidence_threshold
         
-        # Erkenne Objekte im Bild
-        detections = self.detect_objects(image)
+        if self.tracking_mode == "associate":
+            return self._associate_and_track(image, detections, track_classes, min_confidence)
         
         # Ergebnisse für das Tracking
         results = {
@@ -521,7 +2961,7 @@ class ComputerVisionModule:
                 continue
             
             # Erstelle eine ID basierend auf Klasse und Zeitstempel
-            object_id = f"{class_name}_{int(time.time())}_{len(self.active_trackers)}"
+            object_id = f"{class_name}_{int(time.time())}_{next(self._track_counter)}"
             
             # Starte Tracking für dieses Objekt
             tracking_id = self.initialize_tracking(image, bbox_tuple, object_id=object_id)
@@ -535,32 +2975,279 @@ class ComputerVisionModule:
                 })
         
         # Update bestehende Trackings
-        for object_id in list(self.active_trackers.keys()):
-            tracking_result = self.update_tracking(image, object_id)
+        results["tracking_updated"] = self.update_trackers(image)
+        
+        return results
+    
+    def _associate_and_track(self, image: np.ndarray, detections: List[Dict[str, Any]],
+                             track_classes: Optional[List[str]], min_confidence: float) -> Dict[str, Any]:
+        """Ordnet Detektionen bestehenden Tracks zu (tracking_mode "associate").
+        
+        Alle Tracks werden zuerst mit dem Frame fortgeschrieben, dann über eine
+        vektorisierte IoU-Matrix mit den Detektionen gleicher Klasse abgeglichen
+        (Tracks ohne `class_name` mit Detektionen jeder Klasse).
+        Nur nicht zugeordnete Detektionen starten neue Tracker; Tracks ohne
+        Zuordnung sammeln Fehlversuche und werden nach `max_track_misses`
+        beendet. Der Aufwand pro Frame hängt so nur von der Objektanzahl ab.
+        
+        Args:
+            image: Bild, zu dem die Detektionen gehören
+            detections: Detektionen von detect_objects()
+            track_classes: Optionale Liste von Klassen, die getrackt werden sollen
+            min_confidence: Minimale Konfidenz für Tracking
+            
+        Returns:
+            Dict mit erkannten Objekten, gestarteten, aktualisierten und beendeten Tracks
+        """
+        results = {
+            "detections": detections,
+            "tracking_started": [],
+            "tracking_updated": [],
+            "tracking_lost": []
+        }
+        
+        candidates = [
+            detection for detection in detections
+            if (track_classes is None or detection["class_name"] in track_classes)
+            and detection["confidence"] >= min_confidence
+        ]
+        
+        # Schreibe alle Tracks fort; erfolglose Updates behalten ihre letzte Position
+        track_ids = list(self.active_trackers.keys())
+        track_boxes = np.zeros((len(track_ids), 4), dtype=np.float64)
+        track_ok = np.zeros(len(track_ids), dtype=bool)
+        for index, (object_id, tracking_result) in enumerate(self._update_all_trackers(image)):
+            if tracking_result and tracking_result[0]:
+                track_boxes[index] = tracking_result[1]
+                track_ok[index] = True
+            else:
+                track_boxes[index] = self.active_trackers[object_id]["last_position"]
+        
+        detection_boxes = np.array(
+            [[d["box"]["x"], d["box"]["y"], d["box"]["width"], d["box"]["height"]] for d in candidates],
+            dtype=np.float64
+        ).reshape(-1, 4)
+        
+        iou = self._iou_matrix(track_boxes, detection_boxes)
+        
+        # Nur Objekte derselben Klasse dürfen einander zugeordnet werden; manuell
+        # über initialize_tracking angelegte Tracks ohne Klasse passen zu jeder
+        if iou.size:
+            track_classes_arr = np.array([self.active_trackers[t].get("class_name") or "" for t in track_ids])
+            detection_classes_arr = np.array([d["class_name"] for d in candidates])
+            class_mismatch = track_classes_arr[:, None] != detection_classes_arr[None, :]
+            class_mismatch[track_classes_arr == ""] = False
+            iou[class_mismatch] = 0.0
+        
+        matches, unmatched_tracks, unmatched_detections = self._match_iou(iou, self.association_iou_threshold)
+        
+        # Kalman-Tracks werden gemeinsam in einem vektorisierten Schritt korrigiert
+        kalman_matches = [
+            (track_index, detection_index) for track_index, detection_index in matches
+            if isinstance(self.active_trackers[track_ids[track_index]]["tracker"], KalmanTrackHandle)
+        ]
+        if kalman_matches:
+            slots = [self.active_trackers[track_ids[t]]["tracker"].slot for t, _ in kalman_matches]
+            corrected = self._motion_tracker_bank.update(slots, detection_boxes[[d for _, d in kalman_matches]])
+            for (track_index, _), box in zip(kalman_matches, corrected):
+                track_boxes[track_index] = box
+                self.active_trackers[track_ids[track_index]]["last_position"] = tuple(box.tolist())
+        kalman_tracks = {track_index for track_index, _ in kalman_matches}
+        
+        for track_index, detection_index in matches:
+            object_id = track_ids[track_index]
+            detection = candidates[detection_index]
+            tracker_info = self.active_trackers[object_id]
+            tracker_info["misses"] = 0
+            tracker_info["confidence"] = detection["confidence"]
+            
+            # Korrigiere abgedriftete Tracker auf die Detektion
+            if track_index not in kalman_tracks and iou[track_index, detection_index] < self.reinit_iou_threshold:
+                box = tuple(int(v) for v in detection_boxes[detection_index])
+                self._reinitialize_tracker(image, object_id, box)
+                track_boxes[track_index] = box
+            
+            results["tracking_updated"].append(self._tracking_entry(object_id, track_boxes[track_index]))
+        
+        for track_index in unmatched_tracks:
+            object_id = track_ids[track_index]
+            tracker_info = self.active_trackers[object_id]
+            tracker_info["misses"] += 1
+            
+            if tracker_info["misses"] > self.max_track_misses:
+                self.stop_tracking(object_id)
+                results["tracking_lost"].append(object_id)
+            elif track_ok[track_index]:
+                results["tracking_updated"].append(self._tracking_entry(object_id, track_boxes[track_index]))
+        
+        for detection_index in unmatched_detections:
+            detection = candidates[detection_index]
+            class_name = detection["class_name"]
+            bbox_tuple = tuple(int(v) for v in detection_boxes[detection_index])
+            object_id = f"{class_name}_{int(time.time())}_{next(self._track_counter)}"
+            
+            tracking_id = self.initialize_tracking(image, bbox_tuple, object_id=object_id)
+            
+            if tracking_id:
+                self.active_trackers[tracking_id]["class_name"] = class_name
+                self.active_trackers[tracking_id]["confidence"] = detection["confidence"]
+                results["tracking_started"].append({
+                    "object_id": tracking_id,
+                    "class_name": class_name,
+                    "confidence": detection["confidence"],
+                    "initial_bbox": detection["box"]
+                })
+                results["tracking_updated"].append(self._tracking_entry(tracking_id, bbox_tuple))
+        
+        return results
+    
+    def _reinitialize_tracker(self, image: np.ndarray, object_id: str, bbox: Tuple[int, int, int, int]):
+        """Setzt den Tracker eines bestehenden Tracks auf einen neuen Begrenzungsrahmen."""
+        tracker_info = self.active_trackers[object_id]
+        if hasattr(tracker_info["tracker"], "release"):
+            tracker_info["tracker"].release()
+        tracker = self._create_tracker(tracker_info["type"])
+        tracker.init(image, bbox)
+        tracker_info["tracker"] = tracker
+        tracker_info["last_position"] = bbox
+    
+    @staticmethod
+    def _tracking_entry(object_id: str, bbox) -> Dict[str, Any]:
+        """Erzeugt einen Eintrag für "tracking_updated"."""
+        return {
+            "object_id": object_id,
+            "bbox": {
+                "x": int(bbox[0]),
+                "y": int(bbox[1]),
+                "width": int(bbox[2]),
+                "height": int(bbox[3])
+            }
+        }
+    
+    @staticmethod
+    def _iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+        """Berechnet die IoU aller Boxpaare vektorisiert.
+        
+        Args:
+            boxes_a: (N, 4)-Array im Format (x, y, Breite, Höhe)
+            boxes_b: (M, 4)-Array im Format (x, y, Breite, Höhe)
+            
+        Returns:
+            (N, M)-Matrix mit IoU-Werten
+        """
+        if len(boxes_a) == 0 or len(boxes_b) == 0:
+            return np.zeros((len(boxes_a), len(boxes_b)), dtype=np.float64)
+        
+        a = boxes_a[:, None, :]
+        b = boxes_b[None, :, :]
+        
+        inter_w = np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2]) - np.maximum(a[..., 0], b[..., 0])
+        inter_h = np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3]) - np.maximum(a[..., 1], b[..., 1])
+        intersection = np.clip(inter_w, 0, None) * np.clip(inter_h, 0, None)
+        
+        union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - intersection
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+    
+    def _match_iou(self, iou: np.ndarray, threshold: float) -> Tuple[List[Tuple[int, int]], List[int], List[int]]:
+        """Ordnet Zeilen (Tracks) und Spalten (Detektionen) anhand einer IoU-Matrix zu.
+        
+        Verwendet die Ungarische Methode (scipy), falls `association_method`
+        "hungarian" ist und scipy verfügbar ist, sonst eine gierige Zuordnung
+        nach absteigender IoU.
+        
+        Args:
+            iou: (Tracks, Detektionen)-Matrix mit IoU-Werten
+            threshold: Minimale IoU für eine gültige Zuordnung
+            
+        Returns:
+            Tuple aus (Zuordnungen, nicht zugeordnete Tracks, nicht zugeordnete Detektionen)
+        """
+        num_tracks, num_detections = iou.shape
+        matches = []
+        
+        if num_tracks and num_detections:
+            linear_sum_assignment = None
+            if self.association_method == "hungarian":
+                try:
+                    from scipy.optimize import linear_sum_assignment
+                except ImportError:
+                    linear_sum_assignment = None
+            
+            if linear_sum_assignment is not None:
+                rows, cols = linear_sum_assignment(-iou)
+                matches = [(int(r), int(c)) for r, c in zip(rows, cols) if iou[r, c] >= threshold]
+            else:
+                # Gierig: Paare nach absteigender IoU, jede Zeile/Spalte höchstens einmal
+                rows, cols = np.nonzero(iou >= threshold)
+                order = np.argsort(-iou[rows, cols], kind="stable")
+                used_rows = np.zeros(num_tracks, dtype=bool)
+                used_cols = np.zeros(num_detections, dtype=bool)
+                for r, c in zip(rows[order].tolist(), cols[order].tolist()):
+                    if not used_rows[r] and not used_cols[c]:
+                        used_rows[r] = used_cols[c] = True
+                        matches.append((r, c))
+        
+        matched_rows = {r for r, _ in matches}
+        matched_cols = {c for _, c in matches}
+        unmatched_tracks = [r for r in range(num_tracks) if r not in matched_rows]
+        unmatched_detections = [c for c in range(num_detections) if c not in matched_cols]
+        
+        return matches, unmatched_tracks, unmatched_detections
+    
+    def update_trackers(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Aktualisiert alle aktiven Trackings mit einem neuen Frame.
+        
+        Fehlgeschlagene Trackings werden beendet.
+        
+        Args:
+            image: Neues Bild für das Tracking-Update
             
+        Returns:
+            Liste der erfolgreich aktualisierten Objekte mit Begrenzungsrahmen
+        """
+        updated = []
+        
+        for object_id, tracking_result in self._update_all_trackers(image):
             if tracking_result:
                 success, bbox = tracking_result
                 
                 if success:
-                    results["tracking_updated"].append({
-                        "object_id": object_id,
-                        "bbox": {
-                            "x": int(bbox[0]),
-                            "y": int(bbox[1]),
-                            "width": int(bbox[2]),
-                            "height": int(bbox[3])
-                        }
-                    })
+                    updated.append(self._tracking_entry(object_id, bbox))
+                elif self.tracking_mode == "associate":
+                    # Im Zuordnungsmodus zählt ein Fehlschlag als Fehlversuch
+                    tracker_info = self.active_trackers[object_id]
+                    tracker_info["misses"] += 1
+                    if tracker_info["misses"] > self.max_track_misses:
+                        self.stop_tracking(object_id)
                 else:
                     # Tracking fehlgeschlagen, entferne es
                     self.stop_tracking(object_id)
         
-        return results
+        return updated
+    
+    def trajectory_snapshot(self, object_ids: List[str], last: int = 20) -> Dict[str, np.ndarray]:
+        """Kopiert die letzten Positionen mehrerer Tracks.
+        
+        Die Kopie kann gefahrlos an einen anderen Thread übergeben werden,
+        während das Tracking die Historien weiterschreibt.
+        
+        Args:
+            object_ids: IDs der Tracks
+            last: Anzahl der Positionen pro Track
+            
+        Returns:
+            Dict mit (n, 4)-Positionsarrays je vorhandener Objekt-ID
+        """
+        return {
+            object_id: self.tracked_objects.positions(object_id, last=last).copy()
+            for object_id in object_ids if object_id in self.tracked_objects
+        }
     
     def annotate_tracked_objects(self, image: np.ndarray, 
                                 tracking_results: Dict[str, Any],
                                 show_ids: bool = True,
-                                show_trajectories: bool = False) -> np.ndarray:
+                                show_trajectories: bool = False,
+                                trajectories: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
         """Zeichnet getrackte Objekte in ein Bild ein.
         
         Args:
@@ -568,6 +3255,8 @@ class ComputerVisionModule:
             tracking_results: Ergebnisse von detect_and_track()
             show_ids: Ob Objekt-IDs angezeigt werden sollen
             show_trajectories: Ob Bewegungstrajektorien angezeigt werden sollen
+            trajectories: Positionen aus trajectory_snapshot(), wenn in einem anderen
+                Thread als dem Tracking annotiert wird (None = tracked_objects lesen)
             
         Returns:
             Annotiertes Bild
@@ -602,18 +3291,21 @@ class ComputerVisionModule:
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
             
             # Zeichne Trajektorie wenn gewünscht und verfügbar
-            if show_trajectories and object_id in self.tracked_objects:
-                positions = self.tracked_objects[object_id]["positions"]
+            positions = None
+            if show_trajectories and trajectories is not None:
+                positions = trajectories.get(object_id)
+            elif show_trajectories and object_id in self.tracked_objects:
+                # Die letzten N Positionen (max. 20) als Sicht auf den Ringpuffer
+                positions = self.tracked_objects.positions(object_id, last=20)
+            
+            if positions is not None:
+                # Berechne Mittelpunkte für eine glattere Linie
+                centers = (positions[:, :2] + positions[:, 2:] / 2).astype(np.int32).tolist()
                 
-                # Zeichne die letzten N Positionen (max. 20)
-                n_positions = min(len(positions), 20)
+                n_positions = len(centers)
                 for i in range(1, n_positions):
-                    prev_pos = positions[-i-1]
-                    curr_pos = positions[-i]
-                    
-                    # Berechne Mittelpunkte für eine glattere Linie
-                    prev_center = (int(prev_pos[0] + prev_pos[2]/2), int(prev_pos[1] + prev_pos[3]/2))
-                    curr_center = (int(curr_pos[0] + curr_pos[2]/2), int(curr_pos[1] + curr_pos[3]/2))
+                    prev_center = tuple(centers[-i-1])
+                    curr_center = tuple(centers[-i])
                     
                     # Zeichne Linie mit abnehmender Dicke für ältere Positionen
                     thickness = max(1, 3 - i//5)
@@ -626,11 +3318,12 @@ class ComputerVisionModule:
         
         return output_image
     
-    def init_camera(self, camera_index: int = None, resolution: Tuple[int, int] = None) -> bool:
+    def init_camera(self, camera_index: Union[int, str] = None, resolution: Tuple[int, int] = None) -> bool:
         """Initialisiert eine Kamera für Live-Videoerfassung.
         
         Args:
-            camera_index: Index der zu verwendenden Kamera (0 = Standard)
+            camera_index: Index der zu verwendenden Kamera (0 = Standard) oder
+                Pfad zu einer Videodatei, die wie eine Kamera abgespielt wird
             resolution: Optionale Auflösung (Breite, Höhe)
             
         Returns:
@@ -640,6 +3333,7 @@ class ComputerVisionModule:
             self.camera_index = camera_index
         
         # Schließe vorherige Kamera, falls vorhanden
+        self.stop_async_capture()
         if self.camera is not None:
             self.camera.release()
         
@@ -659,6 +3353,9 @@ class ComputerVisionModule:
             
             self.logger.info(f"Kamera initialisiert: Index {self.camera_index}")
             
+            if self.config.get("async_capture", False):
+                self.start_async_capture()
+            
             return True
             
         except Exception as e:
@@ -667,17 +3364,76 @@ class ComputerVisionModule:
     
     def release_camera(self):
         """Gibt die Kameraressourcen frei."""
+        self.stop_async_capture()
+        
         if self.camera is not None:
             self.camera.release()
             self.camera = None
             self.logger.info("Kamera freigegeben")
     
+    def start_async_capture(self, source=None, buffer_size: int = None) -> bool:
+        """Startet die Frame-Erfassung in einem Hintergrund-Thread.
+        
+        Die Frames landen in einem Ringpuffer fester Größe; capture_frame()
+        liefert danach immer den neuesten Frame, ältere werden verworfen.
+        
+        Args:
+            source: Optionale Frame-Quelle mit read() -> (bool, Frame), z.B.
+                cv2.VideoCapture einer Videodatei; Standard ist die Kamera
+            buffer_size: Anzahl der vorallokierten Frames im Ringpuffer
+            
+        Returns:
+            True wenn die Erfassung läuft, False bei Fehler
+        """
+        if source is None:
+            if self.camera is None and not self.init_camera():
+                return False
+            source = self.camera
+        
+        self.stop_async_capture()
+        
+        if buffer_size is None:
+            buffer_size = self.capture_buffer_size
+        
+        self.async_capture = AsyncFrameCapture(source, buffer_size=buffer_size, logger=self.logger)
+        self.async_capture.start()
+        
+        self.logger.info(f"Asynchrone Frame-Erfassung gestartet (Puffer: {buffer_size} Frames)")
+        return True
+    
+    def stop_async_capture(self):
+        """Beendet die asynchrone Frame-Erfassung, falls aktiv."""
+        if self.async_capture is not None:
+            self.async_capture.stop()
+            self.async_capture = None
+            self.logger.info("Asynchrone Frame-Erfassung beendet")
+    
+    def get_capture_stats(self) -> Dict[str, Any]:
+        """Liefert Zähler der asynchronen Erfassung (FPS, verworfene Frames, Latenz).
+        
+        Returns:
+            Dict mit Erfassungsstatistiken oder leeres Dict ohne asynchrone Erfassung
+        """
+        if self.async_capture is None:
+            return {}
+        
+        return self.async_capture.get_stats()
+    
     def capture_frame(self) -> Optional[np.ndarray]:
         """Erfasst einen Frame von der initialisierten Kamera.
         
+        Bei aktiver asynchroner Erfassung wird der neueste Frame aus dem
+        Ringpuffer geliefert, statt synchron von der Kamera zu lesen.
+        
         Returns:
             Bild als NumPy-Array oder None bei Fehler
         """
+        if self.async_capture is not None:
+            frame = self.async_capture.read(timeout=self.capture_timeout)
+            if frame is None:
+                self.logger.error("Kein neuer Frame aus der asynchronen Erfassung verfügbar")
+            return frame
+        
         if self.camera is None:
             self.logger.error("Kamera nicht initialisiert")
             return None
@@ -690,6 +3446,45 @@ class ComputerVisionModule:
             self.logger.error("Fehler beim Erfassen eines Frames")
             return None
     
+    def create_live_pipeline(self, source=None, detection_interval: int = None,
+                             queue_size: int = None, **kwargs) -> LivePipeline:
+        """Erstellt eine mehrstufige Live-Pipeline (Erfassung, Detektion, Tracking, Annotation).
+        
+        Args:
+            source: Frame-Quelle, Pfad zu einer Videodatei oder None für die Kamera
+            detection_interval: Objekterkennung auf jedem N-ten Frame
+            queue_size: Kapazität der Queues zwischen den Stufen
+            **kwargs: Weitere Argumente für LivePipeline (track_classes, on_result, ...)
+            
+        Returns:
+            Nicht gestartete LivePipeline
+        """
+        if detection_interval is None:
+            detection_interval = self.config.get("detection_interval", 5)
+        if queue_size is None:
+            queue_size = self.config.get("pipeline_queue_size", 4)
+        if "frame_gate" not in kwargs:
+            kwargs["frame_gate"] = self.create_frame_gate()
+        
+        return LivePipeline(self, source=source, detection_interval=detection_interval,
+                            queue_size=queue_size, **kwargs)
+    
+    def create_frame_gate(self) -> Optional[FrameChangeGate]:
+        """Erstellt ein FrameChangeGate aus der Konfiguration.
+        
+        Returns:
+            FrameChangeGate oder None, wenn `frame_change_threshold` nicht gesetzt ist
+        """
+        threshold = self.config.get("frame_change_threshold", 0)
+        if not threshold:
+            return None
+        
+        return FrameChangeGate(
+            threshold=threshold,
+            thumbnail_size=tuple(self.config.get("frame_change_thumbnail", (32, 24))),
+            max_skip_frames=self.config.get("frame_change_max_skip", 30)
+        )
+    
     def detect_qr_barcodes(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Erkennt QR-Codes und Barcodes im Bild.
         
@@ -699,6 +3494,13 @@ class ComputerVisionModule:
         Returns:
             Liste der erkannten Codes mit Typ, Inhalt und Position
         """
+        if self.result_cache is not None:
+            key = self.result_cache.key("detect_qr_barcodes", image)
+            return self.result_cache.get_or_compute(key, lambda: self._detect_qr_barcodes_uncached(image))
+        return self._detect_qr_barcodes_uncached(image)
+    
+    def _detect_qr_barcodes_uncached(self, image: np.ndarray) -> List[Dict[str, Any]]:
+        """Führt die QR-/Barcode-Erkennung ohne Ergebnis-Cache aus."""
         results = []
         
         # OpenCV 4.5.1+ hat einen Barcode-Detektor
@@ -762,92 +3564,335 @@ class ComputerVisionModule:
         
         return results
     
-    def enhance_image_for_ocr(self, image: np.ndarray) -> np.ndarray:
+    def enhance_image_for_ocr(self, image: np.ndarray, profile: Optional[str] = None) -> np.ndarray:
         """Verbessert ein Bild speziell für OCR-Verarbeitung.
         
         Diese Methode wendet verschiedene OpenCV-Techniken an, um die Lesbarkeit
         von Text im Bild zu optimieren und die OCR-Genauigkeit zu verbessern.
+        Das Profil (siehe ENHANCEMENT_PROFILES) bestimmt, wie stark entrauscht wird:
+        "quality" nutzt Non-Local-Means in voller Auflösung, "balanced" auf
+        halber Auflösung und "fast" einen Median-/Gauß-Filter. "balanced" und
+        "fast" überspringen das Entrauschen bei sauberen Scans.
+        
+        "quality" binarisiert wie bisher mit festem Threshold-Abstand 2. Bei
+        "balanced" und "fast" wächst der Abstand mit dem geschätzten Rauschen
+        (2 + sigma, höchstens 12), was Störpixel im Hintergrund verrauschter
+        Scans unterdrückt.
         
         Args:
             image: Eingabebild
+            profile: Name des Profils (None = Konfigurationswert `enhancement_profile`)
             
         Returns:
             Verbessertes Bild für OCR
         """
+        profile = profile or self.enhancement_profile
+        settings = self.ENHANCEMENT_PROFILES.get(profile)
+        if settings is None:
+            self.logger.warning(f"Unbekanntes Verbesserungsprofil {profile}, verwende quality")
+            settings = self.ENHANCEMENT_PROFILES["quality"]
+        
+        if self.result_cache is not None:
+            key = self.result_cache.key("enhance_image_for_ocr", image, tuple(sorted(settings.items())))
+            return self.result_cache.get_or_compute(key, lambda: self._enhance_image_uncached(image, settings))
+        return self._enhance_image_uncached(image, settings)
+    
+    def _enhance_image_uncached(self, image: np.ndarray, settings: Dict[str, Any]) -> np.ndarray:
+        """Führt die OCR-Vorverarbeitung ohne Ergebnis-Cache aus."""
         # Konvertiere zu Graustufen, falls das Bild farbig ist
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image
+        
+        offset = 2
+        skip_denoise = False
+        if settings["adaptive_offset"] or settings["skip_below_sigma"] > 0:
+            sigma = _estimate_noise_sigma(gray)
+            skip_denoise = sigma < settings["skip_below_sigma"]
+            if settings["adaptive_offset"]:
+                # Bei verrauschten Vorlagen verhindert ein höherer Abstand zum
+                # lokalen Mittel Störpixel im Hintergrund
+                offset = min(12.0, 2.0 + sigma)
+        
+        tile_size = self.enhancement_tile_size
+        if tile_size > 0 and (gray.shape[0] > tile_size or gray.shape[1] > tile_size):
+            return self._enhance_tiled(gray, settings, offset, skip_denoise)
         
         # Rauschunterdrückung
-        denoised = cv2.fastNlMeansDenoising(gray, None, 10, 7, 21)
+        denoised = gray if skip_denoise else self._denoise_for_ocr(gray, settings)
         
         # Kontrastverstärkung mit CLAHE
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(denoised)
+        enhanced = _get_clahe(2.0, (8, 8)).apply(denoised)
         
-        # Binärisierung mit adaptivem Threshold
         binary = cv2.adaptiveThreshold(
             enhanced, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-            cv2.THRESH_BINARY, 11, 2
+            cv2.THRESH_BINARY, 11, offset
         )
         
-        # Morphologische Operationen zum Verbessern der Textqualität
-        # Entfernt kleine Störungen und verbindet nahe Textteile
-        kernel = np.ones((1, 1), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-        
         return binary
     
-    def segment_text_regions(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _denoise_for_ocr(self, gray: np.ndarray, settings: Dict[str, Any]) -> np.ndarray:
+        """Entrauscht ein Graustufenbild gemäß Profileinstellungen."""
+        if settings["denoise"] == "median":
+            return cv2.GaussianBlur(cv2.medianBlur(gray, 3), (3, 3), 0)
+        
+        if settings["nlm_scale"] < 1.0:
+            # NLM auf verkleinertem Bild: das Verkleinern mittelt bereits Rauschen heraus.
+            # Auffüllen auf ein Vielfaches des Faktors hält Kacheln und Gesamtbild im selben Pixelraster.
+            height, width = gray.shape[:2]
+            factor = int(round(1 / settings["nlm_scale"]))
+            padded = cv2.copyMakeBorder(gray, 0, -height % factor, 0, -width % factor, cv2.BORDER_REPLICATE)
+            small = cv2.resize(padded, None, fx=1 / factor, fy=1 / factor, interpolation=cv2.INTER_AREA)
+            small = cv2.fastNlMeansDenoising(small, None, 10, 7, settings["nlm_search_window"])
+            restored = cv2.resize(small, None, fx=factor, fy=factor, interpolation=cv2.INTER_LINEAR)
+            return restored[:height, :width]
+        
+        return cv2.fastNlMeansDenoising(gray, None, 10, 7, settings["nlm_search_window"])
+    
+    @staticmethod
+    def _denoise_halo(settings: Dict[str, Any]) -> int:
+        """Randbreite in Pixeln, ab der das Entrauschen einer Kachel dem Gesamtbild entspricht."""
+        if settings["denoise"] == "median":
+            return 2
+        
+        # Template-Radius + Suchradius, auf Originalauflösung umgerechnet, plus Interpolationsrand
+        radius = 3 + settings["nlm_search_window"] // 2
+        halo = int(np.ceil(radius / settings["nlm_scale"])) + 2
+        return halo + halo % 2
+    
+    def _enhance_tiled(self, gray: np.ndarray, settings: Dict[str, Any],
+                       offset: float, skip_denoise: bool) -> np.ndarray:
+        """Kachelbasierte Variante von enhance_image_for_ocr für sehr große Scans.
+        
+        Entrauschen und Threshold laufen je Kachel mit überlappendem Rand und
+        liefern im Kern dieselben Pixel wie das Gesamtbild. CLAHE arbeitet mit
+        einem bildweiten Zellraster; es wird daher in Streifen entlang dieses
+        Rasters mit einer Zellzeile Überlappung berechnet, sodass jede Zelle
+        dieselbe Histogramm-Tabelle erhält (Abweichung höchstens ein Grauwert
+        durch Rundung). Neben dem Ergebnis werden nur ein weiteres Vollbild
+        und je laufender Kachel ein Zwischenpuffer belegt.
+        
+        Args:
+            gray: Graustufenbild
+            settings: Profileinstellungen aus ENHANCEMENT_PROFILES
+            offset: Abstand zum lokalen Mittel für den adaptiven Threshold
+            skip_denoise: Ob das Entrauschen entfällt
+            
+        Returns:
+            Binärbild wie enhance_image_for_ocr
+        """
+        height, width = gray.shape[:2]
+        tiles = _tile_grid(height, width, self.enhancement_tile_size + self.enhancement_tile_size % 2)
+        executor = self._get_enhancement_executor()
+        
+        def run_tiled(operation, source, target, halo):
+            def process(tile):
+                y0, y1, x0, x1 = tile
+                ey0, ex0 = max(0, y0 - halo), max(0, x0 - halo)
+                result = operation(source[ey0:min(height, y1 + halo), ex0:min(width, x1 + halo)])
+                target[y0:y1, x0:x1] = result[y0 - ey0:y1 - ey0, x0 - ex0:x1 - ex0]
+            
+            # list() reicht Ausnahmen aus den Workern weiter
+            list(executor.map(process, tiles))
+        
+        if skip_denoise:
+            denoised = gray
+            output = np.empty_like(gray)
+        else:
+            denoised = np.empty_like(gray)
+            run_tiled(lambda tile: self._denoise_for_ocr(tile, settings), gray, denoised,
+                      self._denoise_halo(settings))
+            # Der Entrauschungspuffer wird nach CLAHE nicht mehr gebraucht und nimmt das Ergebnis auf
+            output = denoised
+        
+        enhanced = np.empty_like(gray)
+        self._clahe_tiled(denoised, enhanced, executor, 2.0, (8, 8))
+        
+        run_tiled(lambda tile: cv2.adaptiveThreshold(tile, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                                     cv2.THRESH_BINARY, 11, offset),
+                  enhanced, output, 6)
+        return output
+    
+    def _clahe_tiled(self, source: np.ndarray, target: np.ndarray, executor: ThreadPoolExecutor,
+                     clip_limit: float, tile_grid: Tuple[int, int]):
+        """Wendet CLAHE zeilenstreifenweise an, deckungsgleich mit dem Zellraster des Gesamtbilds.
+        
+        Jeder Streifen umfasst mehrere Zellzeilen plus je eine Zellzeile Rand
+        oben und unten; ein Streifen je Worker hält den Mehraufwand für die
+        Randzeilen gering.
+        """
+        height, width = source.shape[:2]
+        columns, rows = tile_grid
+        
+        # OpenCV füllt das Bild auf ein Vielfaches des Rasters auf, sobald eine Seite nicht aufgeht
+        if width % columns == 0 and height % rows == 0:
+            padded_width, padded_height = width, height
+        else:
+            padded_width = width + columns - width % columns
+            padded_height = height + rows - height % rows
+        cell_height = padded_height // rows
+        band_rows = -(-rows // max(1, self.enhancement_workers))
+        
+        def process(row):
+            first, last = max(0, row - 1), min(rows, row + band_rows + 1)
+            y0 = first * cell_height
+            band = source[y0:min(height, last * cell_height)]
+            band = cv2.copyMakeBorder(band, 0, (last - first) * cell_height - band.shape[0],
+                                      0, padded_width - width, cv2.BORDER_REFLECT_101)
+            result = _get_clahe(clip_limit, (columns, last - first)).apply(band)
+            
+            core_y0, core_y1 = row * cell_height, min(height, (row + band_rows) * cell_height)
+            if core_y1 > core_y0:
+                target[core_y0:core_y1] = result[core_y0 - y0:core_y1 - y0, :width]
+        
+        list(executor.map(process, range(0, rows, band_rows)))
+    
+    def _get_enhancement_executor(self) -> ThreadPoolExecutor:
+        """Liefert den persistenten Thread-Pool für die kachelbasierte OCR-Vorverarbeitung."""
+        if self._enhancement_executor is None:
+            self._enhancement_executor = ThreadPoolExecutor(max_workers=max(1, self.enhancement_workers),
+                                                            thread_name_prefix="vision-enhance")
+        return self._enhancement_executor
+    
+    def set_enhancement_workers(self, workers: int):
+        """Ändert die Anzahl der Threads für die kachelbasierte OCR-Vorverarbeitung.
+        
+        Args:
+            workers: Anzahl der Threads
+        """
+        self.shutdown_enhancement_workers()
+        self.enhancement_workers = workers
+    
+    def shutdown_enhancement_workers(self):
+        """Beendet den Thread-Pool der OCR-Vorverarbeitung, falls vorhanden."""
+        if self._enhancement_executor is not None:
+            self._enhancement_executor.shutdown(wait=True)
+            self._enhancement_executor = None
+    
+    def segment_text_regions(self, image: np.ndarray, level: str = "word") -> List[Dict[str, Any]]:
         """Segmentiert Textregionen in einem Bild mit MSER.
         
+        Die MSER-Regionen werden nach Größe und Seitenverhältnis gefiltert und
+        je nach Ebene zu Wörtern und Zeilen verschmolzen (siehe
+        TEXT_SEGMENTATION_LEVELS). Das Ergebnis ist in Lesereihenfolge sortiert.
+        
         Args:
             image: Eingabebild
+            level: "region" (einzelne MSER-Regionen), "word" oder "line"
             
         Returns:
             Liste von Textregionen mit Positionsdaten
         """
+        if level not in self.TEXT_SEGMENTATION_LEVELS:
+            self.logger.warning(f"Unbekannte Segmentierungsebene {level}, verwende word")
+            level = "word"
+        
+        if self.result_cache is not None:
+            key = self.result_cache.key("segment_text_regions", image, (level,))
+            return self.result_cache.get_or_compute(key, lambda: self._segment_text_regions_uncached(image, level))
+        return self._segment_text_regions_uncached(image, level)
+    
+    def _segment_text_regions_uncached(self, image: np.ndarray, level: str) -> List[Dict[str, Any]]:
+        """Führt die MSER-Segmentierung ohne Ergebnis-Cache aus."""
         # Konvertiere zu Graustufen, falls erforderlich
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image
+        
+        # MSER für Texterkennung, bei großen Scans kachelweise
+        tile_size = self.enhancement_tile_size
+        if tile_size > 0 and (gray.shape[0] > tile_size or gray.shape[1] > tile_size):
+            boxes = self._mser_boxes_tiled(gray)
+        else:
+            _, bboxes = _get_mser().detectRegions(gray)
+            boxes = np.asarray(bboxes, dtype=np.int64).reshape(-1, 4)
+        
+        # Filtere zu kleine oder zu große Regionen; typische Textbereiche haben
+        # ein Seitenverhältnis zwischen 0.1 und 10
+        widths, heights = boxes[:, 2], boxes[:, 3]
+        keep = ((widths >= 3) & (heights >= 3)
+                & (widths <= image.shape[1] // 2) & (heights <= image.shape[0] // 2)
+                & (widths * 10 >= heights) & (heights * 10 >= widths))
+        boxes = boxes[keep]
+        
+        # MSER liefert verschachtelte Regionen oft mit identischem Hüllrechteck
+        codes = (boxes[:, 0] << 48) | (boxes[:, 1] << 32) | (boxes[:, 2] << 16) | boxes[:, 3]
+        _, first = np.unique(codes, return_index=True)
+        boxes = boxes[np.sort(first)]
+        counts = np.ones(len(boxes), dtype=np.int64)
+        
+        if len(boxes) == 0:
+            return []
         
-        # MSER für Texterkennung
-        mser = cv2.MSER_create()
-        regions, _ = mser.detectRegions(gray)
+        # Verschmelze zu Wörtern und diese zu Zeilen; die Zeilenzuordnung
+        # bestimmt auch die Lesereihenfolge der Wörter
+        if level == "region":
+            lines = line_of = None
+        else:
+            words, word_of = _merge_text_boxes(boxes, self.TEXT_SEGMENTATION_LEVELS["word"])
+            counts = np.bincount(word_of, minlength=len(words))
+            lines, line_of = _merge_text_boxes(words, self.TEXT_SEGMENTATION_LEVELS["line"],
+                                               attach_marks=False)
+            if level == "word":
+                boxes = words
+            else:
+                counts = np.bincount(line_of, weights=counts, minlength=len(lines)).astype(np.int64)
+                boxes, lines = lines, None
         
-        # Erstelle Hüllrechtecke für Textregionen
-        text_regions = []
+        if lines is not None:
+            line_rank = np.empty(len(lines), dtype=np.int64)
+            line_rank[np.lexsort((lines[:, 0], lines[:, 1]))] = np.arange(len(lines))
+            order = np.lexsort((boxes[:, 0], line_rank[line_of]))
+        else:
+            order = np.lexsort((boxes[:, 0], boxes[:, 1]))
+        
+        return [{
+            "type": "text_region",
+            "level": level,
+            "box": {
+                "x": x,
+                "y": y,
+                "width": w,
+                "height": h
+            },
+            "aspect_ratio": w / h,
+            "components": n
+        } for (x, y, w, h), n in zip(boxes[order].tolist(), counts[order].tolist())]
+    
+    def _mser_boxes_tiled(self, gray: np.ndarray, halo: int = 128) -> np.ndarray:
+        """Führt MSER kachelweise auf dem Thread-Pool aus.
         
-        for region in regions:
-            # Berechne Begrenzungsrechteck
-            x, y, w, h = cv2.boundingRect(region)
-            
-            # Filtere zu kleine oder zu große Regionen
-            if w < 3 or h < 3 or w > image.shape[1]//2 or h > image.shape[0]//2:
-                continue
+        Jede Region wird der Kachel zugeordnet, in deren Kern ihre linke obere
+        Ecke liegt. Regionen, die den überlappenden Rand einer Kachel berühren,
+        sind dort abgeschnitten und werden verworfen. Regionen bis zur Größe
+        des Rands entsprechen damit denen des Gesamtbilds.
+        
+        Args:
+            gray: Graustufenbild
+            halo: Überlappung der Kacheln in Pixeln
             
-            # Berechne Seitenverhältnis (kann helfen, Textregionen zu identifizieren)
-            aspect_ratio = w / h
+        Returns:
+            (n, 4)-Array mit Hüllrechtecken (x, y, w, h) in Bildkoordinaten
+        """
+        height, width = gray.shape[:2]
+        
+        def process(tile):
+            y0, y1, x0, x1 = tile
+            ey0, ex0 = max(0, y0 - halo), max(0, x0 - halo)
+            ey1, ex1 = min(height, y1 + halo), min(width, x1 + halo)
+            _, bboxes = _get_mser().detectRegions(gray[ey0:ey1, ex0:ex1])
+            boxes = np.asarray(bboxes, dtype=np.int64).reshape(-1, 4)
+            x, y, w, h = boxes.T
             
-            # Typische Textbereiche haben ein Seitenverhältnis zwischen 0.1 und 10
-            if 0.1 <= aspect_ratio <= 10:
-                text_regions.append({
-                    "type": "text_region",
-                    "box": {
-                        "x": x,
-                        "y": y,
-                        "width": w,
-                        "height": h
-                    },
-                    "aspect_ratio": aspect_ratio
-                })
+            clipped = (((x == 0) & (ex0 > 0)) | ((y == 0) & (ey0 > 0))
+                       | ((x + w == ex1 - ex0) & (ex1 < width)) | ((y + h == ey1 - ey0) & (ey1 < height)))
+            in_core = (y0 <= y + ey0) & (y + ey0 < y1) & (x0 <= x + ex0) & (x + ex0 < x1)
+            return boxes[~clipped & in_core] + np.array([ex0, ey0, 0, 0])
         
-        # Gruppiere nahe beieinander liegende Regionen (einfache Implementierung)
-        return text_regions
+        tiles = _tile_grid(height, width, self.enhancement_tile_size)
+        return np.concatenate(list(self._get_enhancement_executor().map(process, tiles)))
     
     def extract_document_from_camera(self, adjust_perspective: bool = True) -> Optional[np.ndarray]:
         """Erfasst ein Dokument von der Kamera mit automatischer Dokumentenerkennung.
@@ -7,10 +7,1403 @@ import requests
 from PIL import Image
 import numpy as np
 import cv2
-from typing import Dict, Any, List, Optional, Union, BinaryIO, Callable
+from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO, Callable, Iterable
 from datetime import datetime
 import io
-import tempfile
+import re
+import html
+import functools
+import time
+import random
+import queue
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+
+
+class ImageResolver:
+    """Dekodiert das Originalbild einer Anfrage einmalig und cached kodierte Varianten.
+    
+    Alle Formatgeneratoren einer process()-Anfrage teilen sich eine Instanz,
+    sodass ein Scan nur einmal gelesen und pro Format/Qualität nur einmal
+    kodiert wird. Zugriffe sind threadsicher.
+    """
+    
+    def __init__(self, source: Union[str, np.ndarray, None]):
+        """Initialisiert den Resolver.
+        
+        Args:
+            source: Originalbild als NumPy-Array (BGR) oder Dateipfad
+        """
+        self.source = source
+        self._lock = threading.Lock()
+        self._image = None
+        self._pil_image = None
+        self._encoded = {}
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+    
+    def __getstate__(self):
+        # Für Workerprozesse nur die Quelle übertragen, nicht die Caches
+        return {"source": self.source}
+    
+    def __setstate__(self, state):
+        self.__init__(state["source"])
+    
+    @property
+    def is_valid(self) -> bool:
+        """True, wenn die Quelle ein Array oder ein existierender Dateipfad ist."""
+        return isinstance(self.source, np.ndarray) or (isinstance(self.source, str) and os.path.exists(self.source))
+    
+    @property
+    def is_path(self) -> bool:
+        """True, wenn die Quelle ein existierender Dateipfad ist."""
+        return isinstance(self.source, str) and os.path.exists(self.source)
+    
+    def image(self) -> np.ndarray:
+        """Liefert das dekodierte BGR-Bild (nur lesend verwenden).
+        
+        Returns:
+            Bild als NumPy-Array
+            
+        Raises:
+            ValueError: Wenn die Quelle kein gültiges Bild ist
+        """
+        with self._lock:
+            if self._image is not None:
+                self._record_hit(self._image.nbytes)
+                return self._image
+            
+            self.misses += 1
+            if isinstance(self.source, np.ndarray):
+                self._image = self.source
+            elif self.is_path:
+                self._image = cv2.imread(self.source)
+            
+            if self._image is None:
+                raise ValueError("Bild muss als NumPy-Array oder gültiger Dateipfad vorliegen")
+            return self._image
+    
+    def pil_image(self) -> Image.Image:
+        """Liefert das Bild als RGB-PIL-Bild (nur lesend verwenden, sonst copy())."""
+        image = self.image()
+        with self._lock:
+            if self._pil_image is not None:
+                self._record_hit(image.nbytes)
+                return self._pil_image
+            
+            self.misses += 1
+            self._pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+            return self._pil_image
+    
+    def encoded(self, ext: str = ".jpg", quality: int = 95) -> bytes:
+        """Liefert das Bild kodiert als JPEG- oder PNG-Bytes.
+        
+        Args:
+            ext: Zielformat (".jpg" oder ".png")
+            quality: JPEG-Qualität bzw. PNG-Kompressionsstufe (0-9)
+            
+        Returns:
+            Kodierte Bilddaten
+        """
+        key = (ext.lower(), quality)
+        with self._lock:
+            data = self._encoded.get(key)
+            if data is not None:
+                self._record_hit(len(data))
+                return data
+        
+        image = self.image()
+        if key[0] in (".jpg", ".jpeg"):
+            params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, min(quality, 9)]
+        
+        success, buffer = cv2.imencode(ext, image, params)
+        if not success:
+            raise ValueError(f"Bild konnte nicht als {ext} kodiert werden")
+        
+        with self._lock:
+            self.misses += 1
+            return self._encoded.setdefault(key, buffer.tobytes())
+    
+    def merge_stats(self, stats: Dict[str, Any]):
+        """Übernimmt die Kennzahlen eines Resolvers aus einem Workerprozess."""
+        with self._lock:
+            self.hits += stats["hits"]
+            self.misses += stats["misses"]
+            self.bytes_saved += stats["bytes_saved"]
+    
+    def _record_hit(self, size: int):
+        """Erfasst einen Cache-Treffer (Aufrufer hält die Sperre)."""
+        self.hits += 1
+        self.bytes_saved += size
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Treffer, Fehlzugriffe und eingesparte Bytes.
+        
+        Returns:
+            Dict mit Cache-Kennzahlen
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+                "cached_encodings": [f"{ext}@{quality}" for ext, quality in self._encoded]
+            }
+
+
+class LatencyStats:
+    """Threadsichere Sammlung der letzten Latenzen mit Perzentilauswertung."""
+    
+    def __init__(self, sample_size: int = 2048):
+        self._samples = deque(maxlen=sample_size)
+        self._lock = threading.Lock()
+        self.count = 0
+    
+    def record(self, latency_ms: float):
+        """Erfasst einen Messwert in Millisekunden."""
+        with self._lock:
+            self._samples.append(latency_ms)
+            self.count += 1
+    
+    def summary(self) -> Dict[str, Any]:
+        """Liefert Anzahl, Mittelwert, Perzentile und Maximum in Millisekunden."""
+        with self._lock:
+            samples = np.array(self._samples, dtype=np.float64)
+            count = self.count
+        
+        if not len(samples):
+            return {"count": count, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        return {
+            "count": count,
+            "mean_ms": float(samples.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(samples.max())
+        }
+
+
+class ApiOutbox:
+    """Persistente Warteschlange für API-Dokumente auf Basis von SQLite (WAL).
+    
+    append() ist ein einzelnes INSERT; zugestellte Einträge werden per ack()
+    gelöscht und der freie Platz regelmäßig mit incremental_vacuum
+    zurückgegeben. Die Reihenfolge pro Endpunkt ergibt sich aus der
+    aufsteigenden rowid. Endgültig abgelehnte Einträge landen per
+    dead_letter() in der Tabelle `outbox_dead`. Beim Öffnen werden keine
+    Einträge geladen, sodass auch große Rückstände sofort verfügbar sind;
+    die Anzahl offener Einträge wird einmalig gezählt und danach im
+    Speicher mitgeführt.
+    """
+    
+    def __init__(self, path: str, compact_every: int = 1000):
+        """Öffnet bzw. erstellt die Outbox-Datenbank.
+        
+        Args:
+            path: Pfad zur SQLite-Datei
+            compact_every: Anzahl bestätigter Einträge, nach denen kompaktiert wird
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.path = path
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._acked_since_compact = 0
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # auto_vacuum muss vor dem Anlegen der ersten Tabelle gesetzt werden
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY, endpoint TEXT NOT NULL, payload TEXT NOT NULL, created REAL NOT NULL, "
+            "options TEXT)"
+        )
+        # Outboxen älterer Versionen haben noch keine Spalte für Anfrageoptionen
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")]
+        if "options" not in columns:
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN options TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS outbox_endpoint ON outbox (endpoint, id)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox_dead ("
+            "id INTEGER PRIMARY KEY, endpoint TEXT NOT NULL, payload TEXT NOT NULL, created REAL NOT NULL, "
+            "options TEXT, failed REAL NOT NULL, error TEXT)"
+        )
+        
+        # Offene Einträge pro Endpunkt, damit pending_count() keine Tabelle durchsucht
+        self._pending = dict(self._conn.execute("SELECT endpoint, COUNT(*) FROM outbox GROUP BY endpoint"))
+    
+    def append(self, endpoint: str, payload: Dict[str, Any], options: str = None) -> int:
+        """Hängt ein Dokument für einen Endpunkt an.
+        
+        Args:
+            endpoint: Endpunkt-URL
+            payload: JSON-serialisierbares Dokument
+            options: Anfrageoptionen als JSON (siehe ApiForwarder.submit)
+            
+        Returns:
+            ID des Eintrags
+        """
+        data = json.dumps(payload, ensure_ascii=False)
+        with self._lock:
+            cursor = self._conn.execute("INSERT INTO outbox (endpoint, payload, created, options) VALUES (?, ?, ?, ?)",
+                                        (endpoint, data, time.time(), options))
+            self._pending[endpoint] = self._pending.get(endpoint, 0) + 1
+            return cursor.lastrowid
+    
+    def peek(self, endpoint: str, limit: int = 1) -> List[Tuple[int, Dict[str, Any], Optional[str]]]:
+        """Liefert die ältesten Einträge eines Endpunkts, ohne sie zu entfernen.
+        
+        Returns:
+            Liste von (ID, Dokument, Anfrageoptionen) in Einfügereihenfolge
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT id, payload, options FROM outbox WHERE endpoint = ? ORDER BY id LIMIT ?",
+                                      (endpoint, limit)).fetchall()
+        return [(entry_id, json.loads(data), options) for entry_id, data, options in rows]
+    
+    def ack(self, endpoint: str, entry_ids: List[int]):
+        """Entfernt zugestellte Einträge eines Endpunkts und kompaktiert bei Bedarf."""
+        if not entry_ids:
+            return
+        
+        with self._lock:
+            cursor = self._conn.executemany("DELETE FROM outbox WHERE id = ?", [(entry_id,) for entry_id in entry_ids])
+            self._pending[endpoint] = self._pending.get(endpoint, 0) - cursor.rowcount
+            self._acked_since_compact += len(entry_ids)
+            if self._acked_since_compact >= self.compact_every:
+                self._compact_locked()
+    
+    def dead_letter(self, endpoint: str, entry_ids: List[int], error: str):
+        """Verschiebt endgültig abgelehnte Einträge in die Dead-Letter-Tabelle."""
+        if not entry_ids:
+            return
+        
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                failed = time.time()
+                self._conn.executemany(
+                    "INSERT INTO outbox_dead (id, endpoint, payload, created, options, failed, error) "
+                    "SELECT id, endpoint, payload, created, options, ?, ? FROM outbox WHERE id = ?",
+                    [(failed, error, entry_id) for entry_id in entry_ids])
+                cursor = self._conn.executemany("DELETE FROM outbox WHERE id = ?",
+                                                [(entry_id,) for entry_id in entry_ids])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._pending[endpoint] = self._pending.get(endpoint, 0) - cursor.rowcount
+    
+    def dead_letter_count(self, endpoint: str = None) -> int:
+        """Anzahl der endgültig abgelehnten Einträge (gesamt oder pro Endpunkt)."""
+        with self._lock:
+            if endpoint is None:
+                return self._conn.execute("SELECT COUNT(*) FROM outbox_dead").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM outbox_dead WHERE endpoint = ?", (endpoint,)).fetchone()[0]
+    
+    def pending_count(self, endpoint: str = None) -> int:
+        """Anzahl der noch nicht zugestellten Einträge (gesamt oder pro Endpunkt)."""
+        with self._lock:
+            if endpoint is None:
+                return sum(self._pending.values())
+            return self._pending.get(endpoint, 0)
+    
+    def endpoints(self) -> List[str]:
+        """Liefert alle Endpunkte mit offenen Einträgen."""
+        with self._lock:
+            return [endpoint for endpoint, count in self._pending.items() if count > 0]
+    
+    def compact(self):
+        """Gibt den Platz gelöschter Einträge frei und kürzt das WAL."""
+        with self._lock:
+            self._compact_locked()
+    
+    def _compact_locked(self):
+        self._conn.execute("PRAGMA incremental_vacuum")
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._acked_since_compact = 0
+    
+    def close(self):
+        """Kompaktiert und schließt die Datenbank."""
+        with self._lock:
+            self._compact_locked()
+            self._conn.close()
+
+
+class ApiForwarder:
+    """Asynchrone Weiterleitung von Dokumenten an konfigurierte API-Endpunkte.
+    
+    Alle Anfragen laufen über eine gemeinsame requests.Session mit
+    Verbindungspool. Jeder Endpunkt hat eine eigene begrenzte Warteschlange
+    und eine feste Anzahl Sende-Threads. Fehlgeschlagene Anfragen werden mit
+    exponentiellem Backoff wiederholt; Endpunkte mit `batch: True` erhalten
+    mehrere Dokumente in einer Anfrage als {"documents": [...]}.
+    
+    Endpunkte können als URL oder als Dict angegeben werden:
+    {"url": ..., "batch": True, "max_batch_size": 50, "headers": {...}}
+    
+    Mit `api_outbox_path` werden Dokumente zuerst in eine ApiOutbox
+    geschrieben und von einem Drainer-Thread pro Endpunkt in Reihenfolge
+    zugestellt. Bei Ausfällen bleiben sie erhalten und werden nach
+    `api_outbox_retry_interval` Sekunden erneut versucht; endgültig
+    abgelehnte Dokumente werden in die Dead-Letter-Tabelle verschoben.
+    """
+    
+    RETRY_STATUS_CODES = (408, 425, 429, 500, 502, 503, 504)
+    
+    def __init__(self, endpoints: List[Union[str, Dict[str, Any]]], config: Dict[str, Any] = None):
+        """Initialisiert den Forwarder, ohne Threads zu starten.
+        
+        Args:
+            endpoints: Liste der Zielendpunkte (URL oder Endpunkt-Dict)
+            config: Konfiguration mit api_*-Optionen des Multi-Output-Prozessors
+        """
+        config = config or {}
+        self.logger = logging.getLogger("ocrtool.output")
+        self.endpoints = [self._normalize_endpoint(endpoint) for endpoint in endpoints]
+        
+        self.concurrency = config.get("api_concurrency", 2)
+        self.queue_size = config.get("api_queue_size", 1000)
+        self.timeout = config.get("api_timeout", 30)
+        self.max_retries = config.get("api_max_retries", 3)
+        self.backoff_base = config.get("api_backoff_base", 0.5)
+        self.backoff_max = config.get("api_backoff_max", 30.0)
+        self.batch_linger = config.get("api_batch_linger", 0.05)
+        self.enqueue_timeout = config.get("api_enqueue_timeout", 5.0)
+        self.default_headers = config.get("api_headers", {"Content-Type": "application/json"})
+        
+        # Gemeinsamer Verbindungspool für alle Endpunkte und Threads
+        pool_size = config.get("api_pool_size", max(10, self.concurrency * max(1, len(self.endpoints))))
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max(1, len(self.endpoints)), pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        self._queues = {endpoint["url"]: queue.Queue(maxsize=self.queue_size) for endpoint in self.endpoints}
+        self._stats = {endpoint["url"]: self._new_endpoint_stats() for endpoint in self.endpoints}
+        self._stats_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._threads = []
+        self._started = False
+        
+        # Persistente Outbox (optional)
+        self.outbox = None
+        self.outbox_rate = config.get("api_outbox_rate", 0)
+        self.outbox_retry_interval = config.get("api_outbox_retry_interval", 5.0)
+        self._outbox_futures = {}
+        self._outbox_wakeup = {}
+        if config.get("api_outbox_path"):
+            self.outbox = ApiOutbox(config["api_outbox_path"], config.get("api_outbox_compact_every", 1000))
+            self._outbox_wakeup = {endpoint["url"]: threading.Event() for endpoint in self.endpoints}
+            stale = set(self.outbox.endpoints()) - set(self._queues)
+            if stale:
+                # Einträge für Endpunkte aus Verarbeitungsoptionen früherer Läufe ebenfalls zustellen
+                self.logger.warning(f"Outbox enthält Einträge für nicht konfigurierte Endpunkte: {sorted(stale)}")
+                for url in sorted(stale):
+                    self.add_endpoint(url)
+    
+    @staticmethod
+    def _normalize_endpoint(endpoint: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Vereinheitlicht eine Endpunktangabe zu einem Dict."""
+        if isinstance(endpoint, str):
+            endpoint = {"url": endpoint}
+        
+        normalized = {"batch": False, "max_batch_size": 50, "headers": None}
+        normalized.update(endpoint)
+        if not normalized["batch"]:
+            normalized["max_batch_size"] = 1
+        return normalized
+    
+    @staticmethod
+    def _new_endpoint_stats() -> Dict[str, Any]:
+        return {"sent": 0, "failed": 0, "dropped": 0, "dead_letter": 0, "retries": 0, "requests": 0, "batches": 0,
+                "request_latency": LatencyStats(), "delivery_latency": LatencyStats()}
+    
+    @property
+    def is_running(self) -> bool:
+        return self._started and not self._stop_event.is_set()
+    
+    def start(self):
+        """Startet die Sende-Threads für alle Endpunkte."""
+        with self._stats_lock:
+            if self.is_running:
+                return
+            
+            self._stop_event.clear()
+            self._started = True
+            for endpoint in self.endpoints:
+                self._start_endpoint_threads(endpoint)
+    
+    def _start_endpoint_threads(self, endpoint: Dict[str, Any]):
+        """Startet die Sende-Threads eines Endpunkts (Aufrufer hält die Sperre)."""
+        if self.outbox is not None:
+            # Ein Drainer pro Endpunkt, damit die Reihenfolge erhalten bleibt
+            thread = threading.Thread(target=self._drain_loop, args=(endpoint,),
+                                      name="api-outbox-drainer", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            return
+        
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._send_loop, args=(endpoint,),
+                                      name=f"api-forwarder-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def add_endpoint(self, endpoint: Union[str, Dict[str, Any]]):
+        """Fügt einen Endpunkt hinzu, falls er noch nicht bekannt ist.
+        
+        Args:
+            endpoint: URL oder Endpunkt-Dict
+        """
+        endpoint = self._normalize_endpoint(endpoint)
+        with self._stats_lock:
+            if endpoint["url"] in self._queues:
+                return
+            
+            self.endpoints.append(endpoint)
+            self._queues[endpoint["url"]] = queue.Queue(maxsize=self.queue_size)
+            self._stats[endpoint["url"]] = self._new_endpoint_stats()
+            self._outbox_wakeup[endpoint["url"]] = threading.Event()
+            if self.is_running:
+                self._start_endpoint_threads(endpoint)
+    
+    def submit(self, payload: Dict[str, Any], endpoints: List[str] = None,
+               headers: Dict[str, str] = None, timeout: float = None) -> List[Future]:
+        """Reiht ein Dokument für alle (bzw. die angegebenen) Endpunkte ein.
+        
+        Dokumente mit abweichenden Headern oder Timeout werden nicht mit
+        anderen Dokumenten in einem Batch gesendet.
+        
+        Args:
+            payload: JSON-serialisierbares Dokument
+            endpoints: Optionale Teilmenge der Endpunkt-URLs (None = alle)
+            headers: Header nur für dieses Dokument (None = Endpunkt- bzw. Standard-Header)
+            timeout: Timeout nur für dieses Dokument in Sekunden (None = `api_timeout`)
+            
+        Returns:
+            Liste von Futures, je Endpunkt eines, mit dem Zustellergebnis
+        """
+        self.start()
+        futures = []
+        options = None
+        if headers or timeout:
+            options = json.dumps({"headers": headers, "timeout": timeout}, sort_keys=True)
+        
+        for endpoint in self.endpoints:
+            url = endpoint["url"]
+            if endpoints is not None and url not in endpoints:
+                continue
+            
+            future = Future()
+            if self.outbox is not None:
+                entry_id = self.outbox.append(url, payload, options)
+                with self._stats_lock:
+                    self._outbox_futures[entry_id] = (future, time.perf_counter())
+                self._outbox_wakeup[url].set()
+                futures.append(future)
+                continue
+            
+            try:
+                self._queues[url].put((payload, future, time.perf_counter(), options), timeout=self.enqueue_timeout)
+            except queue.Full:
+                with self._stats_lock:
+                    self._stats[url]["dropped"] += 1
+                self.logger.error(f"Warteschlange für {url} voll, Dokument verworfen")
+                future.set_result({"api_endpoint": url, "error": "Warteschlange voll", "status": "failed"})
+            futures.append(future)
+        
+        return futures
+    
+    def _next_batch(self, endpoint: Dict[str, Any]) -> List[Tuple]:
+        """Holt das nächste Dokument bzw. einen Batch aus der Warteschlange eines Endpunkts."""
+        endpoint_queue = self._queues[endpoint["url"]]
+        try:
+            batch = [endpoint_queue.get(timeout=0.2)]
+        except queue.Empty:
+            return []
+        
+        # Weitere Dokumente bis zur Batchgröße oder bis zum Ablauf der Wartezeit sammeln
+        deadline = time.perf_counter() + self.batch_linger
+        while len(batch) < endpoint["max_batch_size"]:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(endpoint_queue.get(timeout=remaining) if remaining > 0 else endpoint_queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _send_loop(self, endpoint: Dict[str, Any]):
+        """Sende-Thread: verarbeitet die Warteschlange eines Endpunkts bis zum Stopp."""
+        url = endpoint["url"]
+        while not self._stop_event.is_set() or not self._queues[url].empty():
+            batch = self._next_batch(endpoint)
+            if not batch:
+                continue
+            
+            # Dokumente mit eigenen Anfrageoptionen getrennt senden
+            groups = {}
+            for item in batch:
+                groups.setdefault(item[3], []).append(item)
+            for options, group in groups.items():
+                self._send_batch(endpoint, group, options)
+    
+    def _send_batch(self, endpoint: Dict[str, Any], batch: List[Tuple], options: Optional[str]):
+        """Sendet einen Batch aus der Warteschlange und löst dessen Futures auf."""
+        url = endpoint["url"]
+        payloads = [item[0] for item in batch]
+        body = {"documents": payloads} if endpoint["batch"] else payloads[0]
+        result = None
+        try:
+            result = self._post_with_retries(endpoint, body, options)
+        except Exception as e:
+            self.logger.exception(f"Unerwarteter Fehler beim Senden an {url}: {e}")
+        finally:
+            # Futures immer auflösen, damit flush() und api_wait nicht hängen bleiben
+            if result is None:
+                result = {"api_endpoint": url, "error": "Unerwarteter Fehler beim Senden", "status": "failed"}
+            result["batch_size"] = len(batch)
+            
+            now = time.perf_counter()
+            with self._stats_lock:
+                stats = self._stats[url]
+                stats["batches"] += 1
+                stats["failed" if "error" in result else "sent"] += len(batch)
+            for _, future, enqueued_at, _ in batch:
+                stats["delivery_latency"].record((now - enqueued_at) * 1000.0)
+                future.set_result(result)
+                self._queues[url].task_done()
+    
+    def _drain_loop(self, endpoint: Dict[str, Any]):
+        """Drainer-Thread: stellt die Outbox-Einträge eines Endpunkts in Reihenfolge zu.
+        
+        Schlägt eine Zustellung vorübergehend fehl (Verbindungsfehler, Timeout,
+        RETRY_STATUS_CODES), bleiben die Einträge am Kopf der Outbox und der
+        Endpunkt pausiert, damit spätere Dokumente nicht vor früheren
+        ankommen. Endgültig abgelehnte Einträge (z. B. HTTP 400/422) werden in
+        die Dead-Letter-Tabelle verschoben; ein abgelehnter Batch wird dazu
+        zunächst einzeln erneut gesendet.
+        """
+        url = endpoint["url"]
+        wakeup = self._outbox_wakeup[url]
+        min_interval = 1.0 / self.outbox_rate if self.outbox_rate else 0.0
+        # Anzahl der Einträge, die nach einem abgelehnten Batch einzeln gesendet werden
+        isolate = 0
+        
+        while not self._stop_event.is_set():
+            try:
+                entries = self.outbox.peek(url, 1 if isolate else endpoint["max_batch_size"])
+                if not entries:
+                    isolate = 0
+                    wakeup.wait(0.5)
+                    wakeup.clear()
+                    continue
+                
+                # Nur Einträge mit denselben Anfrageoptionen wie der älteste gemeinsam senden
+                options = entries[0][2]
+                for index, entry in enumerate(entries):
+                    if entry[2] != options:
+                        entries = entries[:index]
+                        break
+                
+                started = time.perf_counter()
+                payloads = [payload for _, payload, _ in entries]
+                body = {"documents": payloads} if endpoint["batch"] else payloads[0]
+                result = self._post_with_retries(endpoint, body, options)
+            except Exception as e:
+                self.logger.exception(f"Unerwarteter Fehler beim Zustellen an {url}: {e}")
+                self._stop_event.wait(self.outbox_retry_interval)
+                continue
+            
+            result["batch_size"] = len(entries)
+            entry_ids = [entry_id for entry_id, _, _ in entries]
+            
+            if "error" in result and not result.get("retryable", True) and len(entries) > 1:
+                # Den abgelehnten Eintrag eingrenzen, statt den ganzen Batch zu verwerfen
+                isolate = len(entries)
+                continue
+            
+            if "error" in result and result.get("retryable", True):
+                result["queued"] = True
+                with self._stats_lock:
+                    self._stats[url]["failed"] += len(entries)
+                    pending = [self._outbox_futures.pop(entry_id, None) for entry_id in entry_ids]
+                for item in pending:
+                    if item is not None:
+                        item[0].set_result(result)
+                # Endpunkt pausieren; die Einträge bleiben für den nächsten Versuch erhalten
+                self._stop_event.wait(self.outbox_retry_interval)
+                continue
+            
+            isolate = max(0, isolate - 1)
+            now = time.perf_counter()
+            if "error" in result:
+                self.outbox.dead_letter(url, entry_ids, result["error"])
+                result["dead_letter"] = True
+                self.logger.error(f"Outbox-Einträge {entry_ids} für {url} endgültig abgelehnt, "
+                                  f"in Dead-Letter-Tabelle verschoben")
+            else:
+                self.outbox.ack(url, entry_ids)
+            with self._stats_lock:
+                stats = self._stats[url]
+                stats["batches"] += 1
+                stats["dead_letter" if "error" in result else "sent"] += len(entries)
+                pending = [self._outbox_futures.pop(entry_id, None) for entry_id in entry_ids]
+            for item in pending:
+                if item is not None:
+                    stats["delivery_latency"].record((now - item[1]) * 1000.0)
+                    item[0].set_result(result)
+            
+            # Zustellrate begrenzen (Dokumente pro Sekunde und Endpunkt)
+            if min_interval:
+                self._stop_event.wait(max(0.0, min_interval * len(entries) - (now - started)))
+    
+    def _post_with_retries(self, endpoint: Dict[str, Any], body: Dict[str, Any],
+                           options: str = None) -> Dict[str, Any]:
+        """Sendet eine Anfrage und wiederholt sie bei vorübergehenden Fehlern.
+        
+        Wiederholt werden Verbindungsfehler, Timeouts sowie die Statuscodes in
+        RETRY_STATUS_CODES; andere Client-Fehler und sonstige
+        RequestExceptions (z. B. ungültige URL) sind endgültig.
+        
+        Args:
+            endpoint: Endpunkt-Dict
+            body: JSON-Body der Anfrage
+            options: Anfrageoptionen als JSON mit headers und timeout (siehe submit)
+            
+        Returns:
+            Ergebnis-Dict mit Statuscode und Antwort bzw. Fehlerbeschreibung;
+            `retryable` gibt bei Fehlern an, ob ein späterer Versuch sinnvoll ist
+        """
+        url = endpoint["url"]
+        request_options = json.loads(options) if options else {}
+        headers = request_options.get("headers") or endpoint["headers"] or self.default_headers
+        timeout = request_options.get("timeout") or self.timeout
+        stats = self._stats[url]
+        error = None
+        
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                # Exponentieller Backoff mit Jitter, damit Wiederholungen nicht gleichzeitig eintreffen
+                delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+                time.sleep(delay * (0.5 + random.random() / 2))
+                with self._stats_lock:
+                    stats["retries"] += 1
+            
+            start = time.perf_counter()
+            try:
+                response = self.session.post(url, json=body, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = str(e)
+                continue
+            except requests.RequestException as e:
+                self.logger.error(f"API-Aufruf an {url} fehlgeschlagen: {e}")
+                return {"api_endpoint": url, "error": str(e), "status": "failed", "attempts": attempt + 1,
+                        "retryable": False}
+            finally:
+                stats["request_latency"].record((time.perf_counter() - start) * 1000.0)
+                with self._stats_lock:
+                    stats["requests"] += 1
+            
+            if response.status_code in self.RETRY_STATUS_CODES:
+                error = f"HTTP {response.status_code}"
+                continue
+            
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                self.logger.error(f"API-Aufruf an {url} fehlgeschlagen: {e}")
+                return {"api_endpoint": url, "status_code": response.status_code, "error": str(e),
+                        "status": "failed", "attempts": attempt + 1, "retryable": False}
+            
+            response_data = {"status": "success"}
+            if response.headers.get("content-type", "").startswith("application/json"):
+                try:
+                    response_data = response.json()
+                except ValueError:
+                    # Zugestellt ist das Dokument trotzdem; die Antwort wird als Text übernommen
+                    self.logger.warning(f"Ungültige JSON-Antwort von {url}")
+                    response_data = {"status": "success", "raw_response": response.text}
+            return {"api_endpoint": url, "status_code": response.status_code, "response": response_data,
+                    "attempts": attempt + 1}
+        
+        self.logger.error(f"API-Aufruf an {url} nach {self.max_retries + 1} Versuchen fehlgeschlagen: {error}")
+        return {"api_endpoint": url, "error": error, "status": "failed", "attempts": self.max_retries + 1,
+                "retryable": True}
+    
+    def flush(self, timeout: float = None) -> bool:
+        """Wartet, bis alle Warteschlangen geleert und zugestellt sind.
+        
+        Args:
+            timeout: Maximale Wartezeit in Sekunden (None = unbegrenzt)
+            
+        Returns:
+            True, wenn alle Dokumente verarbeitet wurden
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self._has_pending():
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+    
+    def _has_pending(self) -> bool:
+        if self.outbox is not None:
+            return any(self.outbox.pending_count(url) for url in self._queues)
+        return any(endpoint_queue.unfinished_tasks for endpoint_queue in self._queues.values())
+    
+    def close(self, timeout: float = 10.0):
+        """Stellt ausstehende Dokumente zu, beendet die Threads und schließt die Session.
+        
+        Mit Outbox werden offene Einträge nicht mehr abgewartet; sie bleiben
+        gespeichert und werden beim nächsten Start zugestellt.
+        
+        Args:
+            timeout: Maximale Wartezeit pro Thread in Sekunden
+        """
+        self._stop_event.set()
+        for event in self._outbox_wakeup.values():
+            event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._started = False
+        self.session.close()
+        if self.outbox is not None:
+            self.outbox.close()
+    
+    def queue_depth(self) -> Dict[str, int]:
+        """Anzahl noch nicht zugestellter Dokumente pro Endpunkt-URL (ohne Datenbankabfrage)."""
+        if self.outbox is not None:
+            return {url: self.outbox.pending_count(url) for url in self._queues}
+        return {url: endpoint_queue.qsize() for url, endpoint_queue in self._queues.items()}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Liefert Warteschlangentiefe, Zähler und Latenzperzentile pro Endpunkt.
+        
+        Returns:
+            Dict mit Kennzahlen je Endpunkt-URL
+        """
+        result = {}
+        queue_depth = self.queue_depth()
+        with self._stats_lock:
+            for url, stats in self._stats.items():
+                result[url] = {key: value for key, value in stats.items() if not isinstance(value, LatencyStats)}
+                result[url]["queue_depth"] = queue_depth.get(url, 0)
+        
+        for url, stats in self._stats.items():
+            result[url]["request_latency"] = stats["request_latency"].summary()
+            result[url]["delivery_latency"] = stats["delivery_latency"].summary()
+        return result
+
+
+class StreamingJsonWriter:
+    """Schreibt JSON schrittweise in eine binäre Datei.
+    
+    Objekte und Arrays werden Element für Element serialisiert, Binärdaten
+    werden blockweise base64-kodiert direkt in die Datei geschrieben. Dadurch
+    liegt nie das vollständige Dokument als String im Speicher. Die Ausgabe
+    entspricht json.dump(..., indent=2) bzw. im Kompaktmodus
+    json.dump(..., separators=(",", ":")).
+    """
+    
+    # Vielfaches von 3, damit die Blöcke ohne Auffüllung aneinandergehängt werden können
+    BASE64_CHUNK_SIZE = 3 * 64 * 1024
+    
+    def __init__(self, handle: BinaryIO, compact: bool = False, backend: str = "json"):
+        """Initialisiert den Writer.
+        
+        Args:
+            handle: Im Binärmodus geöffnete Datei
+            compact: Ohne Einrückung und Leerzeichen schreiben
+            backend: "json" (Standardbibliothek) oder "orjson"
+        """
+        self.handle = handle
+        self.compact = compact
+        self.backend = "json"
+        self.bytes_written = 0
+        self._stack = []
+        self._key_separator = b":" if compact else b": "
+        
+        if backend == "orjson":
+            try:
+                import orjson
+                self._orjson = orjson
+                self.backend = "orjson"
+            except ImportError:
+                logging.getLogger("ocrtool.output").warning(
+                    "orjson nicht installiert, verwende json aus der Standardbibliothek")
+    
+    def _write(self, data: bytes):
+        self.handle.write(data)
+        self.bytes_written += len(data)
+    
+    def _dumps(self, value: Any) -> bytes:
+        if self.backend == "orjson":
+            option = self._orjson.OPT_SERIALIZE_NUMPY | self._orjson.OPT_NON_STR_KEYS
+            if not self.compact:
+                option |= self._orjson.OPT_INDENT_2
+            data = self._orjson.dumps(value, option=option)
+        elif self.compact:
+            data = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        else:
+            data = json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+        
+        # Verschachtelte Werte auf die aktuelle Tiefe einrücken (Strings enthalten keine rohen Zeilenumbrüche)
+        if not self.compact and self._stack:
+            data = data.replace(b"\n", b"\n" + b"  " * len(self._stack))
+        return data
+    
+    def _begin_value(self, key: Optional[str]):
+        """Schreibt Trennzeichen, Einrückung und ggf. den Schlüssel des nächsten Werts."""
+        if not self._stack:
+            return
+        
+        if self._stack[-1]:
+            self._write(b",")
+        self._stack[-1] = True
+        if not self.compact:
+            self._write(b"\n" + b"  " * len(self._stack))
+        if key is not None:
+            self._write(json.dumps(str(key), ensure_ascii=False).encode("utf-8") + self._key_separator)
+    
+    def _begin_container(self, key: Optional[str], opening: bytes):
+        self._begin_value(key)
+        self._write(opening)
+        self._stack.append(False)
+    
+    def _end_container(self, closing: bytes):
+        has_items = self._stack.pop()
+        if has_items and not self.compact:
+            self._write(b"\n" + b"  " * len(self._stack))
+        self._write(closing)
+    
+    def begin_object(self, key: str = None):
+        """Öffnet ein Objekt (innerhalb eines Objekts unter `key`)."""
+        self._begin_container(key, b"{")
+    
+    def end_object(self):
+        self._end_container(b"}")
+    
+    def begin_array(self, key: str = None):
+        """Öffnet ein Array (innerhalb eines Objekts unter `key`)."""
+        self._begin_container(key, b"[")
+    
+    def end_array(self):
+        self._end_container(b"]")
+    
+    def value(self, value: Any, key: str = None):
+        """Serialisiert einen vollständigen Wert."""
+        self._begin_value(key)
+        self._write(self._dumps(value))
+    
+    def items(self, values: List[Any], key: str = None):
+        """Schreibt eine Liste als Array, Element für Element."""
+        self.begin_array(key)
+        for item in values:
+            self.value(item)
+        self.end_array()
+    
+    def base64(self, source: Union[bytes, memoryview, np.ndarray, BinaryIO], key: str = None):
+        """Schreibt Binärdaten blockweise als base64-String.
+        
+        Args:
+            source: Puffer oder im Binärmodus geöffnete Datei
+            key: Schlüssel innerhalb eines Objekts
+        """
+        self._begin_value(key)
+        self._write(b'"')
+        if hasattr(source, "read"):
+            while True:
+                chunk = source.read(self.BASE64_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._write(base64.b64encode(chunk))
+        else:
+            view = memoryview(source).cast("B")
+            for offset in range(0, len(view), self.BASE64_CHUNK_SIZE):
+                self._write(base64.b64encode(view[offset:offset + self.BASE64_CHUNK_SIZE]))
+        self._write(b'"')
+
+
+class CompiledTemplate:
+    """Einmal zerlegte Textvorlage mit Platzhaltern der Form {{name}}.
+    
+    Beim Rendern werden nur noch statische Teile und Werte abwechselnd in eine
+    Teileliste geschrieben; zusammengefügt wird einmal am Ende.
+    """
+    
+    _SLOT_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+    
+    def __init__(self, source: str):
+        parts = self._SLOT_PATTERN.split(source)
+        self._static = parts[0::2]
+        self._slots = parts[1::2]
+    
+    def render_into(self, out: List[str], values: Dict[str, str]):
+        """Hängt die gerenderten Teile an `out` an (Werte werden nicht maskiert)."""
+        static = self._static
+        out.append(static[0])
+        for index, slot in enumerate(self._slots):
+            out.append(values[slot])
+            out.append(static[index + 1])
+    
+    def render(self, **values: str) -> str:
+        out = []
+        self.render_into(out, values)
+        return "".join(out)
+
+
+class OutputTemplates:
+    """Vorkompilierte HTML- und Markdown-Vorlagen der Textausgaben.
+    
+    Wird einmal pro MultiOutputProcessor erstellt. Werte aus dem Inhalt werden
+    in HTML mit html.escape maskiert, in Markdown-Tabellen werden senkrechte
+    Striche und Zeilenumbrüche maskiert.
+    """
+    
+    HTML_HEAD = "\n".join([
+        "<!DOCTYPE html>",
+        "<html lang='de'>",
+        "<head>",
+        "  <meta charset='UTF-8'>",
+        "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>",
+        "  <title>{{title}}</title>",
+        "  <style>",
+        "    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 20px; }",
+        "    .container { max-width: 1200px; margin: 0 auto; }",
+        "    .header { background-color: #f5f5f5; padding: 10px; border-bottom: 1px solid #ddd; }",
+        "    .result-image { max-width: 100%; margin: 20px 0; }",
+        "    .text-content { white-space: pre-wrap; background-color: #f9f9f9; padding: 15px; border: 1px solid #ddd; }",
+        "    table { border-collapse: collapse; width: 100%; }",
+        "    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }",
+        "    th { background-color: #f2f2f2; }",
+        "  </style>",
+        "</head>",
+        "<body>",
+        "  <div class='container'>",
+        "    <div class='header'>",
+        "      <h1>{{title}}</h1>",
+        "      <p>Generiert am: {{timestamp}}</p>",
+        "    </div>"
+    ])
+    HTML_IMAGE = ("\n    <h2>{{image_type}}bild</h2>"
+                  "\n    <img src='{{src}}' alt='{{image_type}}bild' class='result-image'>")
+    HTML_TEXT = "\n    <h2>Erkannter Text</h2>\n    <div class='text-content'>{{text}}</div>"
+    HTML_DETECTIONS_HEAD = ("\n    <h2>Erkannte Objekte</h2>\n    <table>"
+                            "\n      <tr><th>Klasse</th><th>Konfidenz</th><th>Position</th></tr>")
+    HTML_METADATA_HEAD = "\n    <h2>Metadaten</h2>\n    <table>\n      <tr><th>Attribut</th><th>Wert</th></tr>"
+    HTML_TABLE_END = "\n    </table>"
+    HTML_FOOT = "\n  </div>\n</body>\n</html>"
+    
+    MD_HEAD = "# {{title}}\n\nGeneriert am: {{timestamp}}\n\n"
+    MD_IMAGE = "![Annotiertes Bild]({{src}})\n\n"
+    MD_TEXT = "## Erkannter Text\n\n{{text}}\n\n"
+    MD_METADATA_HEAD = "## Metadaten\n\n| Attribut | Wert |\n|----------|------|\n"
+    MD_DETECTIONS_HEAD = "## Erkannte Objekte\n\n| Klasse | Konfidenz | Position |\n|--------|-----------|----------|\n"
+    
+    def __init__(self):
+        self.html_head = CompiledTemplate(self.HTML_HEAD)
+        self.html_image = CompiledTemplate(self.HTML_IMAGE)
+        self.html_text = CompiledTemplate(self.HTML_TEXT)
+        self.md_head = CompiledTemplate(self.MD_HEAD)
+        self.md_image = CompiledTemplate(self.MD_IMAGE)
+        self.md_text = CompiledTemplate(self.MD_TEXT)
+        # Klassennamen wiederholen sich; ihre Maskierung wird zwischengespeichert
+        self._escape_label = functools.lru_cache(maxsize=4096)(html.escape)
+    
+    @staticmethod
+    def md_cell(value: Any) -> str:
+        """Maskiert einen Wert für eine Markdown-Tabellenzelle."""
+        return str(value).replace("|", "\\|").replace("\n", "<br>")
+    
+    def render_html(self, title: str, timestamp: str, image: Optional[Tuple[str, str]] = None,
+                    text: str = None, detections: List[Dict[str, Any]] = None,
+                    metadata: Dict[str, Any] = None) -> str:
+        """Rendert ein HTML-Dokument.
+        
+        Args:
+            title: Dokumenttitel
+            timestamp: Erstellungszeitpunkt
+            image: Optional (Bildtyp, src-URL bzw. data-URI)
+            text: Erkannter Text
+            detections: Objekterkennungen für die Tabelle
+            metadata: Metadaten für die Tabelle
+            
+        Returns:
+            HTML-Dokument als String
+        """
+        escape = html.escape
+        out = []
+        self.html_head.render_into(out, {"title": escape(str(title)), "timestamp": timestamp})
+        
+        if image is not None:
+            self.html_image.render_into(out, {"image_type": escape(image[0]), "src": escape(image[1])})
+        
+        if text:
+            self.html_text.render_into(out, {"text": escape(text)})
+        
+        # Tabellenzeilen als f-Strings: schneller als str.format und ohne Zwischenstrings
+        if detections:
+            out.append(self.HTML_DETECTIONS_HEAD)
+            escape_label = self._escape_label
+            for detection in detections:
+                box = detection.get("box", {})
+                out.append(f"\n      <tr><td>{escape_label(str(detection.get('class_name', 'unbekannt')))}</td>"
+                           f"<td>{detection.get('confidence', 0.0):.2f}</td>"
+                           f"<td>x={box.get('x', 0)}, y={box.get('y', 0)}, "
+                           f"w={box.get('width', 0)}, h={box.get('height', 0)}</td></tr>")
+            out.append(self.HTML_TABLE_END)
+        
+        if metadata:
+            out.append(self.HTML_METADATA_HEAD)
+            for key, value in metadata.items():
+                out.append(f"\n      <tr><td>{escape(str(key))}</td><td>{escape(str(value))}</td></tr>")
+            out.append(self.HTML_TABLE_END)
+        
+        out.append(self.HTML_FOOT)
+        return "".join(out)
+    
+    def render_markdown(self, title: str, timestamp: str, image_src: str = None, text: str = None,
+                        detections: List[Dict[str, Any]] = None,
+                        metadata: Dict[str, Any] = None) -> Tuple[str, int]:
+        """Rendert ein Markdown-Dokument.
+        
+        Returns:
+            Tupel aus Markdown-Text und Anzahl der Abschnitte (##)
+        """
+        out = []
+        sections = 0
+        self.md_head.render_into(out, {"title": str(title), "timestamp": timestamp})
+        
+        if image_src:
+            self.md_image.render_into(out, {"src": image_src})
+        
+        if text:
+            self.md_text.render_into(out, {"text": text})
+            sections += 1
+        
+        cell = self.md_cell
+        if metadata is not None:
+            out.append(self.MD_METADATA_HEAD)
+            for key, value in metadata.items():
+                out.append(f"| {cell(key)} | {cell(value)} |\n")
+            out.append("\n")
+            sections += 1
+        
+        if detections is not None:
+            out.append(self.MD_DETECTIONS_HEAD)
+            for detection in detections:
+                box = detection.get("box", {})
+                out.append(f"| {cell(detection.get('class_name', 'unbekannt'))} | "
+                           f"{detection.get('confidence', 0.0):.2f} | x={box.get('x', 0)}, y={box.get('y', 0)}, "
+                           f"w={box.get('width', 0)}, h={box.get('height', 0)} |\n")
+            out.append("\n")
+            sections += 1
+        
+        # Wie bisher endet das Dokument mit genau einem Zeilenumbruch nach dem letzten Abschnitt
+        return "".join(out)[:-1], sections
+
+
+class StreamingPdfWriter:
+    """Setzt ReportLab-Flowables einzeln auf Seiten, statt eine Elementliste zu sammeln.
+    
+    Jedes Element wird sofort gezeichnet und danach verworfen; passt es nicht
+    mehr auf die Seite, wird es wie bei SimpleDocTemplate geteilt (z. B.
+    Tabellen nach Zeilen) und auf der nächsten Seite fortgesetzt. Der Speicher
+    wächst so nur mit den fertigen, komprimierten Seiten. Seitenränder
+    entsprechen SimpleDocTemplate (1 Zoll).
+    """
+    
+    def __init__(self, output_path: str, pagesize: Tuple[float, float] = None, margin: float = None):
+        """Öffnet die PDF-Datei.
+        
+        Args:
+            output_path: Zieldatei
+            pagesize: Seitengröße in Punkt (Standard: US Letter)
+            margin: Seitenrand in Punkt (Standard: 1 Zoll)
+        """
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.pdfgen.canvas import Canvas
+        
+        self.pagesize = pagesize or letter
+        self.margin = inch if margin is None else margin
+        self.canvas = Canvas(output_path, pagesize=self.pagesize, pageCompression=1)
+        self.pages = 0
+        self._frame = None
+        self._frame_used = False
+    
+    @property
+    def page_number(self) -> int:
+        """Nummer der Seite (1-basiert), auf die das nächste Element gesetzt wird."""
+        return self.pages + 1
+    
+    def _new_frame(self):
+        from reportlab.platypus import Frame
+        
+        width, height = self.pagesize
+        self._frame = Frame(self.margin, self.margin, width - 2*self.margin, height - 2*self.margin)
+        self._frame_used = False
+    
+    def new_page(self):
+        """Schließt die aktuelle Seite ab, sofern sie Inhalt hat."""
+        if self._frame is not None and self._frame_used:
+            self.canvas.showPage()
+            self.pages += 1
+        self._frame = None
+    
+    def add(self, flowable):
+        """Setzt ein Element und teilt es bei Bedarf auf mehrere Seiten auf."""
+        pending = [flowable]
+        while pending:
+            if self._frame is None:
+                self._new_frame()
+            
+            head = pending.pop(0)
+            if self._frame.add(head, self.canvas, trySplit=0):
+                self._frame_used = True
+                continue
+            
+            parts = self._frame.split(head, self.canvas)
+            if len(parts) > 1 and self._frame.add(parts[0], self.canvas, trySplit=0):
+                self._frame_used = True
+                pending[:0] = parts[1:]
+                continue
+            
+            if not self._frame_used:
+                raise ValueError("Element passt auf keine PDF-Seite")
+            self.new_page()
+            pending.insert(0, head)
+    
+    def add_all(self, flowables: Iterable[Any]):
+        """Setzt alle Elemente eines Iterators nacheinander."""
+        for flowable in flowables:
+            self.add(flowable)
+    
+    def close(self) -> int:
+        """Schließt die letzte Seite ab und speichert die Datei.
+        
+        Returns:
+            Anzahl der Seiten
+        """
+        if (self._frame is not None and self._frame_used) or self.pages == 0:
+            self.canvas.showPage()
+            self.pages += 1
+        self._frame = None
+        self.canvas.save()
+        return self.pages
+
+
+# Spaltendateiformat des Formats "columnar": Magic, Header-Länge (uint64 LE),
+# JSON-Header mit Spaltenbeschreibungen, danach die Spaltendaten auf
+# COLUMNAR_ALIGNMENT Bytes ausgerichtet, damit sie direkt gemappt werden können
+COLUMNAR_MAGIC = b"OCRCOL1\0"
+COLUMNAR_ALIGNMENT = 64
+
+
+class ColumnarStrings:
+    """Textspalte aus Offsets (int64, N+1) und UTF-8-Bytes (uint8).
+    
+    Einzelne Werte werden erst beim Zugriff dekodiert.
+    """
+    
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.data[start:end].tobytes().decode("utf-8")
+    
+    def __iter__(self):
+        return iter(self.tolist())
+    
+    def tolist(self) -> List[str]:
+        """Dekodiert die gesamte Spalte."""
+        raw = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        return [raw[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+    
+    @staticmethod
+    def encode(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Kodiert Strings in Offsets und Bytes."""
+        encoded = [str(value).encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _write_columnar_file(output_path: str, document_id: str, tables: Dict[str, Dict[str, Any]]):
+    """Schreibt Tabellen aus NumPy-Arrays und Textspalten in eine Spaltendatei.
+    
+    Args:
+        output_path: Zieldatei
+        document_id: Dokument-ID für den Header
+        tables: {Tabelle: {Spalte: np.ndarray oder Liste von Strings}}
+    """
+    header = {"version": 1, "document_id": document_id, "tables": {}}
+    arrays = []
+    offset = 0
+    
+    for table_name, columns in tables.items():
+        table = {"rows": 0, "columns": {}, "strings": []}
+        for column_name, values in columns.items():
+            if isinstance(values, np.ndarray):
+                parts = {column_name: values}
+            else:
+                string_offsets, string_data = ColumnarStrings.encode(values)
+                parts = {f"{column_name}.offsets": string_offsets, f"{column_name}.data": string_data}
+                table["strings"].append(column_name)
+                values = string_offsets[:-1]
+            table["rows"] = len(values)
+            
+            for part_name, array in parts.items():
+                array = np.ascontiguousarray(array)
+                offset += -offset % COLUMNAR_ALIGNMENT
+                table["columns"][part_name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+                arrays.append((offset, array))
+                offset += array.nbytes
+        header["tables"][table_name] = table
+    
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = len(COLUMNAR_MAGIC) + 8 + len(header_bytes)
+    data_start += -data_start % COLUMNAR_ALIGNMENT
+    
+    with open(output_path, "wb") as f:
+        f.write(COLUMNAR_MAGIC)
+        f.write(len(header_bytes).to_bytes(8, "little"))
+        f.write(header_bytes)
+        for array_offset, array in arrays:
+            f.seek(data_start + array_offset)
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+
+
+def load_columnar_output(path: str) -> Dict[str, Any]:
+    """Lädt eine Ausgabe des Formats "columnar" per Memory-Mapping.
+    
+    Die Spalten werden nicht kopiert, sondern als schreibgeschützte Sichten auf
+    die Datei geliefert; Textspalten als ColumnarStrings.
+    
+    Args:
+        path: Pfad zur .cols-Datei
+        
+    Returns:
+        Dict mit "document_id", "header" und je Tabelle einem Dict der Spalten
+    """
+    with open(path, "rb") as f:
+        if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"Keine Spaltendatei: {path}")
+        header_length = int.from_bytes(f.read(8), "little")
+        header = json.loads(f.read(header_length))
+    
+    data_start = len(COLUMNAR_MAGIC) + 8 + header_length
+    data_start += -data_start % COLUMNAR_ALIGNMENT
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    
+    result = {"document_id": header.get("document_id", ""), "header": header}
+    for table_name, table in header["tables"].items():
+        arrays = {}
+        for column_name, column in table["columns"].items():
+            dtype = np.dtype(column["dtype"])
+            start = data_start + column["offset"]
+            count = int(np.prod(column["shape"], dtype=np.int64))
+            arrays[column_name] = mapped[start:start + count * dtype.itemsize].view(dtype).reshape(column["shape"])
+        
+        columns = {name: array for name, array in arrays.items() if "." not in name}
+        for column_name in table["strings"]:
+            columns[column_name] = ColumnarStrings(arrays[f"{column_name}.offsets"], arrays[f"{column_name}.data"])
+        result[table_name] = columns
+    
+    return result
+
+
+def load_batch_entry(index_path: str, doc_id: str, output_format: str) -> Any:
+    """Liest das Ergebnis eines Dokuments aus einer Ausgabe von process_batch().
+    
+    Args:
+        index_path: Pfad zur Indexdatei (<batch>.index.json)
+        doc_id: Dokument-ID
+        output_format: "json", "csv", "pdf" oder "thumbnail"
+        
+    Returns:
+        JSON: Dokument-Dict; CSV: Liste der Zeilen; Thumbnail: JPEG-Bytes;
+        PDF: Dict mit Pfad, erster Seite (1-basiert) und Seitenanzahl
+    """
+    import csv
+    import zipfile
+    
+    with open(index_path, encoding="utf-8") as f:
+        index = json.load(f)
+    
+    entry = next((entry for entry in index["documents"] if entry["doc_id"] == doc_id), None)
+    if entry is None or output_format not in entry:
+        raise KeyError(f"Kein {output_format}-Ergebnis für Dokument {doc_id} im Batch")
+    
+    location = entry[output_format]
+    path = os.path.join(os.path.dirname(index_path), index["files"][output_format])
+    
+    if output_format == "thumbnail":
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(location["member"])
+    if output_format == "pdf":
+        return {"path": path, "page": location["page"], "pages": location["pages"]}
+    
+    with open(path, "rb") as f:
+        f.seek(location["offset"])
+        data = f.read(location["length"])
+    
+    if output_format == "json":
+        return json.loads(data)
+    return list(csv.reader(io.StringIO(data.decode("utf-8"))))
+
+
+# Pro Workerprozess wiederverwendeter Prozessor für _run_output_generator
+_worker_processor = None
+_worker_config = None
+
+
+def _run_output_generator(config: Dict[str, Any], output_format: str, content: Dict[str, Any],
+                          output_path: str, options: Dict[str, Any]):
+    """Führt einen Formatgenerator in einem Workerprozess aus.
+    
+    Gebundene Methoden samt Prozessorzustand werden nicht übertragen; jeder
+    Worker baut sich einmalig einen eigenen MultiOutputProcessor aus der
+    Konfiguration. Die API-Weiterleitung bleibt dabei abgeschaltet, da
+    Forwarder und Outbox ausschließlich dem Hauptprozess gehören.
+    
+    Returns:
+        Tupel aus Formatergebnis, Laufzeit in Sekunden, Erfolgskennzeichen und
+        Kennzahlen des Bild-Caches im Worker (oder None)
+    """
+    global _worker_processor, _worker_config
+    if _worker_processor is None or _worker_config != config:
+        worker_config = {key: value for key, value in config.items() if not key.startswith("api_outbox")}
+        worker_config["enable_api_forwarding"] = False
+        _worker_processor = MultiOutputProcessor(worker_config)
+        _worker_config = config
+    processor = _worker_processor
+    image_resolver = options.get("image_cache")
+    outcome = processor._run_timed(output_format, content, output_path, options)
+    return outcome + (image_resolver.get_stats() if image_resolver is not None else None,)
+
 
 class MultiOutputProcessor:
     """Multi-Output-Prozessor für das Universal OCR Tool 2.0.
@@ -27,6 +1420,20 @@ class MultiOutputProcessor:
     - Kombinierte Ausgabedokumente mit Text und Bildern
     """
     
+    # Formate, die Ergebnisse anderer Formate über options["outputs"] einbinden
+    FORMAT_DEPENDENCIES = {
+        "markdown": ("image_annotated",),
+        "html": ("image_annotated",),
+        "docx": ("image_annotated",),
+        "combined": ("image_annotated", "thumbnail")
+    }
+    
+    # Formate, die auch im Prozessmodus im Hauptprozess laufen
+    LOCAL_FORMATS = ("api",)
+    
+    # Formate, die process_batch() in eine gemeinsame Datei schreibt (mit Dateierweiterung)
+    BATCH_FORMATS = {"json": "jsonl", "csv": "csv", "pdf": "pdf", "thumbnail": "zip"}
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialisiert den Multi-Output-Prozessor mit Konfiguration.
         
@@ -44,6 +1451,25 @@ class MultiOutputProcessor:
         self.enable_thumbnails = config.get("enable_thumbnails", True)
         self.thumbnail_size = config.get("thumbnail_size", (200, 200))
         self.max_filename_length = config.get("max_filename_length", 100)
+        self.json_compact = config.get("json_compact", False)
+        self.json_backend = config.get("json_backend", "json")
+        self.pdf_table_chunk_rows = config.get("pdf_table_chunk_rows", 100)
+        self.inline_images = config.get("inline_images", False)
+        
+        # Vorkompilierte HTML- und Markdown-Vorlagen
+        self.templates = OutputTemplates()
+        
+        # Ausführung der Formatgeneratoren: "sequential", "thread" oder "process"
+        self.execution_mode = config.get("output_execution", "sequential")
+        self.output_workers = config.get("output_workers", None)
+        self._executor = None
+        
+        # Asynchrone API-Weiterleitung (wird bei Bedarf angelegt)
+        self.api_forwarder = None
+        self._forwarder_lock = threading.Lock()
+        if self.enable_api_forwarding and config.get("api_outbox_path"):
+            # Mit Outbox sofort starten, damit ein Rückstand aus früheren Läufen zugestellt wird
+            self._get_api_forwarder().start()
         
         # Erstelle Ausgabeverzeichnis falls nicht vorhanden
         os.makedirs(self.output_dir, exist_ok=True)
@@ -60,7 +1486,8 @@ class MultiOutputProcessor:
             "markdown": self._generate_markdown_output,
             "html": self._generate_html_output,
             "docx": self._generate_docx_output,
-            "combined": self._generate_combined_output
+            "combined": self._generate_combined_output,
+            "columnar": self._generate_columnar_output
         }
         
         self.logger.info("Multi-Output-Prozessor initialisiert")
@@ -75,7 +1502,7 @@ class MultiOutputProcessor:
             options: Zusätzliche verarbeitungsspezifische Optionen
             
         Returns:
-            Dictionary mit Verarbeitungsergebnissen und Dateipfaden
+            Dictionary mit Verarbeitungsergebnissen, Dateipfaden und Laufzeiten pro Format
         """
         if formats is None:
             formats = self.default_formats
@@ -94,36 +1521,350 @@ class MultiOutputProcessor:
             "base_info": {
                 "timestamp": timestamp,
                 "doc_id": doc_id,
-                "formats_processed": []
+                "formats_processed": [],
+                "timings": {}
             },
             "outputs": {}
         }
         
-        # Verarbeite jedes angeforderte Format
-        for output_format in formats:
-            if output_format in self.output_processors:
+        format_results = {}
+        requested = []
+        for output_format in formats:
+            if output_format in self.output_processors:
+                if output_format not in requested:
+                    requested.append(output_format)
+            else:
+                self.logger.warning(f"Unbekanntes Ausgabeformat: {output_format}")
+                format_results[output_format] = {"error": "Format nicht unterstützt"}
+        
+        # Generiere einen formatspezifischen Dateinamen
+        format_paths = {
+            output_format: os.path.join(self.output_dir, f"{base_filename}.{self._get_extension(output_format)}")
+            for output_format in requested
+        }
+        
+        # Gemeinsamer Bild-Cache aller Generatoren dieser Anfrage
+        image_resolver = None
+        if "images" in content and "original" in content["images"]:
+            image_resolver = ImageResolver(content["images"]["original"])
+            options = dict(options, image_cache=image_resolver)
+        
+        start_time = time.perf_counter()
+        if self.execution_mode in ("thread", "process") and len(requested) > 1:
+            completed = self._run_concurrent(requested, content, format_paths, options)
+        else:
+            completed = self._run_sequential(requested, content, format_paths, options)
+        results["base_info"]["total_time"] = time.perf_counter() - start_time
+        if image_resolver is not None:
+            results["base_info"]["image_cache"] = image_resolver.get_stats()
+        
+        failed = set(format_results)
+        for output_format, (format_result, elapsed, succeeded) in completed.items():
+            format_results[output_format] = format_result
+            results["base_info"]["timings"][output_format] = elapsed
+            if not succeeded:
+                failed.add(output_format)
+        
+        # Speichere Ergebnisse in der angeforderten Reihenfolge
+        for output_format in formats:
+            format_result = format_results.get(output_format)
+            if output_format in results["outputs"] or not format_result:
+                continue
+            results["outputs"][output_format] = format_result
+            if output_format not in failed:
+                results["base_info"]["formats_processed"].append(output_format)
+        
+        return results
+    
+    def process_batch(self, contents: Iterable[Dict[str, Any]], formats: Optional[List[str]] = None,
+                      options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Verarbeitet viele Dokumente in gemeinsame Ausgabedateien.
+        
+        Die Dokumente werden nacheinander gelesen und direkt in konsolidierte
+        Dateien geschrieben: JSON als JSONL (ein Dokument pro Zeile), CSV mit
+        zusätzlicher Spalte document_id, ein mehrseitiges PDF und ein
+        ZIP-Archiv mit allen Thumbnails. Eine Indexdatei hält für jedes Dokument
+        Byte-Offsets, Seiten bzw. Archivnamen fest (siehe load_batch_entry()).
+        Formate ohne konsolidierte Variante werden pro Dokument mit process()
+        erzeugt.
+        
+        Args:
+            contents: Iterierbare Folge von Inhalts-Dicts wie bei process()
+            formats: Gewünschte Ausgabeformate; falls None, werden Standardformate verwendet
+            options: Zusätzliche Optionen; "batch_name" bestimmt den Dateinamen
+            
+        Returns:
+            Dictionary mit Zusammenfassung, konsolidierten Ausgaben und Pfad zur Indexdatei
+        """
+        import csv
+        import zipfile
+        
+        if formats is None:
+            formats = self.default_formats
+        
+        if options is None:
+            options = {}
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        batch_name = self._sanitize_filename(options.get("batch_name", f"batch_{timestamp}"))
+        batch_formats = [fmt for fmt in dict.fromkeys(formats) if fmt in self.BATCH_FORMATS]
+        document_formats = [fmt for fmt in dict.fromkeys(formats) if fmt not in self.BATCH_FORMATS]
+        paths = {fmt: os.path.join(self.output_dir, f"{batch_name}.{self.BATCH_FORMATS[fmt]}")
+                 for fmt in batch_formats}
+        index_path = os.path.join(self.output_dir, f"{batch_name}.index.json")
+        csv_export_type = options.get("csv_export_type", "text_blocks")
+        
+        handles = {}
+        pdf_writer = None
+        pdf_pages = 0
+        thumbnails = None
+        documents = []
+        start_time = time.perf_counter()
+        
+        try:
+            if "json" in paths:
+                handles["json"] = open(paths["json"], "wb")
+            if "csv" in paths:
+                handles["csv"] = open(paths["csv"], "wb")
+                header, _ = self._csv_rows({}, csv_export_type)
+                text_buffer = io.StringIO()
+                csv.writer(text_buffer).writerow(["document_id"] + header)
+                handles["csv"].write(text_buffer.getvalue().encode("utf-8"))
+            if "pdf" in paths:
+                pdf_writer = self._open_pdf_writer(paths["pdf"])
+                pdf_styles = self._pdf_styles()
+            if "thumbnail" in paths:
+                thumbnails = zipfile.ZipFile(paths["thumbnail"], "w", zipfile.ZIP_STORED)
+            
+            for position, content in enumerate(contents):
+                doc_id = content.get("doc_id", f"doc_{position}")
+                entry = {"doc_id": doc_id, "position": position}
+                errors = {}
+                
+                # Gemeinsamer Bild-Cache für alle Formate dieses Dokuments
+                doc_options = options
+                if "images" in content and "original" in content["images"]:
+                    doc_options = dict(options, image_cache=ImageResolver(content["images"]["original"]))
+                
+                if "json" in handles:
+                    try:
+                        buffer = io.BytesIO()
+                        self._write_json_document(StreamingJsonWriter(buffer, compact=True,
+                                                                      backend=options.get("json_backend",
+                                                                                          self.json_backend)),
+                                                  content, doc_options)
+                        data = buffer.getvalue() + b"\n"
+                        entry["json"] = {"offset": handles["json"].tell(), "length": len(data)}
+                        handles["json"].write(data)
+                    except Exception as e:
+                        errors["json"] = str(e)
+                
+                if "csv" in handles:
+                    try:
+                        _, rows = self._csv_rows(content, csv_export_type)
+                        text_buffer = io.StringIO()
+                        csv.writer(text_buffer).writerows([doc_id] + row for row in rows)
+                        data = text_buffer.getvalue().encode("utf-8")
+                        entry["csv"] = {"offset": handles["csv"].tell(), "length": len(data), "rows": len(rows)}
+                        handles["csv"].write(data)
+                    except Exception as e:
+                        errors["csv"] = str(e)
+                
+                if pdf_writer is not None:
+                    try:
+                        # Jedes Dokument beginnt auf einer neuen Seite
+                        pdf_writer.new_page()
+                        first_page = pdf_writer.page_number
+                        pdf_writer.add_all(self._pdf_elements(content, doc_options, pdf_styles))
+                        entry["pdf"] = {"page": first_page, "pages": pdf_writer.page_number - first_page + 1}
+                    except Exception as e:
+                        errors["pdf"] = str(e)
+                
+                if thumbnails is not None and "images" in content and "original" in content["images"]:
+                    try:
+                        data, _, _ = self._render_thumbnail(content, doc_options)
+                        member = f"{position:06d}_{self._sanitize_filename(str(doc_id))}.jpg"
+                        thumbnails.writestr(member, data)
+                        entry["thumbnail"] = {"member": member, "size": len(data)}
+                    except Exception as e:
+                        errors["thumbnail"] = str(e)
+                
+                if document_formats:
+                    document_result = self.process(content, document_formats, options)
+                    entry["outputs"] = document_result["outputs"]
+                
+                if errors:
+                    self.logger.error(f"Fehler bei Dokument {doc_id} im Batch: {errors}")
+                    entry["errors"] = errors
+                documents.append(entry)
+        finally:
+            for handle in handles.values():
+                handle.close()
+            if pdf_writer is not None:
+                pdf_pages = pdf_writer.close()
+            if thumbnails is not None:
+                thumbnails.close()
+        
+        total_time = time.perf_counter() - start_time
+        outputs = {fmt: {"path": path, "format": fmt, "size": os.path.getsize(path)} for fmt, path in paths.items()}
+        if "pdf" in outputs:
+            outputs["pdf"]["pages"] = pdf_pages
+        
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump({"batch_name": batch_name, "timestamp": timestamp,
+                       "files": {fmt: os.path.basename(path) for fmt, path in paths.items()},
+                       "documents": documents}, f, ensure_ascii=False)
+        
+        return {
+            "base_info": {
+                "timestamp": timestamp,
+                "batch_name": batch_name,
+                "documents": len(documents),
+                "formats_processed": batch_formats + document_formats,
+                "errors": sum(1 for entry in documents if "errors" in entry),
+                "total_time": total_time,
+                "docs_per_sec": len(documents) / total_time if total_time > 0 else 0.0
+            },
+            "outputs": outputs,
+            "index": index_path
+        }
+    
+    def _format_dependencies(self, output_format: str, requested: List[str]) -> List[str]:
+        """Liefert die angeforderten Formate, von denen ein Format abhängt."""
+        return [dep for dep in self.FORMAT_DEPENDENCIES.get(output_format, ()) if dep in requested]
+    
+    def _format_options(self, output_format: str, requested: List[str], options: Dict[str, Any],
+                        completed: Dict[str, Any]) -> Dict[str, Any]:
+        """Erstellt die Optionen für einen Generator inklusive Ergebnissen seiner Abhängigkeiten."""
+        dependency_outputs = {
+            dep: completed[dep][0] for dep in self._format_dependencies(output_format, requested)
+            if dep in completed and completed[dep][2] and completed[dep][0]
+        }
+        if not dependency_outputs:
+            return options
+        
+        outputs = dict(options.get("outputs", {}))
+        outputs.update(dependency_outputs)
+        return dict(options, outputs=outputs)
+    
+    def _run_timed(self, output_format: str, content: Dict[str, Any], output_path: str,
+                   options: Dict[str, Any]):
+        """Führt einen Formatgenerator aus und misst seine Laufzeit.
+        
+        Returns:
+            Tupel aus Formatergebnis (bzw. Fehlerbeschreibung), Laufzeit in Sekunden
+            und Erfolgskennzeichen
+        """
+        start_time = time.perf_counter()
+        try:
+            # Verarbeite Format mit entsprechendem Prozessor
+            format_result = self.output_processors[output_format](content, output_path, options)
+            succeeded = True
+        except Exception as e:
+            self.logger.error(f"Fehler bei Verarbeitung von Format {output_format}: {e}")
+            format_result = {"error": str(e)}
+            succeeded = False
+        return format_result, time.perf_counter() - start_time, succeeded
+    
+    def _dependency_order(self, requested: List[str]) -> List[str]:
+        """Sortiert die Formate so, dass Abhängigkeiten vor ihren Nutzern stehen."""
+        ordered = []
+        for output_format in requested:
+            for dep in self._format_dependencies(output_format, requested):
+                if dep not in ordered:
+                    ordered.append(dep)
+            if output_format not in ordered:
+                ordered.append(output_format)
+        return ordered
+    
+    def _run_sequential(self, requested: List[str], content: Dict[str, Any],
+                        format_paths: Dict[str, str], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Führt die Formatgeneratoren nacheinander in Abhängigkeitsreihenfolge aus."""
+        completed = {}
+        for output_format in self._dependency_order(requested):
+            format_options = self._format_options(output_format, requested, options, completed)
+            completed[output_format] = self._run_timed(output_format, content,
+                                                       format_paths[output_format], format_options)
+        return completed
+    
+    def _run_concurrent(self, requested: List[str], content: Dict[str, Any],
+                        format_paths: Dict[str, str], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Führt unabhängige Formatgeneratoren parallel aus.
+        
+        Ein Format wird gestartet, sobald alle angeforderten Formate, von denen
+        es abhängt, abgeschlossen sind (z. B. html nach image_annotated).
+        """
+        executor = self._get_executor()
+        completed = {}
+        running = {}
+        waiting = list(requested)
+        
+        while waiting or running:
+            for output_format in list(waiting):
+                if all(dep in completed for dep in self._format_dependencies(output_format, requested)):
+                    waiting.remove(output_format)
+                    format_options = self._format_options(output_format, requested, options, completed)
+                    if self.execution_mode == "process" and output_format in self.LOCAL_FORMATS:
+                        # Nur einreihen; der Forwarder muss im Hauptprozess weiterleben
+                        completed[output_format] = self._run_timed(output_format, content,
+                                                                   format_paths[output_format], format_options)
+                        continue
+                    if self.execution_mode == "process":
+                        future = executor.submit(_run_output_generator, self.config, output_format, content,
+                                                 format_paths[output_format], format_options)
+                    else:
+                        future = executor.submit(self._run_timed, output_format, content,
+                                                 format_paths[output_format], format_options)
+                    running[future] = output_format
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                output_format = running.pop(future)
                 try:
-                    # Generiere einen formatspezifischen Dateinamen
-                    format_filename = f"{base_filename}.{self._get_extension(output_format)}"
-                    format_path = os.path.join(self.output_dir, format_filename)
-                    
-                    # Verarbeite Format mit entsprechendem Prozessor
-                    format_result = self.output_processors[output_format](
-                        content, format_path, options
-                    )
-                    
-                    # Speichere Ergebnis
-                    if format_result:
-                        results["outputs"][output_format] = format_result
-                        results["base_info"]["formats_processed"].append(output_format)
+                    outcome = future.result()
+                    if len(outcome) == 4:
+                        # Ergebnis eines Workerprozesses mit eigenem Bild-Cache
+                        if outcome[3] is not None:
+                            options["image_cache"].merge_stats(outcome[3])
+                        outcome = outcome[:3]
+                    completed[output_format] = outcome
                 except Exception as e:
                     self.logger.error(f"Fehler bei Verarbeitung von Format {output_format}: {e}")
-                    results["outputs"][output_format] = {"error": str(e)}
+                    completed[output_format] = ({"error": str(e)}, 0.0, False)
+        
+        return completed
+    
+    def _get_executor(self):
+        """Liefert den persistenten Thread- bzw. Prozesspool für die Formatgeneratoren."""
+        if self._executor is None:
+            if self.execution_mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.output_workers)
             else:
-                self.logger.warning(f"Unbekanntes Ausgabeformat: {output_format}")
-                results["outputs"][output_format] = {"error": "Format nicht unterstützt"}
+                self._executor = ThreadPoolExecutor(max_workers=self.output_workers,
+                                                    thread_name_prefix="output-format")
+        return self._executor
+    
+    def shutdown(self):
+        """Beendet den Pool für die Formatgenerierung und stellt ausstehende API-Aufrufe zu."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.api_forwarder is not None:
+            self.api_forwarder.close()
+            self.api_forwarder = None
+    
+    def _get_image_resolver(self, content: Dict[str, Any], options: Dict[str, Any]) -> Optional[ImageResolver]:
+        """Liefert den Bild-Cache der Anfrage bzw. einen neuen bei direktem Generatoraufruf.
         
-        return results
+        Returns:
+            ImageResolver für das Originalbild oder None, wenn kein Bild vorhanden ist
+        """
+        resolver = options.get("image_cache")
+        if resolver is not None:
+            return resolver
+        if "images" in content and "original" in content["images"]:
+            return ImageResolver(content["images"]["original"])
+        return None
     
     def _sanitize_filename(self, filename: str) -> str:
         """Bereinigt einen Dateinamen von ungültigen Zeichen.
@@ -165,7 +1906,8 @@ class MultiOutputProcessor:
             "markdown": "md",
             "html": "html",
             "docx": "docx",
-            "combined": "pdf"
+            "combined": "pdf",
+            "columnar": "cols"
         }
         
         return extensions.get(output_format, "dat")
@@ -216,49 +1958,65 @@ class MultiOutputProcessor:
         Returns:
             Ergebnisinformationen
         """
-        # Bereite JSON-Ausgabe vor
-        output_data = {}
+        with open(output_path, "wb") as f:
+            writer = StreamingJsonWriter(f, compact=options.get("json_compact", self.json_compact),
+                                         backend=options.get("json_backend", self.json_backend))
+            keys = self._write_json_document(writer, content, options)
+        
+        return {
+            "path": output_path,
+            "format": "json",
+            "size": os.path.getsize(output_path),
+            "keys": keys,
+            "backend": writer.backend
+        }
+    
+    def _write_json_document(self, writer: StreamingJsonWriter, content: Dict[str, Any],
+                             options: Dict[str, Any]) -> List[str]:
+        """Schreibt ein Dokument als JSON-Objekt über einen StreamingJsonWriter.
+        
+        Returns:
+            Liste der geschriebenen Schlüssel
+        """
+        keys = []
+        writer.begin_object()
         
         # Füge grundlegende Informationen hinzu
-        output_data["document_id"] = content.get("doc_id", "")
-        output_data["timestamp"] = datetime.now().isoformat()
-        output_data["text"] = content.get("text", "")
+        writer.value(content.get("doc_id", ""), "document_id")
+        writer.value(datetime.now().isoformat(), "timestamp")
+        writer.value(content.get("text", ""), "text")
+        keys.extend(["document_id", "timestamp", "text"])
         
         # Füge strukturierte Daten hinzu, wenn verfügbar
         if "text_blocks" in content:
-            output_data["text_blocks"] = content["text_blocks"]
+            writer.items(content["text_blocks"], "text_blocks")
+            keys.append("text_blocks")
         
         if "metadata" in content:
-            output_data["metadata"] = content["metadata"]
+            writer.value(content["metadata"], "metadata")
+            keys.append("metadata")
         
         # Füge Erkennungsdetails hinzu, wenn verfügbar und gewünscht
         if "detections" in content and options.get("include_detections", True):
-            output_data["detections"] = content["detections"]
+            writer.items(content["detections"], "detections")
+            keys.append("detections")
         
         # Je nach Optionen Bilder einbetten oder ausschließen
         if "images" in content and options.get("include_images", False):
-            # Konvertiere Bilder zu Base64
-            output_data["images"] = {}
+            # Bilder blockweise als Base64 schreiben
+            writer.begin_object("images")
             for image_key, image_data in content["images"].items():
                 if isinstance(image_data, np.ndarray):
-                    # Konvertiere NumPy-Array zu Base64
                     _, buffer = cv2.imencode(".png", image_data)
-                    output_data["images"][image_key] = base64.b64encode(buffer).decode('utf-8')
+                    writer.base64(buffer, image_key)
                 elif isinstance(image_data, str) and os.path.exists(image_data):
-                    # Lade Bilddatei und konvertiere zu Base64
                     with open(image_data, "rb") as img_file:
-                        output_data["images"][image_key] = base64.b64encode(img_file.read()).decode('utf-8')
+                        writer.base64(img_file, image_key)
+            writer.end_object()
+            keys.append("images")
         
-        # Speichern der JSON-Datei
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-        
-        return {
-            "path": output_path,
-            "format": "json",
-            "size": os.path.getsize(output_path),
-            "keys": list(output_data.keys())
-        }
+        writer.end_object()
+        return keys
     
     def _generate_pdf_output(self, content: Dict[str, Any], output_path: str,
                             options: Dict[str, Any]) -> Dict[str, Any]:
@@ -272,18 +2030,82 @@ class MultiOutputProcessor:
         Returns:
             Ergebnisinformationen
         """
+        writer = self._open_pdf_writer(output_path)
+        
+        # Elemente werden einzeln erzeugt und sofort gesetzt
+        try:
+            writer.add_all(self._pdf_elements(content, options, self._pdf_styles()))
+        finally:
+            pages = writer.close()
+        
+        return {
+            "path": output_path,
+            "format": "pdf",
+            "size": os.path.getsize(output_path),
+            "pages": pages
+        }
+    
+    def _open_pdf_writer(self, output_path: str) -> StreamingPdfWriter:
+        """Erstellt einen StreamingPdfWriter und prüft die ReportLab-Installation."""
         try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.lib import colors
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
+            import reportlab
         except ImportError:
             self.logger.error("ReportLab nicht installiert. PDF-Generierung nicht möglich.")
             raise ImportError("ReportLab wird für PDF-Generierung benötigt. Installieren Sie 'reportlab'.")
         
-        # Erstelle PDF-Dokument
-        doc = SimpleDocTemplate(output_path, pagesize=letter)
+        return StreamingPdfWriter(output_path)
+    
+    def _pdf_paragraphs(self, text: str, style) -> Iterable[Any]:
+        """Erzeugt Absätze (durch Leerzeilen getrennt) samt Abstand, ohne den Text vorab zu teilen."""
+        from reportlab.platypus import Paragraph, Spacer
+        from reportlab.lib.units import inch
+        
+        start = 0
+        while start <= len(text):
+            end = text.find('\n\n', start)
+            if end < 0:
+                end = len(text)
+            para = text[start:end]
+            start = end + 2
+            if para.strip():
+                yield Paragraph(para.replace('\n', '<br/>'), style)
+                yield Spacer(1, 0.1*inch)
+    
+    def _pdf_table_chunks(self, header: List[str], rows: Iterable[List[Any]], col_widths: List[float],
+                          extra_style: List[Tuple] = ()) -> Iterable[Any]:
+        """Erzeugt eine Tabelle in Abschnitten von `pdf_table_chunk_rows` Zeilen.
+        
+        Jeder Abschnitt ist eine eigene Tabelle mit Kopfzeile, die beim Umbruch
+        wiederholt wird. Große Tabellen werden so nie vollständig aufgebaut und
+        ReportLab muss beim Seitenumbruch nur den aktuellen Abschnitt neu vermessen.
+        """
+        from reportlab.lib import colors
+        from reportlab.platypus import Table, TableStyle
+        
+        style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ] + list(extra_style))
+        
+        chunk = []
+        emitted = False
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.pdf_table_chunk_rows:
+                yield Table([header] + chunk, colWidths=col_widths, style=style, repeatRows=1)
+                chunk = []
+                emitted = True
+        if chunk or not emitted:
+            yield Table([header] + chunk, colWidths=col_widths, style=style, repeatRows=1)
+    
+    def _pdf_styles(self):
+        """Erstellt die Absatzstile für PDF-Ausgaben."""
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        
         styles = getSampleStyleSheet()
         
         # Benutzerdefinierter Stil für erkannten Text
@@ -293,66 +2115,50 @@ class MultiOutputProcessor:
             fontSize=11,
             leading=14,
         ))
+        return styles
+    
+    def _pdf_elements(self, content: Dict[str, Any], options: Dict[str, Any], styles) -> Iterable[Any]:
+        """Erzeugt die ReportLab-Elemente eines Dokuments (Titel, Bild, Text) nacheinander.
         
-        # Elemente für das PDF
-        elements = []
+        Args:
+            content: Verarbeiteter Inhalt
+            options: Verarbeitungsoptionen
+            styles: Stile aus _pdf_styles()
+            
+        Returns:
+            Generator von Flowables
+        """
+        from reportlab.platypus import Paragraph, Spacer, Image as RLImage
+        from reportlab.lib.units import inch
         
         # Titel und Metadaten
         title = content.get("doc_id", "OCR-Ergebnis")
-        elements.append(Paragraph(f"<b>{title}</b>", styles["Title"]))
-        elements.append(Spacer(1, 0.25*inch))
+        yield Paragraph(f"<b>{title}</b>", styles["Title"])
+        yield Spacer(1, 0.25*inch)
         
         # Zeitstempel
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        elements.append(Paragraph(f"Generiert am: {timestamp}", styles["Normal"]))
-        elements.append(Spacer(1, 0.25*inch))
+        yield Paragraph(f"Generiert am: {timestamp}", styles["Normal"])
+        yield Spacer(1, 0.25*inch)
         
         # Füge Bild hinzu, wenn vorhanden und gewünscht
         if "images" in content and options.get("include_images", True):
             original_image = content["images"].get("original")
             if original_image is not None:
-                # Temporäre Bilddatei für ReportLab erstellen
+                # ReportLab liest das kodierte Bild direkt aus dem Speicher
                 if isinstance(original_image, np.ndarray):
-                    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-                        temp_filename = temp_file.name
-                        cv2.imwrite(temp_filename, original_image)
-                        
-                    img = RLImage(temp_filename, width=6*inch, height=4*inch)
-                    elements.append(img)
-                    elements.append(Spacer(1, 0.25*inch))
-                    
-                    # Lösche temporäre Datei
-                    try:
-                        os.unlink(temp_filename)
-                    except:
-                        pass
+                    image_buffer = io.BytesIO(self._get_image_resolver(content, options).encoded(".jpg"))
+                    yield RLImage(image_buffer, width=6*inch, height=4*inch)
+                    yield Spacer(1, 0.25*inch)
                 elif isinstance(original_image, str) and os.path.exists(original_image):
-                    img = RLImage(original_image, width=6*inch, height=4*inch)
-                    elements.append(img)
-                    elements.append(Spacer(1, 0.25*inch))
+                    yield RLImage(original_image, width=6*inch, height=4*inch)
+                    yield Spacer(1, 0.25*inch)
         
         # Füge erkannten Text hinzu
         if "text" in content and content["text"]:
-            elements.append(Paragraph("<b>Erkannter Text:</b>", styles["Heading2"]))
-            elements.append(Spacer(1, 0.1*inch))
-            
-            text = content["text"]
-            # Teile Text in Absätze
-            paragraphs = text.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    elements.append(Paragraph(para.replace('\n', '<br/>'), styles["OCRText"]))
-                    elements.append(Spacer(1, 0.1*inch))
-        
-        # Erstelle das PDF
-        doc.build(elements)
-        
-        return {
-            "path": output_path,
-            "format": "pdf",
-            "size": os.path.getsize(output_path),
-            "pages": 1  # In einer erweiterten Version könnte die tatsächliche Seitenzahl berechnet werden
-        }
+            yield Paragraph("<b>Erkannter Text:</b>", styles["Heading2"])
+            yield Spacer(1, 0.1*inch)
+            yield from self._pdf_paragraphs(content["text"], styles["OCRText"])
     
     def _generate_annotated_image(self, content: Dict[str, Any], output_path: str,
                                 options: Dict[str, Any]) -> Dict[str, Any]:
@@ -371,21 +2177,15 @@ class MultiOutputProcessor:
             self.logger.error("Kein Bild für Annotation vorhanden")
             raise ValueError("Kein Bild für Annotation verfügbar")
         
-        # Hole Originalbild
-        original_image = content["images"]["original"]
+        # Hole Originalbild aus dem gemeinsamen Bild-Cache
+        image_resolver = self._get_image_resolver(content, options)
         
-        if isinstance(original_image, str) and os.path.exists(original_image):
-            # Lade Bild aus Dateipfad
-            image = cv2.imread(original_image)
-        elif isinstance(original_image, np.ndarray):
-            # Verwende NumPy-Array direkt
-            image = original_image.copy()
-        else:
+        if not image_resolver.is_valid:
             self.logger.error("Ungültiges Bildformat für Annotation")
             raise ValueError("Bild muss als NumPy-Array oder gültiger Dateipfad vorliegen")
         
         # Hole erkannte Textblöcke
-        annotated_image = image.copy()
+        annotated_image = image_resolver.image().copy()
         
         # Zeichne Textregionen ein, falls vorhanden
         if "text_blocks" in content:
@@ -452,24 +2252,38 @@ class MultiOutputProcessor:
         Returns:
             Ergebnisinformationen
         """
+        data, width, height = self._render_thumbnail(content, options)
+        with open(output_path, "wb") as f:
+            f.write(data)
+        
+        return {
+            "path": output_path,
+            "format": "thumbnail",
+            "size": os.path.getsize(output_path),
+            "dimensions": f"{width}x{height}"
+        }
+    
+    def _render_thumbnail(self, content: Dict[str, Any], options: Dict[str, Any]) -> Tuple[bytes, int, int]:
+        """Erzeugt ein Thumbnail als JPEG-Bytes.
+        
+        Returns:
+            Tupel aus JPEG-Daten, Breite und Höhe
+        """
         # Überprüfe, ob ein Bild vorhanden ist
         if "images" not in content or "original" not in content["images"]:
             self.logger.error("Kein Bild für Thumbnail-Generierung vorhanden")
             raise ValueError("Kein Bild für Thumbnail verfügbar")
         
-        # Hole Originalbild
-        original_image = content["images"]["original"]
+        # Hole Originalbild aus dem gemeinsamen Bild-Cache
+        image_resolver = self._get_image_resolver(content, options)
         
-        if isinstance(original_image, str) and os.path.exists(original_image):
-            # Lade Bild mit PIL für bessere Größenänderung
-            image = Image.open(original_image)
-        elif isinstance(original_image, np.ndarray):
-            # Konvertiere NumPy-Array zu PIL
-            image = Image.fromarray(cv2.cvtColor(original_image, cv2.COLOR_BGR2RGB))
-        else:
+        if not image_resolver.is_valid:
             self.logger.error("Ungültiges Bildformat für Thumbnail")
             raise ValueError("Bild muss als NumPy-Array oder gültiger Dateipfad vorliegen")
         
+        # PIL für bessere Größenänderung; thumbnail() arbeitet in-place auf einer Kopie
+        image = image_resolver.pil_image().copy()
+        
         # Bestimme Thumbnail-Größe
         thumbnail_size = options.get("thumbnail_size", self.thumbnail_size)
         
@@ -490,22 +2304,26 @@ class MultiOutputProcessor:
             cv2.putText(thumbnail, text_preview, (5, image.height - 10),
                       cv2.FONT_HERSHEY_SIMPLEX, 0.3, (255, 255, 255), 1)
             
-            # Speichere als OpenCV-Bild
-            cv2.imwrite(output_path, thumbnail)
+            # Kodiere als OpenCV-Bild
+            _, buffer = cv2.imencode(".jpg", thumbnail)
+            data = buffer.tobytes()
         else:
-            # Speichere als PIL-Bild
-            image.save(output_path, quality=85)
+            # Kodiere als PIL-Bild
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=85)
+            data = buffer.getvalue()
         
-        return {
-            "path": output_path,
-            "format": "thumbnail",
-            "size": os.path.getsize(output_path),
-            "dimensions": f"{image.width}x{image.height}"
-        }
+        return data, image.width, image.height
     
     def _send_to_api(self, content: Dict[str, Any], output_path: str,
                    options: Dict[str, Any]) -> Dict[str, Any]:
-        """Sendet Daten an eine externe API.
+        """Sendet Daten an externe APIs.
+        
+        Das Dokument wird über den ApiForwarder an alle konfigurierten Endpunkte
+        (bzw. an `api_endpoint` aus den Optionen) verteilt. `api_headers` und
+        `api_timeout` aus den Optionen gelten nur für dieses Dokument.
+        Standardmäßig kehrt der Aufruf sofort zurück; mit `api_wait` wird auf
+        die Zustellung gewartet.
         
         Args:
             content: Verarbeiteter Inhalt
@@ -513,20 +2331,17 @@ class MultiOutputProcessor:
             options: Verarbeitungsoptionen mit API-Konfiguration
             
         Returns:
-            Ergebnisinformationen mit API-Antwort
+            Ergebnisinformationen mit Warteschlangenstatus bzw. API-Antworten
         """
         if not self.enable_api_forwarding:
             self.logger.warning("API-Weiterleitung ist deaktiviert")
             return {"error": "API-Weiterleitung deaktiviert"}
         
-        # API-Endpunkt aus Optionen oder Konfiguration
+        # API-Endpunkt aus Optionen, sonst alle konfigurierten Endpunkte
         api_endpoint = options.get("api_endpoint")
-        if not api_endpoint:
-            # Verwende den ersten konfigurierten Endpunkt
-            if not self.api_endpoints:
-                self.logger.error("Kein API-Endpunkt konfiguriert")
-                return {"error": "Kein API-Endpunkt verfügbar"}
-            api_endpoint = self.api_endpoints[0]
+        if not api_endpoint and not self.api_endpoints:
+            self.logger.error("Kein API-Endpunkt konfiguriert")
+            return {"error": "Kein API-Endpunkt verfügbar"}
         
         # Bereite Daten vor
         payload = {
@@ -544,40 +2359,51 @@ class MultiOutputProcessor:
         if "detections" in content and options.get("include_detections", True):
             payload["detections"] = content["detections"]
         
-        # API-Aufruf-Optionen
-        headers = options.get("api_headers", {"Content-Type": "application/json"})
-        timeout = options.get("api_timeout", 30)
+        # Ohne Überschreibung an alle konfigurierten Endpunkte verteilen
+        if api_endpoint:
+            endpoints = [api_endpoint]
+        else:
+            endpoints = [ApiForwarder._normalize_endpoint(endpoint)["url"] for endpoint in self.api_endpoints]
         
-        try:
-            # Sende Daten an API
-            response = requests.post(api_endpoint, json=payload, headers=headers, timeout=timeout)
-            
-            # Prüfe auf erfolgreichen Aufruf
-            response.raise_for_status()
-            
-            # Speichere API-Antwort als Referenz
-            response_data = response.json() if response.headers.get('content-type') == 'application/json' else {"status": "success"}
-            
-            # Optional, speichere API-Antwort in Datei
-            if options.get("save_response", True):
-                response_path = output_path.replace('.dat', '.json')
-                with open(response_path, 'w', encoding='utf-8') as f:
-                    json.dump(response_data, f, ensure_ascii=False, indent=2)
-            
-            return {
-                "api_endpoint": api_endpoint,
-                "status_code": response.status_code,
-                "response": response_data,
-                "response_path": response_path if options.get("save_response", True) else None
-            }
+        forwarder = self._get_api_forwarder(api_endpoint)
+        futures = forwarder.submit(payload, endpoints=endpoints, headers=options.get("api_headers"),
+                                   timeout=options.get("api_timeout"))
         
-        except requests.RequestException as e:
-            self.logger.error(f"API-Aufruf fehlgeschlagen: {e}")
+        if not options.get("api_wait", False):
             return {
-                "api_endpoint": api_endpoint,
-                "error": str(e),
-                "status": "failed"
+                "api_endpoints": endpoints,
+                "status": "queued",
+                "queue_depth": forwarder.queue_depth()
             }
+        
+        responses = [future.result() for future in futures]
+        response_path = None
+        
+        # Optional, speichere API-Antworten in Datei
+        if options.get("save_response", True):
+            response_path = output_path.replace('.dat', '.json')
+            with open(response_path, 'w', encoding='utf-8') as f:
+                json.dump(responses, f, ensure_ascii=False, indent=2)
+        
+        return {
+            "api_endpoints": endpoints,
+            "status": "failed" if all("error" in response for response in responses) else "delivered",
+            "responses": responses,
+            "response_path": response_path
+        }
+    
+    def _get_api_forwarder(self, extra_endpoint: str = None) -> ApiForwarder:
+        """Liefert den gemeinsamen ApiForwarder und legt ihn bei Bedarf an.
+        
+        Args:
+            extra_endpoint: Endpunkt aus den Verarbeitungsoptionen, der noch nicht konfiguriert ist
+        """
+        with self._forwarder_lock:
+            if self.api_forwarder is None:
+                self.api_forwarder = ApiForwarder(self.api_endpoints, self.config)
+            if extra_endpoint:
+                self.api_forwarder.add_endpoint(extra_endpoint)
+            return self.api_forwarder
     
     def _generate_csv_output(self, content: Dict[str, Any], output_path: str,
                             options: Dict[str, Any]) -> Dict[str, Any]:
@@ -616,47 +2442,13 @@ class MultiOutputProcessor:
         export_type = options.get("csv_export_type", "text_blocks" if has_text_blocks else "detections")
         
         row_count = 0
-        if export_type == "text_blocks" and has_text_blocks:
-            # Exportiere Textblöcke als CSV
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                # Header
-                writer.writerow(["block_id", "text", "confidence", "x", "y", "width", "height"])
-                
-                # Daten
-                for i, block in enumerate(content["text_blocks"]):
-                    text = block.get("text", "")
-                    confidence = block.get("confidence", 0.0)
-                    bbox = block.get("bbox", [0, 0, 0, 0])
-                    
-                    writer.writerow([
-                        i+1,
-                        text,
-                        confidence,
-                        bbox[0], bbox[1], bbox[2], bbox[3]
-                    ])
-                    row_count += 1
-        
-        elif export_type == "detections" and has_detections:
-            # Exportiere Objekterkennungen als CSV
+        if (export_type == "text_blocks" and has_text_blocks) or (export_type == "detections" and has_detections):
+            header, rows = self._csv_rows(content, export_type)
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                # Header
-                writer.writerow(["detection_id", "class_name", "confidence", "x", "y", "width", "height"])
-                
-                # Daten
-                for i, detection in enumerate(content["detections"]):
-                    class_name = detection.get("class_name", "unknown")
-                    confidence = detection.get("confidence", 0.0)
-                    box = detection.get("box", {"x": 0, "y": 0, "width": 0, "height": 0})
-                    
-                    writer.writerow([
-                        i+1,
-                        class_name,
-                        confidence,
-                        box["x"], box["y"], box["width"], box["height"]
-                    ])
-                    row_count += 1
+                writer.writerow(header)
+                writer.writerows(rows)
+            row_count = len(rows)
         
         return {
             "path": output_path,
@@ -666,9 +2458,37 @@ class MultiOutputProcessor:
             "export_type": export_type
         }
     
-    def _generate_markdown_output(self, content: Dict[str, Any], output_path: str,
-                                options: Dict[str, Any]) -> Dict[str, Any]:
-        """Generiert Markdown-Ausgabe mit formatiertem Text und Bildreferenzen.
+    def _csv_rows(self, content: Dict[str, Any], export_type: str) -> Tuple[List[str], List[List[Any]]]:
+        """Erstellt Kopfzeile und Zeilen für den CSV-Export von Textblöcken oder Objekterkennungen.
+        
+        Args:
+            content: Verarbeiteter Inhalt
+            export_type: "text_blocks" oder "detections"
+            
+        Returns:
+            Tupel aus Kopfzeile und Datenzeilen
+        """
+        rows = []
+        if export_type == "text_blocks":
+            for i, block in enumerate(content.get("text_blocks") or []):
+                bbox = block.get("bbox", [0, 0, 0, 0])
+                rows.append([i+1, block.get("text", ""), block.get("confidence", 0.0),
+                             bbox[0], bbox[1], bbox[2], bbox[3]])
+            return ["block_id", "text", "confidence", "x", "y", "width", "height"], rows
+        
+        for i, detection in enumerate(content.get("detections") or []):
+            box = detection.get("box", {"x": 0, "y": 0, "width": 0, "height": 0})
+            rows.append([i+1, detection.get("class_name", "unknown"), detection.get("confidence", 0.0),
+                         box["x"], box["y"], box["width"], box["height"]])
+        return ["detection_id", "class_name", "confidence", "x", "y", "width", "height"], rows
+    
+    def _generate_columnar_output(self, content: Dict[str, Any], output_path: str,
+                                  options: Dict[str, Any]) -> Dict[str, Any]:
+        """Generiert eine binäre Spaltendatei für Objekterkennungen und Textblöcke.
+        
+        Numerische Werte werden als typisierte Arrays gespeichert (class_id int32,
+        confidence float32, box/bbox int32 als (N, 4) mit x, y, Breite, Höhe),
+        Texte als Offsets plus UTF-8-Bytes. Gelesen wird mit load_columnar_output().
         
         Args:
             content: Verarbeiteter Inhalt
@@ -678,78 +2498,92 @@ class MultiOutputProcessor:
         Returns:
             Ergebnisinformationen
         """
-        # Initialisiere Markdown-Dokument
-        md_lines = []
+        tables = {}
         
-        # Titel
-        doc_id = content.get("doc_id", "OCR-Ergebnis")
-        md_lines.append(f"# {doc_id}")
-        md_lines.append("")
+        if "detections" in content and options.get("include_detections", True):
+            detections = content["detections"]
+            boxes = [detection.get("box", {"x": 0, "y": 0, "width": 0, "height": 0}) for detection in detections]
+            tables["detections"] = {
+                "class_id": np.array([detection.get("class_id", -1) for detection in detections], dtype=np.int32),
+                "class_name": [detection.get("class_name", "unknown") for detection in detections],
+                "confidence": np.array([detection.get("confidence", 0.0) for detection in detections],
+                                       dtype=np.float32),
+                "box": np.array([[box["x"], box["y"], box["width"], box["height"]] for box in boxes],
+                                dtype=np.int32).reshape(-1, 4)
+            }
         
-        # Zeitstempel
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        md_lines.append(f"Generiert am: {timestamp}")
-        md_lines.append("")
+        if "text_blocks" in content:
+            blocks = content["text_blocks"]
+            tables["text_blocks"] = {
+                "text": [block.get("text", "") for block in blocks],
+                "confidence": np.array([block.get("confidence", 0.0) for block in blocks], dtype=np.float32),
+                "bbox": np.array([block.get("bbox", [0, 0, 0, 0]) for block in blocks],
+                                 dtype=np.int32).reshape(-1, 4)
+            }
+        
+        _write_columnar_file(output_path, content.get("doc_id", ""), tables)
+        
+        return {
+            "path": output_path,
+            "format": "columnar",
+            "size": os.path.getsize(output_path),
+            "rows": {name: len(next(iter(columns.values()))) for name, columns in tables.items()}
+        }
+    
+    def _generate_markdown_output(self, content: Dict[str, Any], output_path: str,
+                                options: Dict[str, Any]) -> Dict[str, Any]:
+        """Generiert Markdown-Ausgabe mit formatiertem Text und Bildreferenzen.
         
-        # Füge Bild hinzu, wenn vorhanden und Bildausgabe existiert
-        images_dir = options.get("images_dir", "")
+        Args:
+            content: Verarbeiteter Inhalt
+            output_path: Pfad für die Ausgabedatei
+            options: Verarbeitungsoptionen
+            
+        Returns:
+            Ergebnisinformationen
+        """
+        # Bild: annotiertes Bild relativ verlinkt oder als data-URI eingebettet
+        image_src = None
         if "images" in content and options.get("include_images", True):
             # Prüfe, ob ein annotiertes Bild generiert wurde
             if "outputs" in options and "image_annotated" in options["outputs"]:
                 image_path = options["outputs"]["image_annotated"].get("path", "")
-                if image_path:
+                if image_path and options.get("inline_images", self.inline_images):
+                    image_src = self._image_data_uri(image_path)
+                elif image_path:
                     # Verwende relativen Pfad für Markdown
-                    rel_path = os.path.relpath(image_path, os.path.dirname(output_path))
-                    md_lines.append(f"![Annotiertes Bild]({rel_path})")
-                    md_lines.append("")
-        
-        # Erkannter Text
-        if "text" in content and content["text"]:
-            md_lines.append("## Erkannter Text")
-            md_lines.append("")
-            md_lines.append(content["text"])
-            md_lines.append("")
-        
-        # Metadaten
-        if "metadata" in content and options.get("include_metadata", True):
-            md_lines.append("## Metadaten")
-            md_lines.append("")
-            md_lines.append("| Attribut | Wert |")
-            md_lines.append("|----------|------|")
-            
-            for key, value in content["metadata"].items():
-                md_lines.append(f"| {key} | {value} |")
-            
-            md_lines.append("")
-        
-        # Erkannte Objekte
-        if "detections" in content and options.get("include_detections", True):
-            md_lines.append("## Erkannte Objekte")
-            md_lines.append("")
-            md_lines.append("| Klasse | Konfidenz | Position |")
-            md_lines.append("|--------|-----------|----------|")
-            
-            for detection in content["detections"]:
-                class_name = detection.get("class_name", "unbekannt")
-                confidence = detection.get("confidence", 0.0)
-                box = detection.get("box", {})
-                position = f"x={box.get('x', 0)}, y={box.get('y', 0)}, w={box.get('width', 0)}, h={box.get('height', 0)}"
-                
-                md_lines.append(f"| {class_name} | {confidence:.2f} | {position} |")
-            
-            md_lines.append("")
+                    image_src = os.path.relpath(image_path, os.path.dirname(output_path))
+        
+        markdown, sections = self.templates.render_markdown(
+            content.get("doc_id", "OCR-Ergebnis"),
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            image_src=image_src,
+            text=content.get("text"),
+            metadata=content["metadata"] if "metadata" in content and options.get("include_metadata", True) else None,
+            detections=(content["detections"] if "detections" in content and options.get("include_detections", True)
+                        else None)
+        )
         
         # Speichere Markdown-Datei
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(md_lines))
+            f.write(markdown)
         
         return {
             "path": output_path,
             "format": "markdown",
             "size": os.path.getsize(output_path),
-            "sections": md_lines.count("## ")
+            "sections": sections
         }
     
+    def _image_data_uri(self, source: Union[str, bytes], mime_type: str = None) -> str:
+        """Erstellt eine data-URI aus einer Bilddatei oder kodierten Bilddaten."""
+        if isinstance(source, str):
+            if mime_type is None:
+                mime_type = "image/png" if source.lower().endswith(".png") else "image/jpeg"
+            with open(source, "rb") as f:
+                source = f.read()
+        return f"data:{mime_type or 'image/jpeg'};base64,{base64.b64encode(source).decode('ascii')}"
+    
     def _generate_html_output(self, content: Dict[str, Any], output_path: str,
                             options: Dict[str, Any]) -> Dict[str, Any]:
         """Generiert HTML-Ausgabe mit formatierten Ergebnissen und eingebetteten Bildern.
@@ -762,34 +2596,7 @@ class MultiOutputProcessor:
         Returns:
             Ergebnisinformationen
         """
-        # Initialisiere HTML-Dokument
-        html_lines = []
-        html_lines.append("<!DOCTYPE html>")
-        html_lines.append("<html lang='de'>")
-        html_lines.append("<head>")
-        html_lines.append("  <meta charset='UTF-8'>")
-        html_lines.append("  <meta name='viewport' content='width=device-width, initial-scale=1.0'>")
-        html_lines.append(f"  <title>{content.get('doc_id', 'OCR-Ergebnis')}</title>")
-        html_lines.append("  <style>")
-        html_lines.append("    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 20px; }")
-        html_lines.append("    .container { max-width: 1200px; margin: 0 auto; }")
-        html_lines.append("    .header { background-color: #f5f5f5; padding: 10px; border-bottom: 1px solid #ddd; }")
-        html_lines.append("    .result-image { max-width: 100%; margin: 20px 0; }")
-        html_lines.append("    .text-content { white-space: pre-wrap; background-color: #f9f9f9; padding: 15px; border: 1px solid #ddd; }")
-        html_lines.append("    table { border-collapse: collapse; width: 100%; }")
-        html_lines.append("    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }")
-        html_lines.append("    th { background-color: #f2f2f2; }")
-        html_lines.append("  </style>")
-        html_lines.append("</head>")
-        html_lines.append("<body>")
-        html_lines.append("  <div class='container'>")
-        
-        # Header
-        html_lines.append("    <div class='header'>")
-        html_lines.append(f"      <h1>{content.get('doc_id', 'OCR-Ergebnis')}</h1>")
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        html_lines.append(f"      <p>Generiert am: {timestamp}</p>")
-        html_lines.append("    </div>")
+        image = None
         
         # Bild, falls vorhanden
         if "images" in content and options.get("include_images", True):
@@ -801,12 +2608,19 @@ class MultiOutputProcessor:
                 image_path = options["outputs"]["image_annotated"].get("path", "")
                 image_type = "Annotiert"
             
+            image_resolver = None
             if not image_path and "original" in content["images"]:
-                original_image = content["images"]["original"]
-                if isinstance(original_image, str) and os.path.exists(original_image):
-                    image_path = original_image
+                image_resolver = self._get_image_resolver(content, options)
+                if not image_resolver.is_valid:
+                    image_resolver = None
             
-            if image_path:
+            if options.get("inline_images", self.inline_images):
+                # Bild als data-URI einbetten, ohne images/-Verzeichnis
+                if image_resolver is not None:
+                    image = (image_type, self._image_data_uri(image_resolver.encoded(".jpg"), "image/jpeg"))
+                elif isinstance(image_path, str) and os.path.exists(image_path):
+                    image = (image_type, self._image_data_uri(image_path))
+            elif image_path or image_resolver is not None:
                 # Erstelle Verzeichnis für Bilder relativ zur HTML-Datei
                 html_dir = os.path.dirname(output_path)
                 images_dir = os.path.join(html_dir, "images")
@@ -816,58 +2630,29 @@ class MultiOutputProcessor:
                 image_filename = f"{os.path.splitext(os.path.basename(output_path))[0]}_image.jpg"
                 html_image_path = os.path.join(images_dir, image_filename)
                 
-                # Kopiere oder konvertiere das Bild
-                if isinstance(image_path, str) and os.path.exists(image_path):
+                # Kopiere oder konvertiere das Bild; das Original kommt kodiert aus dem Bild-Cache
+                if image_resolver is not None:
+                    with open(html_image_path, "wb") as f:
+                        f.write(image_resolver.encoded(".jpg"))
+                elif isinstance(image_path, str) and os.path.exists(image_path):
                     img = Image.open(image_path)
                     img.save(html_image_path, "JPEG")
-                elif isinstance(content["images"]["original"], np.ndarray):
-                    cv2.imwrite(html_image_path, content["images"]["original"])
                 
                 # Füge Bild zur HTML hinzu
-                rel_path = os.path.relpath(html_image_path, html_dir)
-                html_lines.append(f"    <h2>{image_type}bild</h2>")
-                html_lines.append(f"    <img src='{rel_path}' alt='{image_type}bild' class='result-image'>")
-        
-        # Erkannter Text
-        if "text" in content and content["text"]:
-            html_lines.append("    <h2>Erkannter Text</h2>")
-            html_lines.append(f"    <div class='text-content'>{content['text']}</div>")
-        
-        # Erkannte Objekte
-        if "detections" in content and options.get("include_detections", True) and content["detections"]:
-            html_lines.append("    <h2>Erkannte Objekte</h2>")
-            html_lines.append("    <table>")
-            html_lines.append("      <tr><th>Klasse</th><th>Konfidenz</th><th>Position</th></tr>")
-            
-            for detection in content["detections"]:
-                class_name = detection.get("class_name", "unbekannt")
-                confidence = detection.get("confidence", 0.0)
-                box = detection.get("box", {})
-                position = f"x={box.get('x', 0)}, y={box.get('y', 0)}, w={box.get('width', 0)}, h={box.get('height', 0)}"
-                
-                html_lines.append(f"      <tr><td>{class_name}</td><td>{confidence:.2f}</td><td>{position}</td></tr>")
-            
-            html_lines.append("    </table>")
+                image = (image_type, os.path.relpath(html_image_path, html_dir))
         
-        # Metadaten
-        if "metadata" in content and options.get("include_metadata", True) and content["metadata"]:
-            html_lines.append("    <h2>Metadaten</h2>")
-            html_lines.append("    <table>")
-            html_lines.append("      <tr><th>Attribut</th><th>Wert</th></tr>")
-            
-            for key, value in content["metadata"].items():
-                html_lines.append(f"      <tr><td>{key}</td><td>{value}</td></tr>")
-            
-            html_lines.append("    </table>")
-        
-        # Abschluss des HTML-Dokuments
-        html_lines.append("  </div>")
-        html_lines.append("</body>")
-        html_lines.append("</html>")
+        html_document = self.templates.render_html(
+            content.get("doc_id", "OCR-Ergebnis"),
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            image=image,
+            text=content.get("text"),
+            detections=content.get("detections") if options.get("include_detections", True) else None,
+            metadata=content.get("metadata") if options.get("include_metadata", True) else None
+        )
         
         # Speichere HTML-Datei
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(html_lines))
+            f.write(html_document)
         
         return {
             "path": output_path,
@@ -920,24 +2705,14 @@ class MultiOutputProcessor:
                 if isinstance(original_image, str) and os.path.exists(original_image):
                     image_path = original_image
                 elif isinstance(original_image, np.ndarray):
-                    # Speichere temporäres Bild
-                    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-                        temp_filename = temp_file.name
-                        cv2.imwrite(temp_filename, original_image)
-                        image_path = temp_filename
+                    # Kodiertes Bild aus dem Bild-Cache als dateiähnliches Objekt übergeben
+                    image_path = io.BytesIO(self._get_image_resolver(content, options).encoded(".jpg"))
             
             if image_path:
                 try:
                     doc.add_picture(image_path, width=Inches(6))
                 except Exception as e:
                     self.logger.error(f"Fehler beim Hinzufügen des Bildes zum DOCX: {e}")
-                
-                # Lösche temporäre Datei, falls erstellt
-                if 'temp_filename' in locals() and os.path.exists(temp_filename):
-                    try:
-                        os.unlink(temp_filename)
-                    except:
-                        pass
         
         # Füge erkannten Text hinzu
         if "text" in content and content["text"]:
@@ -1014,28 +2789,37 @@ class MultiOutputProcessor:
         Returns:
             Ergebnisinformationen
         """
+        writer = self._open_pdf_writer(output_path)
+        
+        # Elemente werden einzeln erzeugt und sofort gesetzt
         try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.lib import colors
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage
-            from reportlab.platypus import Table, TableStyle
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-        except ImportError:
-            self.logger.error("ReportLab nicht installiert. PDF-Generierung nicht möglich.")
-            raise ImportError("ReportLab wird für PDF-Generierung benötigt. Installieren Sie 'reportlab'.")
+            writer.add_all(self._combined_elements(content, options))
+        finally:
+            pages = writer.close()
         
-        # Erstelle PDF-Dokument
-        doc = SimpleDocTemplate(output_path, pagesize=letter)
-        styles = getSampleStyleSheet()
+        return {
+            "path": output_path,
+            "format": "combined",
+            "size": os.path.getsize(output_path),
+            "pages": pages,
+            "content_types": list(content.keys())
+        }
+    
+    def _combined_elements(self, content: Dict[str, Any], options: Dict[str, Any]) -> Iterable[Any]:
+        """Erzeugt die Elemente des kombinierten Dokuments nacheinander.
         
-        # Benutzerdefinierte Stile
-        styles.add(ParagraphStyle(
-            name='OCRText',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=14,
-        ))
+        Args:
+            content: Verarbeiteter Inhalt
+            options: Verarbeitungsoptionen
+            
+        Returns:
+            Generator von Flowables
+        """
+        from reportlab.platypus import Paragraph, Spacer, Image as RLImage
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.units import inch
+        
+        styles = self._pdf_styles()
         
         styles.add(ParagraphStyle(
             name='Caption',
@@ -1046,22 +2830,18 @@ class MultiOutputProcessor:
             spaceAfter=6,
         ))
         
-        # Elemente für das PDF
-        elements = []
-        
         # Titel und Metadaten
         title = content.get("doc_id", "OCR-Ergebnis")
-        elements.append(Paragraph(f"<b>{title}</b>", styles["Title"]))
-        elements.append(Spacer(1, 0.25*inch))
+        yield Paragraph(f"<b>{title}</b>", styles["Title"])
+        yield Spacer(1, 0.25*inch)
         
         # Zeitstempel
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        elements.append(Paragraph(f"Generiert am: {timestamp}", styles["Normal"]))
-        elements.append(Spacer(1, 0.25*inch))
+        yield Paragraph(f"Generiert am: {timestamp}", styles["Normal"])
+        yield Spacer(1, 0.25*inch)
         
         # Inhaltsübersicht (als Tabelle)
         overview_data = []
-        overview_data.append(["Abschnitt", "Details"])
         
         # Füge Einträge basierend auf vorhandenen Inhalten hinzu
         if "text" in content and content["text"]:
@@ -1076,22 +2856,12 @@ class MultiOutputProcessor:
         if "metadata" in content:
             overview_data.append(["Metadaten", f"{len(content['metadata'])} Attribute"])
         
-        if overview_data:
-            table = Table(overview_data, colWidths=[1.5*inch, 4*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
-            elements.append(table)
-            elements.append(Spacer(1, 0.25*inch))
+        yield from self._pdf_table_chunks(["Abschnitt", "Details"], overview_data, [1.5*inch, 4*inch])
+        yield Spacer(1, 0.25*inch)
         
         # Füge Bild hinzu, wenn vorhanden
         if "images" in content and options.get("include_images", True):
-            elements.append(Paragraph("<b>Bild</b>", styles["Heading2"]))
+            yield Paragraph("<b>Bild</b>", styles["Heading2"])
             
             # Wähle annotiertes Bild oder Originalbild
             image_path = None
@@ -1106,140 +2876,86 @@ class MultiOutputProcessor:
                 if isinstance(original_image, str) and os.path.exists(original_image):
                     image_path = original_image
                 elif isinstance(original_image, np.ndarray):
-                    # Speichere temporäres Bild
-                    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as temp_file:
-                        temp_filename = temp_file.name
-                        cv2.imwrite(temp_filename, original_image)
-                        image_path = temp_filename
+                    # Kodiertes Bild aus dem Bild-Cache als dateiähnliches Objekt übergeben
+                    image_path = io.BytesIO(self._get_image_resolver(content, options).encoded(".jpg"))
             
             if image_path:
                 try:
                     img = RLImage(image_path, width=6*inch, height=4*inch, kind='proportional')
-                    elements.append(img)
-                    elements.append(Paragraph(f"{image_type}bild", styles["Caption"]))
-                    elements.append(Spacer(1, 0.2*inch))
                 except Exception as e:
                     self.logger.error(f"Fehler beim Hinzufügen des Bildes zum PDF: {e}")
-                
-                # Lösche temporäre Datei, falls erstellt
-                if 'temp_filename' in locals() and os.path.exists(temp_filename):
-                    try:
-                        os.unlink(temp_filename)
-                    except:
-                        pass
+                else:
+                    yield img
+                    yield Paragraph(f"{image_type}bild", styles["Caption"])
+                    yield Spacer(1, 0.2*inch)
         
         # Füge Thumbnail hinzu, falls vorhanden
         if "outputs" in options and "thumbnail" in options["outputs"]:
             thumbnail_path = options["outputs"]["thumbnail"].get("path", "")
             if thumbnail_path and os.path.exists(thumbnail_path):
-                elements.append(Paragraph("<b>Thumbnail</b>", styles["Heading3"]))
-                img = RLImage(thumbnail_path, width=2*inch, height=2*inch, kind='proportional')
-                elements.append(img)
-                elements.append(Spacer(1, 0.2*inch))
+                yield Paragraph("<b>Thumbnail</b>", styles["Heading3"])
+                yield RLImage(thumbnail_path, width=2*inch, height=2*inch, kind='proportional')
+                yield Spacer(1, 0.2*inch)
         
         # Füge erkannten Text hinzu
         if "text" in content and content["text"]:
-            elements.append(Paragraph("<b>Erkannter Text</b>", styles["Heading2"]))
-            elements.append(Spacer(1, 0.1*inch))
-            
-            text = content["text"]
-            # Teile Text in Absätze
-            paragraphs = text.split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    elements.append(Paragraph(para.replace('\n', '<br/>'), styles["OCRText"]))
-                    elements.append(Spacer(1, 0.1*inch))
+            yield Paragraph("<b>Erkannter Text</b>", styles["Heading2"])
+            yield Spacer(1, 0.1*inch)
+            yield from self._pdf_paragraphs(content["text"], styles["OCRText"])
         
         # Textblöcke
         if "text_blocks" in content and content["text_blocks"] and options.get("include_text_blocks", True):
-            elements.append(Paragraph("<b>Textblöcke</b>", styles["Heading2"]))
-            elements.append(Spacer(1, 0.1*inch))
+            yield Paragraph("<b>Textblöcke</b>", styles["Heading2"])
+            yield Spacer(1, 0.1*inch)
             
-            # Erstelle Tabelle für Textblöcke
-            block_data = [["ID", "Text", "Konfidenz", "Position"]]
+            def block_rows():
+                for i, block in enumerate(content["text_blocks"]):
+                    text = block.get("text", "")
+                    # Begrenze Text auf 50 Zeichen für Tabelle
+                    if len(text) > 50:
+                        text = text[:47] + "..."
+                    
+                    confidence = block.get("confidence", 0.0)
+                    bbox = block.get("bbox", [0, 0, 0, 0])
+                    position = f"x={bbox[0]}, y={bbox[1]}, w={bbox[2]}, h={bbox[3]}"
+                    
+                    yield [i+1, text, f"{confidence:.2f}", position]
             
-            for i, block in enumerate(content["text_blocks"]):
-                text = block.get("text", "")
-                # Begrenze Text auf 50 Zeichen für Tabelle
-                if len(text) > 50:
-                    text = text[:47] + "..."
-                
-                confidence = block.get("confidence", 0.0)
-                bbox = block.get("bbox", [0, 0, 0, 0])
-                position = f"x={bbox[0]}, y={bbox[1]}, w={bbox[2]}, h={bbox[3]}"
-                
-                block_data.append([i+1, text, f"{confidence:.2f}", position])
-            
-            if len(block_data) > 1:
-                table = Table(block_data, colWidths=[0.5*inch, 3*inch, 0.8*inch, 1.2*inch])
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
-                elements.append(table)
-                elements.append(Spacer(1, 0.2*inch))
+            yield from self._pdf_table_chunks(["ID", "Text", "Konfidenz", "Position"], block_rows(),
+                                              [0.5*inch, 3*inch, 0.8*inch, 1.2*inch],
+                                              [('VALIGN', (0, 0), (-1, -1), 'TOP')])
+            yield Spacer(1, 0.2*inch)
         
         # Erkannte Objekte
         if "detections" in content and content["detections"] and options.get("include_detections", True):
-            elements.append(Paragraph("<b>Erkannte Objekte</b>", styles["Heading2"]))
-            elements.append(Spacer(1, 0.1*inch))
+            yield Paragraph("<b>Erkannte Objekte</b>", styles["Heading2"])
+            yield Spacer(1, 0.1*inch)
             
-            # Erstelle Tabelle für erkannte Objekte
-            detection_data = [["ID", "Klasse", "Konfidenz", "Position"]]
+            def detection_rows():
+                for i, detection in enumerate(content["detections"]):
+                    class_name = detection.get("class_name", "unbekannt")
+                    confidence = detection.get("confidence", 0.0)
+                    box = detection.get("box", {})
+                    position = f"x={box.get('x', 0)}, y={box.get('y', 0)}, w={box.get('width', 0)}, h={box.get('height', 0)}"
+                    
+                    yield [i+1, class_name, f"{confidence:.2f}", position]
             
-            for i, detection in enumerate(content["detections"]):
-                class_name = detection.get("class_name", "unbekannt")
-                confidence = detection.get("confidence", 0.0)
-                box = detection.get("box", {})
-                position = f"x={box.get('x', 0)}, y={box.get('y', 0)}, w={box.get('width', 0)}, h={box.get('height', 0)}"
-                
-                detection_data.append([i+1, class_name, f"{confidence:.2f}", position])
-            
-            if len(detection_data) > 1:
-                table = Table(detection_data, colWidths=[0.5*inch, 1.5*inch, 0.8*inch, 2.7*inch])
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
-                elements.append(table)
-                elements.append(Spacer(1, 0.2*inch))
+            yield from self._pdf_table_chunks(["ID", "Klasse", "Konfidenz", "Position"], detection_rows(),
+                                              [0.5*inch, 1.5*inch, 0.8*inch, 2.7*inch])
+            yield Spacer(1, 0.2*inch)
         
         # Metadaten
         if "metadata" in content and content["metadata"] and options.get("include_metadata", True):
-            elements.append(Paragraph("<b>Metadaten</b>", styles["Heading2"]))
-            elements.append(Spacer(1, 0.1*inch))
+            yield Paragraph("<b>Metadaten</b>", styles["Heading2"])
+            yield Spacer(1, 0.1*inch)
             
-            # Erstelle Tabelle für Metadaten
-            metadata_data = [["Attribut", "Wert"]]
-            
-            for key, value in content["metadata"].items():
-                metadata_data.append([key, str(value)])
-            
-            if len(metadata_data) > 1:
-                table = Table(metadata_data, colWidths=[2*inch, 4*inch])
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
-                elements.append(table)
-                elements.append(Spacer(1, 0.2*inch))
+            metadata_rows = ([key, str(value)] for key, value in content["metadata"].items())
+            yield from self._pdf_table_chunks(["Attribut", "Wert"], metadata_rows, [2*inch, 4*inch])
+            yield Spacer(1, 0.2*inch)
         
         # Füge Verarbeitungsinformationen hinzu
-        elements.append(Paragraph("<b>Verarbeitungsinformationen</b>", styles["Heading2"]))
-        processing_data = [["Parameter", "Wert"]]
+        yield Paragraph("<b>Verarbeitungsinformationen</b>", styles["Heading2"])
+        processing_data = []
         
         # Füge verfügbare Verarbeitungsinformationen hinzu
         if "processing_info" in content:
@@ -1249,24 +2965,4 @@ class MultiOutputProcessor:
         processing_data.append(["Erstellungszeitpunkt", timestamp])
         processing_data.append(["Ausgabeformate", ", ".join(options.get("formats", self.default_formats))])
         
-        if len(processing_data) > 1:
-            table = Table(processing_data, colWidths=[2*inch, 4*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
-            elements.append(table)
-        
-        # Erstelle das PDF
-        doc.build(elements)
-        
-        return {
-            "path": output_path,
-            "format": "combined",
-            "size": os.path.getsize(output_path),
-            "content_types": list(content.keys())
-        }
\ No newline at end of file
+        yield from self._pdf_table_chunks(["Parameter", "Wert"], processing_data, [2*inch, 4*inch])
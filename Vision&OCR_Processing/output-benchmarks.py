@@ -0,0 +1,943 @@
+# output/benchmarks.py
+"""Benchmarks für den Multi-Output-Prozessor.
+
+Alle Ausgaben landen in einem temporären Verzeichnis, das nach dem Lauf
+gelöscht wird. Die Ergebnisse werden tabellarisch auf der Konsole
+ausgegeben. Beispiele:
+
+    python output-benchmarks.py formats
+    python output-benchmarks.py --width 1240 --height 1754 formats --modes sequential thread
+    python output-benchmarks.py image-embedding --documents 20
+    python output-benchmarks.py api --documents 200 --latency-ms 20 --failure-rate 0.1
+    python output-benchmarks.py outbox --documents 2000 --backlog 100000
+    python output-benchmarks.py json-output --pages 4
+    python output-benchmarks.py columnar --rows 100000
+    python output-benchmarks.py --width 1240 --height 1754 batch --documents 200
+    python output-benchmarks.py long-pdf --paragraphs 4000 --rows 5000
+    python output-benchmarks.py templates --rows 1000
+"""
+import argparse
+import base64
+import csv
+import importlib.util
+import io
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+BENCHMARK_FORMATS = ["text", "json", "pdf", "image_annotated", "thumbnail", "csv",
+                     "markdown", "html", "docx", "combined"]
+
+
+def load_output_module():
+    """Lädt den Multi-Output-Prozessor.
+
+    Im Paketlayout wird `output.multi_output_processor` importiert; liegt das
+    Skript neben `multi-output-processor.py`, wird die Datei direkt geladen.
+
+    Returns:
+        Modulobjekt mit der Klasse MultiOutputProcessor
+    """
+    try:
+        from output import multi_output_processor
+        return multi_output_processor
+    except ImportError:
+        pass
+
+    module_name = "multi_output_processor"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "multi-output-processor.py")
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def synthetic_content(width: int = 2480, height: int = 3508, block_count: int = 40,
+                      detection_count: int = 10, seed: int = 0) -> Dict[str, Any]:
+    """Erzeugt reproduzierbaren OCR-Inhalt mit einem Scan in A4-Auflösung.
+
+    Args:
+        width: Bildbreite
+        height: Bildhöhe
+        block_count: Anzahl der Textblöcke
+        detection_count: Anzahl der Objekterkennungen
+        seed: Startwert des Zufallsgenerators
+
+    Returns:
+        Inhalts-Dict im Format von MultiOutputProcessor.process()
+    """
+    rng = np.random.default_rng(seed)
+    image = np.full((height, width, 3), 245, dtype=np.uint8)
+    image += rng.integers(0, 10, size=(height, width, 1), dtype=np.uint8)
+
+    text_blocks = []
+    for index in range(block_count):
+        x, y = int(rng.integers(0, width - 400)), int(rng.integers(0, height - 60))
+        text_blocks.append({"text": f"Textblock {index} mit Beispielinhalt", "confidence": float(rng.random()),
+                            "bbox": [x, y, 400, 60]})
+
+    detections = []
+    for index in range(detection_count):
+        x, y = int(rng.integers(0, width - 200)), int(rng.integers(0, height - 200))
+        detections.append({"class_id": index % 3, "class_name": f"klasse_{index % 3}", "confidence": float(rng.random()),
+                           "box": {"x": x, "y": y, "width": 200, "height": 200}})
+
+    return {
+        "doc_id": "benchmark",
+        "text": "\n\n".join(block["text"] for block in text_blocks),
+        "text_blocks": text_blocks,
+        "detections": detections,
+        "metadata": {"source": "synthetic", "width": width, "height": height},
+        "images": {"original": image}
+    }
+
+
+class StubApiServer:
+    """Lokaler HTTP-Stub für API-Endpunkte mit einstellbarer Latenz und Fehlerrate.
+
+    Antwortet auf POST mit JSON und zählt empfangene Anfragen und Dokumente
+    (Batch-Anfragen im Format {"documents": [...]} zählen je Dokument).
+    """
+
+    def __init__(self, latency_ms: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        """Initialisiert den Stub, ohne ihn zu starten.
+
+        Args:
+            latency_ms: Künstliche Antwortverzögerung in Millisekunden
+            failure_rate: Anteil der Anfragen, die mit HTTP 503 beantwortet werden
+            seed: Startwert für die Fehlerauswahl
+        """
+        self.latency = latency_ms / 1000.0
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.documents = 0
+        self.failures = 0
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/ocr"
+
+    def start(self) -> "StubApiServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Kopfzeilen und Körper in einem Paket senden; sonst verzögern
+            # Nagle und Delayed ACK jede Antwort auf Keep-Alive-Verbindungen
+            disable_nagle_algorithm = True
+            wbufsize = -1
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                time.sleep(stub.latency)
+                with stub._lock:
+                    stub.requests += 1
+                    failed = stub._rng.random() < stub.failure_rate
+                    if failed:
+                        stub.failures += 1
+                    else:
+                        stub.documents += len(body["documents"]) if "documents" in body else 1
+
+                response = json.dumps({"status": "error" if failed else "ok"}).encode("utf-8")
+                self.send_response(503 if failed else 200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _print_table(title: str, header: List[str], rows: List[List[Any]]):
+    """Gibt eine einfache Ergebnistabelle aus."""
+    print(f"\n{title}")
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows)]
+    print("  ".join(str(cell).rjust(width) for cell, width in zip(header, widths)))
+    for row in rows:
+        print("  ".join(str(cell).rjust(width) for cell, width in zip(row, widths)))
+
+
+def benchmark_format_execution(content: Dict[str, Any], formats: List[str] = None,
+                               modes=("sequential", "thread", "process")) -> List[Dict[str, Any]]:
+    """Vergleicht sequentielle und parallele Formatgenerierung in process().
+
+    Args:
+        content: Zu verarbeitender Inhalt
+        formats: Angeforderte Formate (None = alle dateibasierten Formate)
+        modes: Zu messende Ausführungsmodi
+
+    Returns:
+        Liste mit Gesamtzeit und Formatlaufzeiten je Modus
+    """
+    output = load_output_module()
+    formats = formats or BENCHMARK_FORMATS
+    results = []
+
+    for mode in modes:
+        output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+        processor = output.MultiOutputProcessor({"output_dir": output_dir, "output_execution": mode})
+        try:
+            # Aufwärmen: Imports von ReportLab/python-docx und Pool-Start nicht mitmessen
+            processor.process(content, formats)
+            result = processor.process(content, formats)
+        finally:
+            processor.shutdown()
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        base_info = result["base_info"]
+        results.append({"mode": mode, "total_time": base_info["total_time"], "timings": base_info["timings"],
+                        "formats_processed": len(base_info["formats_processed"])})
+
+    baseline = results[0]["total_time"]
+    _print_table(
+        f"Formatgenerierung ({len(formats)} Formate, {os.cpu_count()} CPU-Kerne)",
+        ["Modus", "Formate ok", "Gesamt", "Summe Formate", "Speedup"],
+        [[r["mode"], r["formats_processed"], f"{r['total_time']:.3f}s", f"{sum(r['timings'].values()):.3f}s",
+          f"{baseline / r['total_time']:.2f}x"] for r in results]
+    )
+    return results
+
+
+def _embed_image(kind: str, image: np.ndarray, output_path: str, use_tempfile: bool):
+    """Erstellt ein minimales PDF- bzw. DOCX-Dokument mit eingebettetem Bild.
+
+    Mit `use_tempfile` wird der frühere Weg nachgebildet: Bild per
+    cv2.imwrite in eine temporäre Datei schreiben, den Pfad übergeben und die
+    Datei nach dem Erstellen löschen. Sonst wird mit cv2.imencode in einen
+    BytesIO-Puffer kodiert.
+    """
+    import cv2
+
+    temp_filename = None
+    if use_tempfile:
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
+            temp_filename = temp_file.name
+        cv2.imwrite(temp_filename, image)
+        source = temp_filename
+    else:
+        _, buffer = cv2.imencode(".jpg", image)
+        source = io.BytesIO(buffer.tobytes())
+
+    try:
+        if kind == "pdf":
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib.units import inch
+            from reportlab.platypus import SimpleDocTemplate, Image as RLImage
+            SimpleDocTemplate(output_path, pagesize=letter).build(
+                [RLImage(source, width=6*inch, height=4*inch)])
+        else:
+            from docx import Document
+            from docx.shared import Inches
+            doc = Document()
+            doc.add_picture(source, width=Inches(6))
+            doc.save(output_path)
+    finally:
+        if temp_filename is not None:
+            os.unlink(temp_filename)
+
+
+def benchmark_image_embedding(content: Dict[str, Any], documents: int = 20) -> List[Dict[str, Any]]:
+    """Vergleicht Bildübergabe über temporäre Dateien mit In-Memory-Puffern.
+
+    Gemessen werden Dokumente pro Sekunde für PDF und DOCX jeweils für den
+    früheren Temp-Datei-Weg und die In-Memory-Kodierung, dazu der Durchsatz
+    von process() für pdf, docx und combined.
+
+    Args:
+        content: Inhalt mit Originalbild als NumPy-Array
+        documents: Anzahl der Dokumente pro Variante
+
+    Returns:
+        Liste mit Dokumenten pro Sekunde je Variante
+    """
+    output = load_output_module()
+    image = content["images"]["original"]
+    output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+    results = []
+
+    try:
+        for kind in ("pdf", "docx"):
+            for use_tempfile, variant in ((True, "Temp-Datei"), (False, "BytesIO")):
+                output_path = os.path.join(output_dir, f"embed.{kind}")
+                _embed_image(kind, image, output_path, use_tempfile)
+                start = time.perf_counter()
+                for _ in range(documents):
+                    _embed_image(kind, image, output_path, use_tempfile)
+                results.append({"variant": f"{kind} ({variant})",
+                                "docs_per_sec": documents / (time.perf_counter() - start)})
+
+        processor = output.MultiOutputProcessor({"output_dir": output_dir})
+        formats = ["pdf", "docx", "combined"]
+        processor.process(content, formats)
+        start = time.perf_counter()
+        for _ in range(documents):
+            processor.process(content, formats)
+        results.append({"variant": "process(pdf, docx, combined)",
+                        "docs_per_sec": documents / (time.perf_counter() - start)})
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    _print_table(
+        f"Bildeinbettung ({image.shape[1]}x{image.shape[0]}, {documents} Dokumente)",
+        ["Variante", "Dokumente/s"],
+        [[r["variant"], f"{r['docs_per_sec']:.2f}"] for r in results]
+    )
+    return results
+
+
+def benchmark_api_forwarding(documents: int = 200, latency_ms: float = 20.0,
+                             failure_rate: float = 0.1) -> List[Dict[str, Any]]:
+    """Vergleicht blockierende Einzelaufrufe mit dem ApiForwarder gegen einen lokalen Stub.
+
+    Gemessen wird, wie lange process() den Aufrufer blockiert und wann alle
+    Dokumente zugestellt sind, jeweils ohne und mit Batching.
+
+    Args:
+        documents: Anzahl der weitergeleiteten Dokumente
+        latency_ms: Antwortverzögerung des Stubs
+        failure_rate: Anteil der Stub-Antworten mit HTTP 503
+
+    Returns:
+        Liste mit Zeiten, zugestellten Dokumenten und Forwarder-Kennzahlen je Variante
+    """
+    import requests
+
+    output = load_output_module()
+    content = {"doc_id": "api", "text": "Beispieltext " * 20, "metadata": {"source": "benchmark"}}
+    results = []
+
+    # Früherer Weg: ein neuer requests.post pro Dokument ohne Session und ohne Wiederholung
+    stub = StubApiServer(latency_ms, failure_rate).start()
+    try:
+        start = time.perf_counter()
+        for index in range(documents):
+            try:
+                requests.post(stub.url, json={"document_id": f"doc_{index}", **content}, timeout=30)
+            except requests.RequestException:
+                pass
+        elapsed = time.perf_counter() - start
+        results.append({"variant": "requests.post (seriell)", "blocking": elapsed, "delivered_after": elapsed,
+                        "delivered": stub.documents, "requests": stub.requests, "retries": 0, "failed": None})
+    finally:
+        stub.stop()
+
+    for batch in (False, True):
+        stub = StubApiServer(latency_ms, failure_rate).start()
+        output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+        processor = output.MultiOutputProcessor({
+            "output_dir": output_dir, "enable_api_forwarding": True, "api_concurrency": 4,
+            "api_backoff_base": 0.01, "api_max_retries": 5,
+            "api_endpoints": [{"url": stub.url, "batch": batch, "max_batch_size": 50}]
+        })
+        try:
+            start = time.perf_counter()
+            for index in range(documents):
+                processor.process(dict(content, doc_id=f"doc_{index}"), ["api"])
+            blocking = time.perf_counter() - start
+            processor.api_forwarder.flush()
+            delivered_after = time.perf_counter() - start
+            stats = processor.api_forwarder.get_stats()[stub.url]
+        finally:
+            processor.shutdown()
+            stub.stop()
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        results.append({"variant": f"ApiForwarder ({'Batch' if batch else 'einzeln'})", "blocking": blocking,
+                        "delivered_after": delivered_after, "delivered": stub.documents,
+                        "requests": stub.requests, "retries": stats["retries"], "failed": stats["failed"],
+                        "p95_ms": stats["request_latency"]["p95_ms"]})
+
+    _print_table(
+        f"API-Weiterleitung ({documents} Dokumente, {latency_ms:.0f}ms Latenz, {failure_rate:.0%} HTTP 503)",
+        ["Variante", "Blockiert", "Zugestellt nach", "Zugestellt", "Anfragen", "Wiederholungen", "Fehlgeschlagen"],
+        [[r["variant"], f"{r['blocking']:.2f}s", f"{r['delivered_after']:.2f}s", r["delivered"], r["requests"],
+          r["retries"], "-" if r["failed"] is None else r["failed"]] for r in results]
+    )
+    return results
+
+
+def benchmark_api_outbox(documents: int = 2000, backlog: int = 100000,
+                         outage_seconds: float = 1.0) -> Dict[str, Any]:
+    """Misst die persistente Outbox des ApiForwarder.
+
+    Gemessen werden die Dauer von submit() während eines Endpunktausfalls
+    (Stub antwortet nur mit HTTP 503), die Zustellung nach dem Ausfall
+    einschließlich Reihenfolge sowie der Neustart mit `backlog` offenen
+    Einträgen.
+
+    Args:
+        documents: Anzahl der während des Ausfalls eingereichten Dokumente
+        backlog: Anzahl offener Einträge für den Neustart
+        outage_seconds: Dauer des simulierten Ausfalls
+
+    Returns:
+        Dict mit Zeiten und Zählern
+    """
+    output = load_output_module()
+    output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+    outbox_path = os.path.join(output_dir, "outbox.db")
+    payload = {"text": "Beispieltext " * 20, "metadata": {"source": "benchmark"}}
+    result = {}
+
+    stub = StubApiServer(failure_rate=1.0).start()
+    config = {"api_outbox_path": outbox_path, "api_outbox_retry_interval": 0.1,
+              "api_max_retries": 0, "api_backoff_base": 0.01}
+    try:
+        endpoint = {"url": stub.url, "batch": True, "max_batch_size": 100}
+        forwarder = output.ApiForwarder([endpoint], config)
+
+        # Ausfall: alle Dokumente landen in der Outbox
+        start = time.perf_counter()
+        for index in range(documents):
+            forwarder.submit(dict(payload, document_id=f"doc_{index}"))
+        result["submit_per_doc_ms"] = (time.perf_counter() - start) * 1000.0 / documents
+        time.sleep(outage_seconds)
+        result["pending_during_outage"] = forwarder.outbox.pending_count()
+
+        # Endpunkt wieder verfügbar
+        stub.failure_rate = 0.0
+        start = time.perf_counter()
+        forwarder.flush()
+        result["drain_seconds"] = time.perf_counter() - start
+        result["delivered"] = stub.documents
+        result["outbox_bytes_after_drain"] = os.path.getsize(outbox_path)
+        forwarder.close()
+
+        # Neustart mit großem Rückstand
+        outbox = output.ApiOutbox(outbox_path)
+        rows = [(stub.url, json.dumps(dict(payload, document_id=f"backlog_{index}")), time.time())
+                for index in range(backlog)]
+        with outbox._lock:
+            outbox._conn.execute("BEGIN")
+            outbox._conn.executemany("INSERT INTO outbox (endpoint, payload, created) VALUES (?, ?, ?)", rows)
+            outbox._conn.execute("COMMIT")
+        outbox.close()
+        result["outbox_bytes_with_backlog"] = os.path.getsize(outbox_path)
+
+        # Der Prozessor startet den Forwarder selbst, sobald eine Outbox konfiguriert ist
+        stub.failure_rate = 1.0
+        start = time.perf_counter()
+        processor = output.MultiOutputProcessor(dict(config, output_dir=output_dir, enable_api_forwarding=True,
+                                                     api_endpoints=[endpoint]))
+        result["startup_ms"] = (time.perf_counter() - start) * 1000.0
+        result["recovered"] = processor.api_forwarder.get_stats()[stub.url]["queue_depth"]
+        processor.shutdown()
+    finally:
+        stub.stop()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    _print_table(
+        f"API-Outbox ({documents} Dokumente während {outage_seconds:.1f}s Ausfall, {backlog} offene Einträge beim Neustart)",
+        ["submit() pro Dokument", "Offen im Ausfall", "Zustellung danach", "Zugestellt", "Neustart", "Wiederhergestellt"],
+        [[f"{result['submit_per_doc_ms']:.3f}ms", result["pending_during_outage"], f"{result['drain_seconds']:.2f}s",
+          result["delivered"], f"{result['startup_ms']:.1f}ms", result["recovered"]]]
+    )
+    return result
+
+
+def _legacy_json_output(content: Dict[str, Any], output_path: str):
+    """Bildet den früheren JSON-Weg nach: vollständiges Dict mit Base64-Strings und json.dump(indent=2)."""
+    import cv2
+
+    output_data = {"document_id": content.get("doc_id", ""), "text": content.get("text", ""),
+                   "text_blocks": content["text_blocks"], "metadata": content["metadata"],
+                   "detections": content["detections"], "images": {}}
+    for image_key, image_data in content["images"].items():
+        _, buffer = cv2.imencode(".png", image_data)
+        output_data["images"][image_key] = base64.b64encode(buffer).decode("utf-8")
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(output_data, f, ensure_ascii=False, indent=2)
+
+
+def _json_output_worker(variant: str, width: int, height: int, pages: int, documents: int, result_queue):
+    """Misst eine JSON-Variante in einem frischen Prozess, damit die Spitzen-RSS unverfälscht ist."""
+    import resource
+
+    output = load_output_module()
+    content = synthetic_content(width=width, height=height)
+    page = content["images"]["original"]
+    content["images"] = {f"page_{index + 1}": page.copy() for index in range(pages)}
+
+    output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+    output_path = os.path.join(output_dir, "output.json")
+    processor = output.MultiOutputProcessor({"output_dir": output_dir})
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        start = time.perf_counter()
+        for _ in range(documents):
+            if variant == "json.dump (bisher)":
+                _legacy_json_output(content, output_path)
+            else:
+                compact, backend = variant.split("/")
+                processor._generate_json_output(content, output_path, {
+                    "include_images": True, "json_compact": compact == "kompakt", "json_backend": backend})
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(output_path)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result_queue.put({"variant": variant, "peak_mb": (peak_kb - baseline_kb) / 1024.0,
+                      "docs_per_sec": documents / elapsed, "mb_per_sec": size * documents / elapsed / 1e6,
+                      "size_mb": size / 1e6})
+
+
+def benchmark_json_output(width: int = 2480, height: int = 3508, pages: int = 4,
+                          documents: int = 3) -> List[Dict[str, Any]]:
+    """Vergleicht den früheren JSON-Export mit dem StreamingJsonWriter.
+
+    Jede Variante läuft in einem eigenen Prozess (spawn). Gemessen wird der
+    Anstieg der Spitzen-RSS gegenüber dem Zustand nach dem Erzeugen des
+    Inhalts sowie der Durchsatz bei eingebetteten Seitenbildern.
+
+    Args:
+        width: Bildbreite je Seite
+        height: Bildhöhe je Seite
+        pages: Anzahl der eingebetteten Seitenbilder
+        documents: Anzahl der geschriebenen Dokumente je Variante
+
+    Returns:
+        Liste mit Spitzen-RSS, Dokumenten/s und MB/s je Variante
+    """
+    variants = ["json.dump (bisher)", "eingerückt/json", "kompakt/json", "eingerückt/orjson", "kompakt/orjson"]
+    context = multiprocessing.get_context("spawn")
+    result_queue = context.Queue()
+    results = []
+
+    for variant in variants:
+        worker = context.Process(target=_json_output_worker,
+                                 args=(variant, width, height, pages, documents, result_queue))
+        worker.start()
+        results.append(result_queue.get())
+        worker.join()
+
+    _print_table(
+        f"JSON-Ausgabe ({pages} Seiten {width}x{height} eingebettet, {documents} Dokumente)",
+        ["Variante", "Spitzen-RSS", "Dokumente/s", "MB/s", "Dateigröße"],
+        [[r["variant"], f"+{r['peak_mb']:.1f} MB", f"{r['docs_per_sec']:.2f}", f"{r['mb_per_sec']:.1f}",
+          f"{r['size_mb']:.1f} MB"] for r in results]
+    )
+    return results
+
+
+def _read_csv_columns(path: str) -> Dict[str, Any]:
+    """Liest eine CSV-Ausgabe zurück in Spalten (Text, Konfidenz, Box)."""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        rows = list(reader)
+    return {"names": [row[1] for row in rows],
+            "confidence": np.array([float(row[2]) for row in rows], dtype=np.float32),
+            "box": np.array([[int(value) for value in row[3:7]] for row in rows], dtype=np.int32)}
+
+
+def benchmark_columnar_export(rows: int = 100000, repeats: int = 3) -> List[Dict[str, Any]]:
+    """Vergleicht CSV, JSON und das Spaltenformat beim Schreiben und Zurücklesen.
+
+    Geschrieben werden jeweils `rows` Objekterkennungen und Textblöcke (CSV:
+    zwei Dateien). Beim Lesen werden je Tabelle Konfidenzen und Boxen als
+    NumPy-Arrays sowie alle Texte als Python-Strings erzeugt.
+
+    Args:
+        rows: Anzahl der Zeilen je Tabelle
+        repeats: Wiederholungen je Messung (es zählt die schnellste)
+
+    Returns:
+        Liste mit Schreib-/Lesezeit und Dateigröße je Format
+    """
+    output = load_output_module()
+    content = synthetic_content(width=640, height=480, block_count=rows, detection_count=rows)
+    output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+    processor = output.MultiOutputProcessor({"output_dir": output_dir})
+
+    def write_csv():
+        for export_type in ("detections", "text_blocks"):
+            processor._generate_csv_output(content, os.path.join(output_dir, f"{export_type}.csv"),
+                                           {"csv_export_type": export_type})
+        return [os.path.join(output_dir, f"{export_type}.csv") for export_type in ("detections", "text_blocks")]
+
+    def read_csv(paths):
+        return [_read_csv_columns(path) for path in paths]
+
+    def write_json():
+        path = os.path.join(output_dir, "output.json")
+        processor._generate_json_output(content, path, {})
+        return [path]
+
+    def read_json(paths):
+        with open(paths[0], encoding="utf-8") as f:
+            data = json.load(f)
+        detections, blocks = data["detections"], data["text_blocks"]
+        return [{"names": [d["class_name"] for d in detections],
+                 "confidence": np.array([d["confidence"] for d in detections], dtype=np.float32),
+                 "box": np.array([[d["box"]["x"], d["box"]["y"], d["box"]["width"], d["box"]["height"]]
+                                  for d in detections], dtype=np.int32)},
+                {"names": [b["text"] for b in blocks],
+                 "confidence": np.array([b["confidence"] for b in blocks], dtype=np.float32),
+                 "box": np.array([b["bbox"] for b in blocks], dtype=np.int32)}]
+
+    def write_columnar():
+        path = os.path.join(output_dir, "output.cols")
+        processor._generate_columnar_output(content, path, {})
+        return [path]
+
+    def read_columnar(paths):
+        data = output.load_columnar_output(paths[0])
+        detections, blocks = data["detections"], data["text_blocks"]
+        return [{"names": detections["class_name"].tolist(), "confidence": np.asarray(detections["confidence"]),
+                 "box": np.asarray(detections["box"])},
+                {"names": blocks["text"].tolist(), "confidence": np.asarray(blocks["confidence"]),
+                 "box": np.asarray(blocks["bbox"])}]
+
+    def read_columnar_numeric(paths):
+        # Typischer Analysezugriff: nur numerische Spalten, Texte bleiben ungelesen
+        data = output.load_columnar_output(paths[0])
+        return float(data["detections"]["confidence"].mean()), int(data["text_blocks"]["bbox"][:, 2].sum())
+
+    variants = [("CSV", write_csv, read_csv), ("JSON", write_json, read_json),
+                ("Spalten", write_columnar, read_columnar),
+                ("Spalten (nur Zahlen)", write_columnar, read_columnar_numeric)]
+    results = []
+    try:
+        for name, write, read in variants:
+            write_times, read_times = [], []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                paths = write()
+                write_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                read(paths)
+                read_times.append(time.perf_counter() - start)
+            results.append({"format": name, "write": min(write_times), "read": min(read_times),
+                            "size_mb": sum(os.path.getsize(path) for path in paths) / 1e6})
+    finally:
+        processor.shutdown()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    _print_table(
+        f"Strukturierter Export ({rows} Erkennungen + {rows} Textblöcke)",
+        ["Format", "Schreiben", "Lesen", "Dateigröße"],
+        [[r["format"], f"{r['write'] * 1000:.1f}ms", f"{r['read'] * 1000:.1f}ms", f"{r['size_mb']:.2f} MB"]
+         for r in results]
+    )
+    return results
+
+
+def benchmark_batch_processing(width: int = 1240, height: int = 1754, documents: int = 200,
+                               formats: List[str] = None) -> List[Dict[str, Any]]:
+    """Vergleicht process() pro Dokument mit process_batch().
+
+    Args:
+        width: Bildbreite je Dokument
+        height: Bildhöhe je Dokument
+        documents: Anzahl der Dokumente
+        formats: Ausgabeformate (Standard: json, csv, pdf, thumbnail)
+
+    Returns:
+        Liste mit Dokumenten pro Sekunde und Anzahl erzeugter Dateien je Variante
+    """
+    output = load_output_module()
+    formats = formats or ["json", "csv", "pdf", "thumbnail"]
+    template = synthetic_content(width=width, height=height)
+
+    def contents():
+        # Eigenes Bild je Dokument, sonst bettet ReportLab gleiche Bilder im Batch-PDF nur einmal ein
+        for index in range(documents):
+            image = template["images"]["original"].copy()
+            image[:8, :32] = np.unpackbits(np.array([index], dtype=">u4").view(np.uint8))[None, :, None] * 255
+            yield dict(template, doc_id=f"doc_{index:05d}", images={"original": image})
+
+    results = []
+
+    for variant in ("process() pro Dokument", "process_batch()"):
+        output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+        processor = output.MultiOutputProcessor({"output_dir": output_dir})
+        try:
+            start = time.perf_counter()
+            if variant == "process_batch()":
+                processor.process_batch(contents(), formats)
+            else:
+                for content in contents():
+                    processor.process(content, formats)
+            elapsed = time.perf_counter() - start
+            files = len(os.listdir(output_dir))
+        finally:
+            processor.shutdown()
+            shutil.rmtree(output_dir, ignore_errors=True)
+        results.append({"variant": variant, "docs_per_sec": documents / elapsed, "files": files})
+
+    _print_table(
+        f"Batch-Verarbeitung ({documents} Dokumente {width}x{height}, Formate: {', '.join(formats)})",
+        ["Variante", "Dokumente/s", "Dateien"],
+        [[r["variant"], f"{r['docs_per_sec']:.1f}", r["files"]] for r in results]
+    )
+    return results
+
+
+def _long_pdf_worker(variant: str, paragraphs: int, rows: int, result_queue):
+    """Erzeugt ein langes kombiniertes PDF in einem frischen Prozess und misst Spitzen-RSS und Seiten/s."""
+    import resource
+
+    output = load_output_module()
+    content = synthetic_content(width=640, height=480, block_count=rows, detection_count=rows)
+    content["text"] = "\n\n".join(f"Absatz {index}: " + "Erkannter Beispieltext " * 30 for index in range(paragraphs))
+    del content["images"]
+
+    output_dir = tempfile.mkdtemp(prefix="output-benchmark-")
+    output_path = os.path.join(output_dir, "long.pdf")
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        start = time.perf_counter()
+        if variant == "doc.build (bisher)":
+            # Früherer Weg: alle Elemente in einer Liste, Tabellen am Stück, ein doc.build()
+            from reportlab.lib.pagesizes import letter
+            from reportlab.platypus import SimpleDocTemplate
+            processor = output.MultiOutputProcessor({"output_dir": output_dir, "pdf_table_chunk_rows": rows + 1})
+            doc = SimpleDocTemplate(output_path, pagesize=letter)
+            doc.build(list(processor._combined_elements(content, {})))
+            pages = doc.page
+        else:
+            processor = output.MultiOutputProcessor({"output_dir": output_dir})
+            pages = processor._generate_combined_output(content, output_path, {})["pages"]
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result_queue.put({"variant": variant, "pages": pages, "seconds": elapsed,
+                      "pages_per_sec": pages / elapsed, "peak_mb": (peak_kb - baseline_kb) / 1024.0})
+
+
+def benchmark_long_pdf(paragraphs: int = 4000, rows: int = 5000) -> List[Dict[str, Any]]:
+    """Vergleicht doc.build() mit dem StreamingPdfWriter für ein langes kombiniertes PDF.
+
+    Jede Variante läuft in einem eigenen Prozess (spawn); gemessen werden
+    Seiten pro Sekunde und der Anstieg der Spitzen-RSS während der Erzeugung.
+
+    Args:
+        paragraphs: Anzahl der Textabsätze
+        rows: Anzahl der Textblöcke und Objekterkennungen (Tabellenzeilen)
+
+    Returns:
+        Liste mit Seitenzahl, Seiten/s und Spitzen-RSS je Variante
+    """
+    context = multiprocessing.get_context("spawn")
+    result_queue = context.Queue()
+    results = []
+
+    for variant in ("doc.build (bisher)", "StreamingPdfWriter"):
+        worker = context.Process(target=_long_pdf_worker, args=(variant, paragraphs, rows, result_queue))
+        worker.start()
+        results.append(result_queue.get())
+        worker.join()
+
+    _print_table(
+        f"Langes PDF ({paragraphs} Absätze, {rows} Textblöcke und Erkennungen)",
+        ["Variante", "Seiten", "Dauer", "Seiten/s", "Spitzen-RSS"],
+        [[r["variant"], r["pages"], f"{r['seconds']:.1f}s", f"{r['pages_per_sec']:.1f}", f"+{r['peak_mb']:.1f} MB"]
+         for r in results]
+    )
+    return results
+
+
+def _legacy_html_document(content: Dict[str, Any], timestamp: str) -> str:
+    """Bildet den früheren HTML-Aufbau nach: eine Zeile pro list.append mit f-Strings, ohne Maskierung."""
+    html_lines = ["<!DOCTYPE html>", "<html lang='de'>", "<head>", "  <meta charset='UTF-8'>",
+                  "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>"]
+    html_lines.append(f"  <title>{content.get('doc_id', 'OCR-Ergebnis')}</title>")
+    html_lines.append("  <style>")
+    html_lines.append("    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 20px; }")
+    html_lines.append("    .container { max-width: 1200px; margin: 0 auto; }")
+    html_lines.append("    .header { background-color: #f5f5f5; padding: 10px; border-bottom: 1px solid #ddd; }")
+    html_lines.append("    .result-image { max-width: 100%; margin: 20px 0; }")
+    html_lines.append("    .text-content { white-space: pre-wrap; background-color: #f9f9f9; padding: 15px; "
+                      "border: 1px solid #ddd; }")
+    html_lines.append("    table { border-collapse: collapse; width: 100%; }")
+    html_lines.append("    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }")
+    html_lines.append("    th { background-color: #f2f2f2; }")
+    html_lines.append("  </style>")
+    html_lines.append("</head>")
+    html_lines.append("<body>")
+    html_lines.append("  <div class='container'>")
+    html_lines.append("    <div class='header'>")
+    html_lines.append(f"      <h1>{content.get('doc_id', 'OCR-Ergebnis')}</h1>")
+    html_lines.append(f"      <p>Generiert am: {timestamp}</p>")
+    html_lines.append("    </div>")
+    html_lines.append("    <h2>Erkannter Text</h2>")
+    html_lines.append(f"    <div class='text-content'>{content['text']}</div>")
+    html_lines.append("    <h2>Erkannte Objekte</h2>")
+    html_lines.append("    <table>")
+    html_lines.append("      <tr><th>Klasse</th><th>Konfidenz</th><th>Position</th></tr>")
+    for detection in content["detections"]:
+        class_name = detection.get("class_name", "unbekannt")
+        confidence = detection.get("confidence", 0.0)
+        box = detection.get("box", {})
+        position = f"x={box.get('x', 0)}, y={box.get('y', 0)}, w={box.get('width', 0)}, h={box.get('height', 0)}"
+        html_lines.append(f"      <tr><td>{class_name}</td><td>{confidence:.2f}</td><td>{position}</td></tr>")
+    html_lines.append("    </table>")
+    html_lines.append("    <h2>Metadaten</h2>")
+    html_lines.append("    <table>")
+    html_lines.append("      <tr><th>Attribut</th><th>Wert</th></tr>")
+    for key, value in content["metadata"].items():
+        html_lines.append(f"      <tr><td>{key}</td><td>{value}</td></tr>")
+    html_lines.append("    </table>")
+    html_lines.append("  </div>")
+    html_lines.append("</body>")
+    html_lines.append("</html>")
+    return "\n".join(html_lines)
+
+
+def benchmark_templates(rows: int = 1000, documents: int = 500) -> List[Dict[str, Any]]:
+    """Misst den Rendering-Durchsatz der HTML- und Markdown-Vorlagen für große Erkennungstabellen.
+
+    Verglichen wird der frühere Aufbau per list.append mit den vorkompilierten
+    Vorlagen (inklusive HTML-Maskierung), jeweils nur das Rendern ohne Dateizugriff.
+
+    Args:
+        rows: Anzahl der Tabellenzeilen (Objekterkennungen)
+        documents: Anzahl der gerenderten Dokumente je Variante
+
+    Returns:
+        Liste mit Dokumenten/s und Zeilen/s je Variante
+    """
+    output = load_output_module()
+    content = synthetic_content(width=640, height=480, block_count=20, detection_count=rows)
+    templates = output.OutputTemplates()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    variants = {
+        "HTML list.append (bisher)": lambda: _legacy_html_document(content, timestamp),
+        "HTML Vorlage (maskiert)": lambda: templates.render_html(
+            content["doc_id"], timestamp, text=content["text"], detections=content["detections"],
+            metadata=content["metadata"]),
+        "Markdown Vorlage": lambda: templates.render_markdown(
+            content["doc_id"], timestamp, text=content["text"], detections=content["detections"],
+            metadata=content["metadata"]),
+    }
+    results = []
+    for name, render in variants.items():
+        render()
+        start = time.perf_counter()
+        for _ in range(documents):
+            render()
+        elapsed = time.perf_counter() - start
+        results.append({"variant": name, "docs_per_sec": documents / elapsed, "rows_per_sec": rows * documents / elapsed})
+
+    _print_table(
+        f"Vorlagen-Rendering ({rows} Erkennungen je Dokument, {documents} Dokumente)",
+        ["Variante", "Dokumente/s", "Zeilen/s"],
+        [[r["variant"], f"{r['docs_per_sec']:.0f}", f"{r['rows_per_sec']:.0f}"] for r in results]
+    )
+    return results
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Benchmarks für den Multi-Output-Prozessor")
+    parser.add_argument("--width", type=int, default=2480, help="Breite des synthetischen Scans")
+    parser.add_argument("--height", type=int, default=3508, help="Höhe des synthetischen Scans")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    formats_parser = subparsers.add_parser("formats", help="Sequentielle gegen parallele Formatgenerierung")
+    formats_parser.add_argument("--formats", nargs="+", default=BENCHMARK_FORMATS)
+    formats_parser.add_argument("--modes", nargs="+", default=["sequential", "thread", "process"])
+
+    embedding_parser = subparsers.add_parser("image-embedding", help="Temp-Dateien gegen In-Memory-Bildpuffer")
+    embedding_parser.add_argument("--documents", type=int, default=20)
+
+    api_parser = subparsers.add_parser("api", help="Blockierende Einzelaufrufe gegen ApiForwarder")
+    api_parser.add_argument("--documents", type=int, default=200)
+    api_parser.add_argument("--latency-ms", type=float, default=20.0)
+    api_parser.add_argument("--failure-rate", type=float, default=0.1)
+
+    outbox_parser = subparsers.add_parser("outbox", help="Persistente Outbox bei Endpunktausfall und Neustart")
+    outbox_parser.add_argument("--documents", type=int, default=2000)
+    outbox_parser.add_argument("--backlog", type=int, default=100000)
+    outbox_parser.add_argument("--outage-seconds", type=float, default=1.0)
+
+    json_parser = subparsers.add_parser("json-output", help="json.dump gegen StreamingJsonWriter")
+    json_parser.add_argument("--pages", type=int, default=4)
+    json_parser.add_argument("--documents", type=int, default=3)
+
+    columnar_parser = subparsers.add_parser("columnar", help="CSV/JSON gegen binäres Spaltenformat")
+    columnar_parser.add_argument("--rows", type=int, default=100000)
+
+    batch_parser = subparsers.add_parser("batch", help="process() pro Dokument gegen process_batch()")
+    batch_parser.add_argument("--documents", type=int, default=200)
+    batch_parser.add_argument("--formats", nargs="+", default=["json", "csv", "pdf", "thumbnail"])
+
+    long_pdf_parser = subparsers.add_parser("long-pdf", help="doc.build gegen StreamingPdfWriter")
+    long_pdf_parser.add_argument("--paragraphs", type=int, default=4000)
+    long_pdf_parser.add_argument("--rows", type=int, default=5000)
+
+    templates_parser = subparsers.add_parser("templates", help="HTML/Markdown-Rendering mit Vorlagen")
+    templates_parser.add_argument("--rows", type=int, default=1000)
+    templates_parser.add_argument("--documents", type=int, default=500)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    if args.benchmark == "api":
+        benchmark_api_forwarding(documents=args.documents, latency_ms=args.latency_ms,
+                                 failure_rate=args.failure_rate)
+        return
+    if args.benchmark == "outbox":
+        benchmark_api_outbox(documents=args.documents, backlog=args.backlog, outage_seconds=args.outage_seconds)
+        return
+    if args.benchmark == "json-output":
+        benchmark_json_output(width=args.width, height=args.height, pages=args.pages, documents=args.documents)
+        return
+    if args.benchmark == "columnar":
+        benchmark_columnar_export(rows=args.rows)
+        return
+    if args.benchmark == "batch":
+        benchmark_batch_processing(width=args.width, height=args.height, documents=args.documents,
+                                   formats=args.formats)
+        return
+    if args.benchmark == "long-pdf":
+        benchmark_long_pdf(paragraphs=args.paragraphs, rows=args.rows)
+        return
+    if args.benchmark == "templates":
+        benchmark_templates(rows=args.rows, documents=args.documents)
+        return
+
+    content = synthetic_content(width=args.width, height=args.height)
+
+    if args.benchmark == "formats":
+        benchmark_format_execution(content, formats=args.formats, modes=tuple(args.modes))
+    elif args.benchmark == "image-embedding":
+        benchmark_image_embedding(content, documents=args.documents)
+
+
+if __name__ == "__main__":
+    main()